@@ -1,4 +1,5 @@
 from fastapi import APIRouter, Depends, UploadFile, File
+from fastapi.responses import StreamingResponse
 from core.di import get_assistant_service
 from domains.assistant.service import AssistantService
 from domains.assistant.schemas import (
@@ -20,6 +21,7 @@ from domains.assistant.exceptions import (
     AIRefusalException,
 )
 from util.docs import create_error_response
+from util.sse import sse_response
 
 router = APIRouter()
 
@@ -112,6 +114,60 @@ async def get_quick_recipe(
     return await service.get_quick_recipe(request.chat)
 
 
+STREAM_DESCRIPTION = """
+text/event-stream 으로 생성 중인 레시피를 조각 단위로 전달
+- `event: field` : 최상위 필드 완성 (food, food_en, tip) -> `{"key", "value"}`
+- `event: item` : 배열 원소 완성 (use_ingredients, steps) -> `{"key", "index", "value"}`
+- `event: result` : 검증이 끝난 최종 DetailRecipeResponse (이미지 URL 포함)
+- `event: error` : 스트림 도중 발생한 에러 -> `{"status_code", "code", "detail"}`
+"""
+
+
+@router.post(
+    "/detail/stream",
+    status_code=200,
+    summary="선택한 메뉴의 상세 조리법 생성 (SSE 스트리밍)",
+    description=STREAM_DESCRIPTION,
+    response_class=StreamingResponse,
+    responses=create_error_response(InvalidAIRequestException),
+)
+async def stream_recipe_detail(
+    request: DetailRecipeRequest,
+    service: AssistantService = Depends(get_assistant_service),
+):
+    return sse_response(await service.stream_recipe_detail(request))
+
+
+@router.post(
+    "/search/stream",
+    status_code=200,
+    summary="요리 이름으로 레시피 검색 (SSE 스트리밍)",
+    description=STREAM_DESCRIPTION,
+    response_class=StreamingResponse,
+    responses=create_error_response(InvalidAIRequestException),
+)
+async def stream_search_recipe(
+    request: SearchRecipeRequest,
+    service: AssistantService = Depends(get_assistant_service),
+):
+    return sse_response(await service.stream_search_recipe(request.food))
+
+
+@router.post(
+    "/quick/stream",
+    status_code=200,
+    summary="대화형 재료 입력 기반 즉시 추천 (SSE 스트리밍)",
+    description=STREAM_DESCRIPTION,
+    response_class=StreamingResponse,
+    responses=create_error_response(InvalidAIRequestException),
+)
+async def stream_quick_recipe(
+    request: QuickRecipeRequest,
+    service: AssistantService = Depends(get_assistant_service),
+):
+    return sse_response(await service.stream_quick_recipe(request.chat))
+
+
 @router.post(
     "/receipt/extract", response_model=ReceiptIngredientResponse, status_code=200, summary="영수증 인식 및 식재료 추출"
 )
@@ -1,9 +1,10 @@
-from fastapi import APIRouter, Depends
+from fastapi import APIRouter, Depends, Query
 
 from core.di import get_ingredient_service
 from domains.ingredient.exceptions import (
     IngredientNotFoundException,
     ValueNotFoundException,
+    InvalidCursorException,
 )
 from domains.ingredient.schemas import (
     AddIngredientRequest,
@@ -14,6 +15,10 @@ from domains.ingredient.schemas import (
     GetIngredientResponse,
     BulkMoveIngredientRequest,
     BulkMoveResponse,
+    BulkAutoFillRequest,
+    BulkAutoFillResponse,
+    IngredientOrder,
+    IngredientPageResponse,
 )
 from domains.ingredient.service import IngredientService
 from util.docs import create_error_response
@@ -34,6 +39,25 @@ async def add_ingredient(
     return await service.add_ingredient(request)
 
 
+@router.patch(
+    "/auto",
+    summary="식재료 유통기한/보관방법 일괄 자동 채우기 API",
+    status_code=200,
+    response_model=BulkAutoFillResponse,
+)
+async def bulk_auto_fill_ingredients(
+    request: BulkAutoFillRequest,
+    service: IngredientService = Depends(get_ingredient_service),
+):
+    """
+    # 여러 식재료의 유통기한/보관방법을 한 번에 자동으로 입력 (영수증 등록 직후 등)
+    ## ingredient_ids -> 선택한 식재료만 ([6, 7, 11])
+    ## all_unclassified=true -> 유통기한/보관방법이 모두 없는 식재료 전체
+    ## 둘 중 하나만 입력, 자동 입력 데이터가 없는 식재료는 그대로 두고 skipped_ids로 반환
+    """
+    return await service.bulk_auto_fill(request)
+
+
 @router.patch(
     "/{ingredient_id}",
     summary="식재료 유통기한 및 보관장소 설정 API",
@@ -100,6 +124,60 @@ async def get_ingredients(
     return await service.get_ingredients(storage=storage, is_unclassified=is_unclassified)
 
 
+@router.get(
+    "/page",
+    summary="식재료 페이지 조회 API",
+    status_code=200,
+    response_model=IngredientPageResponse,
+    responses=create_error_response(InvalidCursorException),
+)
+async def get_ingredients_page(
+    limit: int = Query(50, ge=1, le=100),
+    cursor: str | None = None,
+    order_by: IngredientOrder = IngredientOrder.EXPIRATION_DATE,
+    include_total: bool = False,
+    is_unclassified: bool | None = None,
+    storage: StorageType | None = None,
+    service: IngredientService = Depends(get_ingredient_service),
+):
+    """
+    # 커서 기반 페이지 조회 (필터는 GET /ingredients 와 동일)
+    ## 첫 페이지는 cursor 없이 요청, 다음 페이지는 응답의 next_cursor를 그대로 전달
+    ## next_cursor가 null이면 마지막 페이지
+    ## order_by -> expiration_date(유통기한 임박순, 미입력은 맨 뒤) / purchase_date / id
+    ## include_total=true 면 전체 개수(total)도 같이 반환 (추가 쿼리 발생, 첫 페이지에서만 권장)
+    """
+    return await service.get_ingredients_page(
+        limit=limit,
+        cursor=cursor,
+        order_by=order_by,
+        include_total=include_total,
+        storage=storage,
+        is_unclassified=is_unclassified,
+    )
+
+
+@router.get(
+    "/expiring",
+    summary="유통기한 임박 식재료 조회 API",
+    status_code=200,
+    response_model=list[GetIngredientResponse],
+)
+async def get_expiring_ingredients(
+    days: int = Query(3, ge=0, le=365),
+    include_expired: bool = False,
+    limit: int = Query(100, ge=1, le=500),
+    service: IngredientService = Depends(get_ingredient_service),
+):
+    """
+    # 오늘부터 days일 안에 유통기한이 끝나는 식재료 (유통기한 임박순)
+    ## days=0 -> 오늘까지
+    ## include_expired=true -> 이미 유통기한이 지난 식재료도 포함
+    ## 유통기한이 입력되지 않은 식재료는 제외
+    """
+    return await service.get_expiring_soon(days=days, include_expired=include_expired, limit=limit)
+
+
 @router.get(
     "/detail",
     summary="식재료 단일 조회 API",
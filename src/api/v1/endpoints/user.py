@@ -1,7 +1,10 @@
-from fastapi import APIRouter, Depends, Request
+from fastapi import APIRouter, Depends, Query, Request
+from pydantic import EmailStr
 from starlette.responses import JSONResponse
 
-from core.di import get_user_service, get_current_user, get_social_auth_service
+from core.di import get_user_service, get_current_user, get_social_auth_service, get_availability_service
+from core.exception.exceptions import ServiceBusyException, RateLimitExceededException
+from core.rate_limit import RateLimit, rate_limit
 from domains.user.exceptions import (
     DuplicateEmailException,
     DuplicateNicknameException,
@@ -25,12 +28,21 @@ from domains.user.schemas import (
     ChangePasswordRequest,
     ResetPasswordRequest,
     ChangeNicknameRequest,
+    AvailabilityResponse,
 )
-from domains.user.service import UserService, SocialAuthService
+from domains.user.service import UserService, SocialAuthService, AvailabilityService
 from util.docs import create_error_response
 
 router = APIRouter()
 
+# 가입 폼 입력 중 확인 용도 (IP 기준)
+NICKNAME_AVAILABILITY_LIMIT = RateLimit.sliding_window("availability_nickname", limit=30, seconds=60)
+# 이메일은 가입 여부가 드러나므로 (계정 수집 방지) 더 엄격하게 + 하루 한도
+EMAIL_AVAILABILITY_LIMITS = (
+    RateLimit.sliding_window("availability_email", limit=5, seconds=60),
+    RateLimit.daily("availability_email", limit=30),
+)
+
 
 @router.post(
     "/sign-up",
@@ -42,6 +54,7 @@ router = APIRouter()
         DuplicateNicknameException,
         DuplicatePhoneNumException,
         InvalidCheckedPasswordException,
+        ServiceBusyException,
     ),
 )
 async def user_sign_up(request: SignUpRequest, user_service: UserService = Depends(get_user_service)):
@@ -49,6 +62,36 @@ async def user_sign_up(request: SignUpRequest, user_service: UserService = Depen
     return SignUpResponse(email=user.email)
 
 
+@router.get(
+    "/availability/nickname",
+    status_code=200,
+    summary="닉네임 사용 가능 여부 확인 API",
+    response_model=AvailabilityResponse,
+    responses=create_error_response(RateLimitExceededException),
+    dependencies=[Depends(rate_limit(NICKNAME_AVAILABILITY_LIMIT))],
+)
+async def check_nickname_availability(
+    nickname: str = Query(..., min_length=2, max_length=20),
+    availability_service: AvailabilityService = Depends(get_availability_service),
+):
+    return await availability_service.check_nickname(nickname)
+
+
+@router.get(
+    "/availability/email",
+    status_code=200,
+    summary="이메일 사용 가능 여부 확인 API",
+    response_model=AvailabilityResponse,
+    responses=create_error_response(RateLimitExceededException),
+    dependencies=[Depends(rate_limit(*EMAIL_AVAILABILITY_LIMITS))],
+)
+async def check_email_availability(
+    email: EmailStr = Query(...),
+    availability_service: AvailabilityService = Depends(get_availability_service),
+):
+    return await availability_service.check_email(email)
+
+
 @router.post(
     "/log-in",
     status_code=200,
@@ -56,6 +99,7 @@ async def user_sign_up(request: SignUpRequest, user_service: UserService = Depen
     response_model=LogInResponse,
     responses=create_error_response(
         InvalidCredentialsException,
+        ServiceBusyException,
     ),
 )
 async def user_log_in(
@@ -123,10 +167,12 @@ async def find_email(
     "/change-pw",
     status_code=200,
     summary="비밀번호 변경 API (로그인 상태)",
+    description="변경 후 현재 기기를 포함한 모든 기기의 리프레시 토큰이 폐기됩니다.",
     responses=create_error_response(
         IncorrectPasswordException,
         PasswordUnchangedException,
         PasswordMismatchException,
+        ServiceBusyException,
     ),
 )
 async def change_pw(
@@ -135,13 +181,14 @@ async def change_pw(
     user_service: UserService = Depends(get_user_service),
 ):
     await user_service.change_password(request, current_user.id)
-    return {"message": "비밀번호가 성공적으로 변경되었습니다."}
+    return {"message": "비밀번호가 성공적으로 변경되었습니다. 새 비밀번호로 다시 로그인해주세요."}
 
 
 @router.post(
     "/reset-pw",
     status_code=200,
     summary="비밀번호 재설정 API (비밀번호 찾기)",
+    responses=create_error_response(ServiceBusyException),
 )
 async def reset_pw(
     request: ResetPasswordRequest,
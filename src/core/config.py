@@ -1,4 +1,6 @@
 from pathlib import Path
+from typing import Literal
+
 from pydantic import SecretStr
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
@@ -13,6 +15,18 @@ class Settings(BaseSettings):
     DB_HOST: str
     DB_PORT: int = 5432
     DB_NAME: str = "domeok"
+
+    DB_ECHO: Literal["off", "info", "debug"] = "off"  # SQL 로그 레벨 (운영에서는 off)
+    DB_POOL_SIZE: int = 10
+    DB_MAX_OVERFLOW: int = 10
+    DB_POOL_TIMEOUT: float = 10.0  # 커넥션 풀 대기 최대 시간 (초)
+    DB_POOL_RECYCLE: int = 1800  # 커넥션 재생성 주기 (초)
+    DB_POOL_PRE_PING: bool = True
+    DB_CONNECT_TIMEOUT: float = 10.0  # DB 연결 수립 최대 시간 (초)
+    DB_STATEMENT_TIMEOUT_MS: int = 15000  # 서버 측 statement_timeout (0이면 비활성)
+    DB_QUERY_CACHE_SIZE: int = 500  # SQLAlchemy 컴파일 쿼리 캐시 크기
+    DB_PREPARED_STATEMENT_CACHE_SIZE: int = 100  # asyncpg prepared statement 캐시 크기 (0이면 비활성)
+
     REDIS_URL: str
 
     JWT_SECRET_KEY: SecretStr
@@ -31,6 +45,15 @@ class Settings(BaseSettings):
     UNSPLASH_ACCESS_KEY: str
     UNSPLASH_SECRET_KEY: SecretStr
 
+    PASSWORD_HASH_WORKERS: int = 4  # argon2 해싱 동시 실행 수
+    PASSWORD_HASH_MAX_QUEUE: int = 64  # 대기열이 이보다 길면 503 반환
+
+    EXPIRY_NOTIFICATION_ENABLED: bool = False  # 유통기한 임박 알림 스케줄러 실행 여부
+    EXPIRY_NOTIFICATION_HOUR: int = 20  # 매일 알림을 보내는 시각 (서버 시간 기준)
+    EXPIRY_NOTIFICATION_DAYS: int = 1  # 오늘부터 며칠 안에 끝나는 식재료를 알릴지
+
+    METRICS_TOKEN: SecretStr | None = None  # /metrics 접근 토큰 (X-Metrics-Token 헤더, 없으면 /metrics 비활성)
+
     @property
     def POSTGRES_DATABASE_URL(self) -> str:
         return f"postgresql+asyncpg://{self.DB_USER}:{self.DB_PASSWORD.get_secret_value()}@{self.DB_HOST}:{self.DB_PORT}/{self.DB_NAME}"
@@ -1,15 +1,103 @@
+import time
+
 import redis.asyncio as redis
-from sqlalchemy.ext.asyncio import create_async_engine, async_sessionmaker, AsyncSession
+from sqlalchemy.exc import TimeoutError as PoolTimeoutError
+from sqlalchemy.ext.asyncio import create_async_engine, async_sessionmaker, AsyncSession, AsyncEngine
 from sqlalchemy.orm import DeclarativeBase
+from sqlalchemy.pool import AsyncAdaptedQueuePool
 
-from core.config import settings
+from core.config import settings, Settings
 
 POSTGRES_DATABASE_URL = settings.POSTGRES_DATABASE_URL
 
-engine = create_async_engine(
-    POSTGRES_DATABASE_URL,
-    echo=True,  # 개발 중에는 쿼리 로그 보기
-)
+ECHO_LEVELS = {"off": False, "info": True, "debug": "debug"}
+CHECKOUT_WAIT_BUCKETS = (0.001, 0.01, 0.1, 1.0)  # 초 단위 상한
+
+
+class PoolMetrics:
+    """커넥션 체크아웃 대기 시간 통계 (풀 크기를 실제 동시성에 맞추기 위한 지표)"""
+
+    def __init__(self):
+        self.checkouts = 0
+        self.timeouts = 0
+        self.total_wait = 0.0
+        self.max_wait = 0.0
+        self.buckets = [0] * (len(CHECKOUT_WAIT_BUCKETS) + 1)
+
+    def record(self, wait: float):
+        self.checkouts += 1
+        self.total_wait += wait
+        self.max_wait = max(self.max_wait, wait)
+
+        for i, upper in enumerate(CHECKOUT_WAIT_BUCKETS):
+            if wait < upper:
+                self.buckets[i] += 1
+                return
+        self.buckets[-1] += 1
+
+    def stats(self) -> dict:
+        labels = [f"lt_{int(upper * 1000)}ms" for upper in CHECKOUT_WAIT_BUCKETS]
+        labels.append(f"gte_{int(CHECKOUT_WAIT_BUCKETS[-1] * 1000)}ms")
+
+        return {
+            "checkouts": self.checkouts,
+            "timeouts": self.timeouts,
+            "avg_wait_ms": round(self.total_wait / self.checkouts * 1000, 3) if self.checkouts else 0.0,
+            "max_wait_ms": round(self.max_wait * 1000, 3),
+            "wait_histogram": dict(zip(labels, self.buckets)),
+        }
+
+
+pool_metrics = PoolMetrics()
+
+
+class MeteredQueuePool(AsyncAdaptedQueuePool):
+    # 풀에서 커넥션을 꺼내는 데 걸린 시간 (대기 + overflow 시 연결 수립 포함)
+    def _do_get(self):
+        start = time.perf_counter()
+        try:
+            return super()._do_get()
+        except PoolTimeoutError:
+            pool_metrics.timeouts += 1
+            raise
+        finally:
+            pool_metrics.record(time.perf_counter() - start)
+
+
+def create_engine_from_settings(config: Settings) -> AsyncEngine:
+    server_settings = {}
+    if config.DB_STATEMENT_TIMEOUT_MS:
+        server_settings["statement_timeout"] = str(config.DB_STATEMENT_TIMEOUT_MS)
+
+    return create_async_engine(
+        config.POSTGRES_DATABASE_URL,
+        echo=ECHO_LEVELS[config.DB_ECHO],
+        poolclass=MeteredQueuePool,
+        pool_size=config.DB_POOL_SIZE,
+        max_overflow=config.DB_MAX_OVERFLOW,
+        pool_timeout=config.DB_POOL_TIMEOUT,
+        pool_recycle=config.DB_POOL_RECYCLE,
+        pool_pre_ping=config.DB_POOL_PRE_PING,
+        query_cache_size=config.DB_QUERY_CACHE_SIZE,
+        connect_args={
+            "timeout": config.DB_CONNECT_TIMEOUT,
+            "prepared_statement_cache_size": config.DB_PREPARED_STATEMENT_CACHE_SIZE,
+            "server_settings": server_settings,
+        },
+    )
+
+
+def get_pool_stats() -> dict:
+    pool = engine.pool
+    return {
+        "size": pool.size(),
+        "checked_out": pool.checkedout(),
+        "overflow": pool.overflow(),
+        **pool_metrics.stats(),
+    }
+
+
+engine = create_engine_from_settings(settings)
 
 async_session_factory = async_sessionmaker(
     bind=engine,
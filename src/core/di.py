@@ -3,6 +3,7 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from redis.asyncio import Redis
 
 from core.security import get_access_token
+from core.rate_limit import RateLimit, RateLimiter
 from core.database import get_db, get_redis
 from domains.assistant.llm_handler import LLMHandler
 from domains.assistant.service import AssistantService
@@ -16,7 +17,7 @@ from domains.refrigerator.service import RefrigeratorService
 from domains.shopping.repository import ShoppingRepository
 from domains.shopping.service import ShoppingService
 from domains.user.repository import UserRepository
-from domains.user.service import UserService, SocialAuthService
+from domains.user.service import UserService, SocialAuthService, AvailabilityService
 from domains.user.models import User
 
 
@@ -30,6 +31,12 @@ def get_user_service(session: AsyncSession = Depends(get_db), redis: Redis = Dep
     return UserService(user_repo=repo, redis=redis)
 
 
+def get_availability_service(
+    session: AsyncSession = Depends(get_db), redis: Redis = Depends(get_redis)
+) -> AvailabilityService:
+    return AvailabilityService(UserRepository(session), redis)
+
+
 async def get_current_user(
     req: Request,
     access_token: str = Depends(get_access_token),
@@ -38,6 +45,18 @@ async def get_current_user(
     return await user_service.get_user_by_token(access_token, req)
 
 
+def user_rate_limit(*rules: RateLimit):
+    """
+    로그인한 유저 기준 한도 의존성
+    예: dependencies=[Depends(user_rate_limit(RateLimit.token_bucket("shopping", 20, 1)))]
+    """
+
+    async def dependency(user: User = Depends(get_current_user), redis: Redis = Depends(get_redis)):
+        await RateLimiter(redis).hit(str(user.id), *rules)
+
+    return dependency
+
+
 async def get_social_auth_service(
     session: AsyncSession = Depends(get_db),
     redis: Redis = Depends(get_redis),
@@ -56,13 +75,14 @@ def get_ingredient_repo(
 def get_ingredient_service(
     ingredient_repo: IngredientRepository = Depends(get_ingredient_repo),
     user: User = Depends(get_current_user),
+    redis: Redis = Depends(get_redis),
 ) -> IngredientService:
-    return IngredientService(user=user, ingredient_repo=ingredient_repo)
+    return IngredientService(user=user, ingredient_repo=ingredient_repo, redis=redis)
 
 
 # --- Assistant 관련 ---
-async def get_llm_handler() -> LLMHandler:
-    return LLMHandler()
+async def get_llm_handler(redis: Redis = Depends(get_redis)) -> LLMHandler:
+    return LLMHandler(redis=redis)
 
 
 async def get_assistant_service(
@@ -21,6 +21,16 @@ class UnexpectedException(BaseCustomException):
         super().__init__(status_code=500, code="SERVER_ERROR", detail=detail)
 
 
+class ServiceBusyException(BaseCustomException):
+    def __init__(self, detail: str = "요청이 많아 처리할 수 없습니다. 잠시 후 다시 시도해주세요."):
+        super().__init__(status_code=503, code="SERVER_BUSY", detail=detail)
+
+
+class RateLimitExceededException(BaseCustomException):
+    def __init__(self, detail: str = "요청이 너무 많습니다. 잠시 후 다시 시도해주세요."):
+        super().__init__(status_code=429, code="RATE_LIMIT_EXCEEDED", detail=detail)
+
+
 class GlobalErrorResponse(BaseModel):
     status_code: int = Field(..., examples=[400])
     code: str = Field(..., examples=["ERROR_CODE_STRING"])
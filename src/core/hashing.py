@@ -0,0 +1,84 @@
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, TypeVar
+
+from core.config import settings
+from core.exception.exceptions import ServiceBusyException
+
+T = TypeVar("T")
+
+
+class PasswordHashPool:
+    """
+    argon2 해싱/검증을 이벤트 루프 밖의 스레드에서 실행하는 제한된 작업 풀
+    - 동시에 max_workers 개까지만 실행
+    - 대기 중인 요청이 max_queue 개를 넘으면 ServiceBusyException(503)으로 즉시 거절
+    """
+
+    def __init__(self, max_workers: int, max_queue: int):
+        self.max_workers = max_workers
+        self.max_queue = max_queue
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="password-hash")
+        self._semaphore = asyncio.Semaphore(max_workers)
+        self._waiting = 0
+        self._running = 0
+        self._completed = 0
+        self._rejected = 0
+
+    async def run(self, func: Callable[..., T], *args) -> T:
+        if self._waiting >= self.max_queue:
+            self._rejected += 1
+            raise ServiceBusyException()
+
+        self._waiting += 1
+        try:
+            await self._semaphore.acquire()
+        finally:
+            self._waiting -= 1
+
+        self._running += 1
+        try:
+            loop = asyncio.get_running_loop()
+            future = loop.run_in_executor(self._executor, func, *args)
+        except BaseException:
+            self._finish()
+            raise
+
+        # 호출한 쪽이 취소돼도 이미 넘긴 작업은 워커에서 끝까지 실행됨
+        # -> 슬롯은 작업이 실제로 끝났을 때 반납 (취소로 대기열 한도를 우회하지 못하도록)
+        future.add_done_callback(self._on_done)
+        return await asyncio.shield(future)
+
+    def _on_done(self, future: asyncio.Future):
+        if not future.cancelled():
+            # 기다리던 쪽이 취소된 경우 "exception was never retrieved" 경고가 남지 않도록 확인 처리
+            future.exception()
+        self._finish()
+
+    def _finish(self):
+        self._running -= 1
+        self._completed += 1
+        self._semaphore.release()
+
+    def has_capacity(self) -> bool:
+        """지금 넘기면 기다리지 않고 바로 실행되는지"""
+        return self._running + self._waiting < self.max_workers
+
+    def stats(self) -> dict:
+        return {
+            "max_workers": self.max_workers,
+            "max_queue": self.max_queue,
+            "running": self._running,
+            "queue_depth": self._waiting,
+            "completed": self._completed,
+            "rejected": self._rejected,
+        }
+
+    def shutdown(self):
+        self._executor.shutdown(wait=False, cancel_futures=True)
+
+
+password_hash_pool = PasswordHashPool(
+    max_workers=settings.PASSWORD_HASH_WORKERS,
+    max_queue=settings.PASSWORD_HASH_MAX_QUEUE,
+)
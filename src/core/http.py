@@ -0,0 +1,84 @@
+from dataclasses import dataclass
+
+import httpx
+
+
+@dataclass(frozen=True)
+class HttpClientConfig:
+    timeout: httpx.Timeout
+    max_connections: int
+    max_keepalive_connections: int
+    keepalive_expiry: float = 30.0
+    http2: bool = False
+
+
+# 외부 API별 커넥션 설정
+HTTP_CLIENT_CONFIGS: dict[str, HttpClientConfig] = {
+    "openai": HttpClientConfig(
+        timeout=httpx.Timeout(50.0, connect=10.0),
+        max_connections=50,
+        max_keepalive_connections=20,
+        keepalive_expiry=60.0,
+        http2=True,
+    ),
+    "naver_ocr": HttpClientConfig(
+        timeout=httpx.Timeout(30.0, connect=10.0),
+        max_connections=10,
+        max_keepalive_connections=5,
+    ),
+    "unsplash": HttpClientConfig(
+        timeout=httpx.Timeout(3.0),
+        max_connections=20,
+        max_keepalive_connections=10,
+        http2=True,
+    ),
+    "kakao": HttpClientConfig(
+        timeout=httpx.Timeout(10.0, connect=5.0),
+        max_connections=20,
+        max_keepalive_connections=10,
+    ),
+}
+
+
+class HttpClientRegistry:
+    """
+    외부 API별로 하나씩 유지하는 httpx.AsyncClient 모음
+    - 요청마다 TCP/TLS 연결을 새로 맺지 않도록 커넥션을 재사용
+    - FastAPI lifespan에서 start / close 호출
+    - start 전에 get을 호출해도 (테스트, 스크립트) 필요할 때 생성함
+    """
+
+    def __init__(self, configs: dict[str, HttpClientConfig]):
+        self.configs = configs
+        self._clients: dict[str, httpx.AsyncClient] = {}
+
+    def _create(self, name: str) -> httpx.AsyncClient:
+        config = self.configs[name]
+        return httpx.AsyncClient(
+            timeout=config.timeout,
+            limits=httpx.Limits(
+                max_connections=config.max_connections,
+                max_keepalive_connections=config.max_keepalive_connections,
+                keepalive_expiry=config.keepalive_expiry,
+            ),
+            http2=config.http2,  # httpx[http2] (h2 패키지) 필요
+        )
+
+    def get(self, name: str) -> httpx.AsyncClient:
+        client = self._clients.get(name)
+        if client is None or client.is_closed:
+            client = self._create(name)
+            self._clients[name] = client
+        return client
+
+    def start(self):
+        for name in self.configs:
+            self.get(name)
+
+    async def close(self):
+        clients, self._clients = self._clients, {}
+        for client in clients.values():
+            await client.aclose()
+
+
+http_clients = HttpClientRegistry(HTTP_CLIENT_CONFIGS)
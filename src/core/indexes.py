@@ -0,0 +1,107 @@
+"""
+모델에 선언된 스키마(새 테이블 / 새 컬럼 / 인덱스)를 운영 DB에 반영하는 작업
+(create_all은 이미 있는 테이블에 컬럼이나 인덱스를 추가하지 않음)
+
+- 테이블 / 컬럼: 앱 시작 시에도 ensure_tables로 반영 (IF NOT EXISTS라 여러 번 실행해도 안전)
+- 인덱스: CONCURRENTLY로 오래 걸릴 수 있으므로 배포 때 따로 실행
+
+실행 (src 디렉토리 기준):
+    python -m core.indexes
+"""
+
+import asyncio
+
+from sqlalchemy import Table, inspect, text
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.engine import Connection
+from sqlalchemy.ext.asyncio import AsyncEngine
+from sqlalchemy.schema import CreateColumn, CreateIndex, CreateTable
+
+from core.database import Base, engine
+
+# 중단된 CREATE INDEX CONCURRENTLY가 남긴 INVALID 인덱스 (IF NOT EXISTS로는 다시 만들어지지 않음)
+INVALID_INDEXES_SQL = text("""
+    SELECT c.relname
+    FROM pg_index i
+    JOIN pg_class c ON c.oid = i.indexrelid
+    WHERE NOT i.indisvalid AND c.relname = ANY(:names)
+""")
+
+
+def create_index_sql(index) -> str:
+    # 서비스 중인 테이블에 쓰기 잠금을 걸지 않도록 CONCURRENTLY로 생성
+    sql = str(CreateIndex(index, if_not_exists=True).compile(dialect=postgresql.dialect()))
+    return sql.replace("CREATE INDEX", "CREATE INDEX CONCURRENTLY", 1)
+
+
+def _ensure_tables(conn: Connection, tables: list[Table]) -> list[str]:
+    inspector = inspect(conn)
+    existing = set(inspector.get_table_names())
+    changed = []
+
+    for table in tables:
+        if table.name not in existing:
+            conn.execute(CreateTable(table, if_not_exists=True))
+            changed.append(table.name)
+            continue
+
+        # 이미 있는 테이블에는 빠진 컬럼만 추가 (새 컬럼은 NULL 허용이거나 server_default가 있어야 함)
+        columns = {column["name"] for column in inspector.get_columns(table.name)}
+        for column in table.columns:
+            if column.name not in columns:
+                ddl = CreateColumn(column).compile(dialect=conn.dialect)
+                conn.execute(text(f'ALTER TABLE "{table.name}" ADD COLUMN IF NOT EXISTS {ddl}'))
+                changed.append(f"{table.name}.{column.name}")
+
+    return changed
+
+
+async def ensure_tables(target: AsyncEngine, tables: list[Table]) -> list[str]:
+    """DB에 없는 테이블을 만들고 이미 있는 테이블에 빠진 컬럼을 추가 -> 반영한 테이블 / 컬럼 이름 목록"""
+    async with target.begin() as conn:
+        return await conn.run_sync(_ensure_tables, tables)
+
+
+def load_models() -> list[Table]:
+    """모든 모델을 메타데이터에 등록하고 생성 순서(FK 기준)대로 테이블 반환"""
+    import domains.ingredient.models  # noqa: F401
+    import domains.recipe.models  # noqa: F401
+    import domains.refrigerator.models  # noqa: F401
+    import domains.shopping.models  # noqa: F401
+    import domains.user.models  # noqa: F401
+
+    return list(Base.metadata.sorted_tables)
+
+
+async def ensure_indexes(target: AsyncEngine, tables: list[Table]) -> list[str]:
+    """모델에 선언된 인덱스 중 DB에 없는 것만 생성하고, 실행한 이름 목록 반환"""
+    indexes = [index for table in tables for index in sorted(table.indexes, key=lambda i: i.name)]
+    names = [index.name for index in indexes]
+
+    # CONCURRENTLY는 트랜잭션 안에서 실행할 수 없음
+    async with target.connect() as conn:
+        conn = await conn.execution_options(isolation_level="AUTOCOMMIT")
+
+        invalid = (await conn.execute(INVALID_INDEXES_SQL, {"names": names})).scalars().all()
+        for name in invalid:
+            await conn.execute(text(f'DROP INDEX CONCURRENTLY IF EXISTS "{name}"'))
+
+        for index in indexes:
+            await conn.execute(text(create_index_sql(index)))
+
+    return names
+
+
+async def main():
+    tables = load_models()
+    try:
+        changed = await ensure_tables(engine, tables)
+        print(f"Tables ensured: {changed}")
+        names = await ensure_indexes(engine, tables)
+        print(f"Indexes ensured: {names}")
+    finally:
+        await engine.dispose()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,177 @@
+import asyncio
+from collections import deque
+
+from sqlalchemy import insert
+from sqlalchemy.exc import DataError, IntegrityError
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from core.database import async_session_factory
+
+LOG_BUFFER_MAX_SIZE = 10_000  # 가득 차면 새 로그는 버림 (요청 처리가 막히지 않도록)
+LOG_FLUSH_BATCH_SIZE = 500  # 이만큼 쌓이면 주기를 기다리지 않고 바로 저장
+LOG_FLUSH_INTERVAL = 2.0  # 초 단위 최대 대기 시간
+LOG_FLUSH_MAX_RETRIES = 3  # 저장 실패 시 같은 로그를 다시 시도하는 횟수
+
+
+class LogBuffer:
+    """
+    분석용 로그(누락 식재료, 유통기한 편차 등)를 모았다가 백그라운드에서 한 번에 저장하는 write-behind 버퍼
+    - add(): 메모리 큐에 넣고 바로 반환 -> 요청 처리 중에는 DB를 기다리지 않음
+    - batch_size만큼 쌓이거나 flush_interval이 지나면 모델별 multi-row INSERT 한 번으로 저장
+    - 모델별로 따로 커밋 -> 한 테이블이 실패해도 다른 모델의 로그는 저장됨
+    - 제약 조건 / 값 오류면 그 모델만 행 단위로 다시 저장해서, 실패한 로그만 재시도 / 폐기 대상이 됨
+    - FastAPI lifespan에서 start / close 호출 (close 때 남은 로그를 모두 저장)
+    - 프로세스가 비정상 종료되면 저장 전인 로그는 유실될 수 있음 (분석용 데이터라 허용)
+    """
+
+    def __init__(
+        self,
+        session_factory: async_sessionmaker = async_session_factory,
+        max_size: int = LOG_BUFFER_MAX_SIZE,
+        batch_size: int = LOG_FLUSH_BATCH_SIZE,
+        flush_interval: float = LOG_FLUSH_INTERVAL,
+    ):
+        self.session_factory = session_factory
+        self.max_size = max_size
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+
+        # (모델, 컬럼 값, 실패 횟수)
+        self._records: deque[tuple[type, dict, int]] = deque()
+        self._wakeup: asyncio.Event | None = None
+        self._task: asyncio.Task | None = None
+        self._stopping = False
+
+        self.written = 0
+        self.dropped = 0
+        self.flush_errors = 0
+
+    def __len__(self) -> int:
+        return len(self._records)
+
+    def add(self, model: type, **values) -> bool:
+        if len(self._records) >= self.max_size:
+            self.dropped += 1
+            return False
+
+        self._records.append((model, values, 0))
+        if self._wakeup is not None and len(self._records) >= self.batch_size:
+            self._wakeup.set()
+        return True
+
+    async def flush(self) -> int:
+        """최대 batch_size개를 저장하고 저장한 개수를 반환 (실패한 로그는 다시 큐에 넣음)"""
+        batch = [self._records.popleft() for _ in range(min(self.batch_size, len(self._records)))]
+        if not batch:
+            return 0
+
+        grouped: dict[type, list[tuple[type, dict, int]]] = {}
+        for record in batch:
+            grouped.setdefault(record[0], []).append(record)
+
+        written = 0
+        failed: list[tuple[type, dict, int]] = []
+        pending = list(grouped.items())
+        try:
+            async with self.session_factory() as session:
+                while pending:
+                    model, records = pending[0]
+                    saved, rejected = await self._write(session, model, records)
+                    pending.pop(0)
+                    written += saved
+                    failed += rejected
+        except Exception as e:
+            # 세션 자체의 오류 (연결 끊김 등) -> 아직 처리하지 못한 모델의 로그도 다시 시도
+            print(f"Log Buffer Flush Error: {e}")
+            failed += [record for _, records in pending for record in records]
+
+        if failed:
+            self.flush_errors += 1
+            self._requeue(failed)
+
+        self.written += written
+        return written
+
+    async def _write(self, session: AsyncSession, model: type, records: list) -> tuple[int, list]:
+        """한 모델의 로그를 자체 트랜잭션으로 저장 -> (저장한 개수, 실패한 로그)"""
+        try:
+            await session.execute(insert(model), [values for _, values, _ in records])
+            await session.commit()
+            return len(records), []
+        except (IntegrityError, DataError) as e:
+            # 일부 행의 문제(FK, NOT NULL, 길이 초과 등)일 수 있으므로 행 단위로 다시 저장
+            print(f"Log Buffer Flush Error ({model.__name__}), retrying per row: {e}")
+            await session.rollback()
+            return await self._write_rows(session, model, records)
+        except Exception as e:
+            print(f"Log Buffer Flush Error ({model.__name__}): {e}")
+            await session.rollback()
+            return 0, records
+
+    async def _write_rows(self, session: AsyncSession, model: type, records: list) -> tuple[int, list]:
+        saved, failed = 0, []
+        try:
+            for record in records:
+                try:
+                    async with session.begin_nested():
+                        await session.execute(insert(model), [record[1]])
+                    saved += 1
+                except (IntegrityError, DataError):
+                    failed.append(record)
+            await session.commit()
+        except Exception as e:
+            print(f"Log Buffer Flush Error ({model.__name__}): {e}")
+            await session.rollback()
+            return 0, records
+        return saved, failed
+
+    def _requeue(self, batch: list[tuple[type, dict, int]]):
+        # 실패한 로그는 순서를 유지해서 앞에 다시 넣고, 재시도 횟수를 넘긴 로그와 넘치는 로그는 버림
+        retry = [(model, values, failures + 1) for model, values, failures in batch if failures < LOG_FLUSH_MAX_RETRIES]
+        self.dropped += len(batch) - len(retry)
+
+        self._records.extendleft(reversed(retry))
+        while len(self._records) > self.max_size:
+            self._records.pop()
+            self.dropped += 1
+
+    async def _run(self):
+        while not self._stopping:
+            try:
+                await asyncio.wait_for(self._wakeup.wait(), timeout=self.flush_interval)
+            except asyncio.TimeoutError:
+                pass
+            self._wakeup.clear()
+
+            # 밀린 로그가 있으면 batch_size 단위로 연속 저장
+            while await self.flush() == self.batch_size:
+                pass
+
+    def start(self):
+        if self._task is None or self._task.done():
+            self._stopping = False
+            self._wakeup = asyncio.Event()
+            self._task = asyncio.create_task(self._run())
+
+    async def close(self):
+        if self._task is not None:
+            self._stopping = True
+            self._wakeup.set()
+            await self._task
+            self._task = None
+            self._wakeup = None
+
+        # 남은 로그 모두 저장 (DB가 계속 실패하면 재시도 횟수를 넘긴 뒤 버려지면서 끝남)
+        while self._records:
+            await self.flush()
+
+    def stats(self) -> dict:
+        return {
+            "pending": len(self._records),
+            "written": self.written,
+            "dropped": self.dropped,
+            "flush_errors": self.flush_errors,
+        }
+
+
+log_buffer = LogBuffer()
@@ -0,0 +1,192 @@
+import hashlib
+import math
+import uuid
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta, time
+from typing import Callable
+
+from fastapi import Depends, Request
+from redis.asyncio import Redis
+from redis.exceptions import NoScriptError
+
+from core.database import get_redis
+from core.exception.exceptions import RateLimitExceededException
+
+# 여러 규칙을 한 번에 검사하고, 모두 통과한 경우에만 차감 (Redis 안에서 원자적으로 실행)
+# KEYS[i]: 규칙별 키 / ARGV[1]: 요청 id / ARGV[4i-2 .. 4i+1]: 규칙별 kind, limit, param, cost
+# 반환: {허용 여부(1/0), 초과한 규칙 번호, 재시도까지 남은 ms, 규칙별 남은 횟수...}
+RATE_LIMIT_SCRIPT = """
+local clock = redis.call("TIME")
+local now = tonumber(clock[1]) * 1000 + math.floor(tonumber(clock[2]) / 1000)
+local request_id = ARGV[1]
+local remaining = {}
+
+for i = 1, #KEYS do
+    local key = KEYS[i]
+    local kind = ARGV[i * 4 - 2]
+    local limit = tonumber(ARGV[i * 4 - 1])
+    local param = tonumber(ARGV[i * 4])
+    local cost = tonumber(ARGV[i * 4 + 1])
+    local available, retry_after
+
+    if kind == "daily" then
+        available = limit - tonumber(redis.call("GET", key) or "0")
+        retry_after = redis.call("PTTL", key)
+    elseif kind == "window" then
+        redis.call("ZREMRANGEBYSCORE", key, "-inf", now - param)
+        available = limit - redis.call("ZCARD", key)
+        local oldest = redis.call("ZRANGE", key, 0, 0, "WITHSCORES")
+        retry_after = oldest[2] and (tonumber(oldest[2]) + param - now) or 0
+    else
+        local state = redis.call("HMGET", key, "tokens", "ts")
+        local tokens = tonumber(state[1]) or limit
+        local ts = tonumber(state[2]) or now
+        available = math.min(limit, tokens + math.max(0, now - ts) * param / 1000)
+        retry_after = math.ceil((cost - available) * 1000 / param)
+    end
+
+    if available < cost then
+        return {0, i, math.max(retry_after, 0)}
+    end
+    remaining[i] = available - cost
+end
+
+local result = {1, 0, 0}
+for i = 1, #KEYS do
+    local key = KEYS[i]
+    local kind = ARGV[i * 4 - 2]
+    local limit = tonumber(ARGV[i * 4 - 1])
+    local param = tonumber(ARGV[i * 4])
+    local cost = tonumber(ARGV[i * 4 + 1])
+
+    if kind == "daily" then
+        if redis.call("INCRBY", key, cost) == cost then
+            redis.call("PEXPIRE", key, param)
+        end
+    elseif kind == "window" then
+        for j = 1, cost do
+            redis.call("ZADD", key, now, request_id .. ":" .. j)
+        end
+        redis.call("PEXPIRE", key, param)
+    else
+        redis.call("HSET", key, "tokens", tostring(remaining[i]), "ts", now)
+        redis.call("PEXPIRE", key, math.ceil(limit * 1000 / param))
+    end
+    result[#result + 1] = math.floor(remaining[i])
+end
+
+return result
+"""
+
+RATE_LIMIT_SCRIPT_SHA = hashlib.sha1(RATE_LIMIT_SCRIPT.encode("UTF-8")).hexdigest()
+
+
+@dataclass(frozen=True)
+class RateLimit:
+    """
+    한도 규칙
+    - daily: 하루 limit회 (자정에 초기화) -> 키 `limit:{action}:{identity}:{YYYY-MM-DD}`
+    - window: 최근 window초 동안 limit회
+    - bucket: 최대 limit개, 초당 rate개씩 충전되는 토큰 버킷
+    """
+
+    action: str
+    limit: int
+    kind: str = "daily"
+    window: int = 0
+    rate: float = 0.0
+    cost: int = 1
+
+    @classmethod
+    def daily(cls, action: str, limit: int, cost: int = 1) -> "RateLimit":
+        return cls(action=action, limit=limit, kind="daily", cost=cost)
+
+    @classmethod
+    def sliding_window(cls, action: str, limit: int, seconds: int, cost: int = 1) -> "RateLimit":
+        return cls(action=action, limit=limit, kind="window", window=seconds, cost=cost)
+
+    @classmethod
+    def token_bucket(cls, action: str, capacity: int, refill_per_second: float, cost: int = 1) -> "RateLimit":
+        return cls(action=action, limit=capacity, kind="bucket", rate=refill_per_second, cost=cost)
+
+    def key(self, identity: str, now: datetime) -> str:
+        if self.kind == "daily":
+            return f"limit:{self.action}:{identity}:{now.strftime('%Y-%m-%d')}"
+        if self.kind == "window":
+            return f"limit:{self.action}:{identity}:window:{self.window}"
+        return f"limit:{self.action}:{identity}:bucket"
+
+    def args(self, now: datetime) -> list:
+        if self.kind == "daily":
+            midnight = datetime.combine(now.date() + timedelta(days=1), time.min)
+            param = max(1, int((midnight - now).total_seconds() * 1000))
+        elif self.kind == "window":
+            param = self.window * 1000
+        else:
+            param = self.rate
+        return [self.kind, self.limit, param, self.cost]
+
+
+@dataclass
+class RateLimitResult:
+    allowed: bool
+    exceeded: RateLimit | None = None  # 한도를 넘은 규칙
+    retry_after: float = 0.0  # 초
+    remaining: list[int] = field(default_factory=list)  # 규칙 순서대로 남은 횟수 (허용된 경우)
+
+
+class RateLimiter:
+    """Lua 스크립트 한 번(1 round trip)으로 여러 한도를 검사하고 차감"""
+
+    def __init__(self, redis: Redis):
+        self.redis = redis
+
+    async def _eval(self, keys: list[str], args: list):
+        try:
+            return await self.redis.evalsha(RATE_LIMIT_SCRIPT_SHA, len(keys), *keys, *args)
+        except NoScriptError:
+            # Redis 재시작 등으로 스크립트 캐시가 비어있는 경우 (eval이 스크립트를 다시 등록함)
+            return await self.redis.eval(RATE_LIMIT_SCRIPT, len(keys), *keys, *args)
+
+    async def check(self, identity: str, *rules: RateLimit) -> RateLimitResult:
+        now = datetime.now()
+        keys = [rule.key(identity, now) for rule in rules]
+        args = [uuid.uuid4().hex]
+        for rule in rules:
+            args.extend(rule.args(now))
+
+        allowed, exceeded_index, retry_after_ms, *remaining = await self._eval(keys, args)
+
+        if not allowed:
+            return RateLimitResult(
+                allowed=False,
+                exceeded=rules[int(exceeded_index) - 1],
+                retry_after=int(retry_after_ms) / 1000,
+            )
+        return RateLimitResult(allowed=True, remaining=[int(r) for r in remaining])
+
+    async def hit(self, identity: str, *rules: RateLimit) -> RateLimitResult:
+        result = await self.check(identity, *rules)
+        if not result.allowed:
+            raise RateLimitExceededException(
+                f"요청이 너무 많습니다. {math.ceil(result.retry_after)}초 후 다시 시도해주세요."
+            )
+        return result
+
+
+def client_ip(request: Request) -> str:
+    # 프록시 뒤에서는 uvicorn --proxy-headers 로 실제 IP가 request.client에 들어옴
+    return request.client.host if request.client else "unknown"
+
+
+def rate_limit(*rules: RateLimit, identity: Callable[[Request], str] = client_ip):
+    """
+    라우터/엔드포인트에 붙이는 의존성 (기본은 IP 기준)
+    예: dependencies=[Depends(rate_limit(RateLimit.sliding_window("log_in", 10, 60)))]
+    유저 기준 한도는 core.di.user_rate_limit 사용
+    """
+
+    async def dependency(request: Request, redis: Redis = Depends(get_redis)):
+        await RateLimiter(redis).hit(identity(request), *rules)
+
+    return dependency
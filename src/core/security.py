@@ -1,8 +1,10 @@
 import secrets
 import hmac
 import hashlib
+import time
 
 from base64 import urlsafe_b64encode
+from collections import OrderedDict
 from datetime import datetime, timedelta, timezone
 from fastapi import Depends
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
@@ -11,10 +13,12 @@ from cryptography.fernet import Fernet
 from jose import jwt, JWTError
 
 from core.config import settings
+from core.hashing import password_hash_pool
 from domains.user.exceptions import TokenExpiredException, UnauthorizedException
 
 JWT_ALGORITHM = "HS256"
 JWT_SECRET_KEY = settings.JWT_SECRET_KEY.get_secret_value()
+VERIFIED_TOKEN_CACHE_SIZE = 10_000
 
 FERNET_KEY = settings.PHONE_AES_KEY.get_secret_value()
 HMAC_SECRET = settings.HMAC_SECRET.get_secret_value()
@@ -33,6 +37,15 @@ def verify_password(plain_password: str, hashed_password: str) -> bool:
     return pwd_context.verify(plain_password, hashed_password)
 
 
+# async 핸들러에서는 이벤트 루프를 막지 않도록 아래 함수를 사용
+async def hash_password_async(plain_password: str) -> str:
+    return await password_hash_pool.run(hash_password, plain_password)
+
+
+async def verify_password_async(plain_password: str, hashed_password: str) -> bool:
+    return await password_hash_pool.run(verify_password, plain_password, hashed_password)
+
+
 # --- 전화번호 암호화 (양방향) ---
 def encrypt_phone(plain_phone: str) -> str:
     return cipher_suite.encrypt(plain_phone.encode("UTF-8")).decode("UTF-8")
@@ -63,17 +76,76 @@ def create_jwt(user_id: str) -> str:
     return jwt.encode(payload, JWT_SECRET_KEY, algorithm=JWT_ALGORITHM)
 
 
-def decode_jwt(access_token: str) -> str:
+class VerifiedTokenCache:
+    """
+    서명/만료 검증을 통과한 액세스 토큰의 프로세스 내 LRU (토큰 digest -> (exp, user_id))
+    - 같은 토큰이 다시 오면 JWT 디코딩/HMAC 검증 없이 dict 조회로 끝남
+    - exp가 지나면 캐시에 있어도 사용하지 않음 (JWT 자체와 같은 수명, 따로 무효화할 필요 없음)
+    - 토큰 원문 대신 digest를 키로 사용
+    """
+
+    def __init__(self, max_size: int = VERIFIED_TOKEN_CACHE_SIZE):
+        self.max_size = max_size
+        self._entries: OrderedDict[bytes, tuple[float, str]] = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def _digest(token: str) -> bytes:
+        return hashlib.blake2b(token.encode("UTF-8"), digest_size=16).digest()
+
+    def get(self, token: str) -> str | None:
+        key = self._digest(token)
+        entry = self._entries.get(key)
+        if entry is None or entry[0] <= time.time():
+            if entry is not None:
+                self._entries.pop(key, None)
+            self.misses += 1
+            return None
+
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return entry[1]
+
+    def put(self, token: str, user_id: str, exp: float):
+        key = self._digest(token)
+        self._entries[key] = (exp, user_id)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_size:
+            self._entries.popitem(last=False)
+
+    def clear(self):
+        self._entries.clear()
+
+    def stats(self) -> dict:
+        return {"size": len(self._entries), "hits": self.hits, "misses": self.misses}
+
+
+verified_token_cache = VerifiedTokenCache()
+
+
+def _verify_jwt(access_token: str) -> tuple[str, float]:
     try:
         payload = jwt.decode(access_token, JWT_SECRET_KEY, algorithms=[JWT_ALGORITHM])
-        user_id = payload.get("sub")
+    except JWTError:
+        raise TokenExpiredException()
+
+    user_id = payload.get("sub")
+    exp = payload.get("exp")
+    if user_id is None or exp is None:
+        raise TokenExpiredException()
+    return user_id, float(exp)
+
 
-        if user_id is None:
-            raise TokenExpiredException()
+def decode_jwt(access_token: str) -> str:
+    """유효하지 않거나 만료된 토큰이면 TokenExpiredException"""
+    user_id = verified_token_cache.get(access_token)
+    if user_id is not None:
         return user_id
 
-    except JWTError:
-        return TokenExpiredException()
+    user_id, exp = _verify_jwt(access_token)
+    verified_token_cache.put(access_token, user_id, exp)
+    return user_id
 
 
 # --- 토큰 ---
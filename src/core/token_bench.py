@@ -0,0 +1,48 @@
+"""
+액세스 토큰 검증 마이크로벤치마크 (검증 캐시 적용 전/후 비교)
+
+실행 (src 디렉토리 기준):
+    python -m core.token_bench [반복 횟수]
+"""
+
+import sys
+import timeit
+import uuid
+
+from core import security
+
+
+def bench(number: int = 20000) -> dict[str, float]:
+    """경로별 토큰 1개 검증에 걸리는 시간 (마이크로초)"""
+    token = security.create_jwt(user_id=str(uuid.uuid4()))
+    fresh_tokens = iter([security.create_jwt(user_id=str(uuid.uuid4())) for _ in range(number)])
+
+    cache = security.verified_token_cache
+    cache.clear()
+    security.decode_jwt(token)
+
+    results = {
+        # 기존 경로: 요청마다 python-jose 디코딩 + HMAC 검증
+        "jose_decode": timeit.timeit(
+            lambda: security.jwt.decode(token, security.JWT_SECRET_KEY, algorithms=[security.JWT_ALGORITHM]),
+            number=number,
+        ),
+        # 처음 보는 토큰: 검증 + 캐시 저장
+        "decode_jwt_miss": timeit.timeit(lambda: security.decode_jwt(next(fresh_tokens)), number=number),
+        # 같은 토큰 재요청: digest 계산 + dict 조회
+        "decode_jwt_hit": timeit.timeit(lambda: security.decode_jwt(token), number=number),
+    }
+    cache.clear()
+    return {name: seconds / number * 1_000_000 for name, seconds in results.items()}
+
+
+def main():
+    number = int(sys.argv[1]) if len(sys.argv) > 1 else 20000
+    results = bench(number)
+    baseline = results["jose_decode"]
+    for name, micros in results.items():
+        print(f"{name:<16} {micros:8.2f} us/op  (x{baseline / micros:.1f})")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,135 @@
+import hashlib
+import time
+from collections import OrderedDict
+from typing import Type, TypeVar
+
+from pydantic import BaseModel, ValidationError
+from redis.asyncio import Redis
+
+T = TypeVar("T", bound=BaseModel)
+
+# 메서드별 LLM 응답 캐시 유지 시간 (초)
+LLM_CACHE_TTL = {
+    "recommend_menus": 60 * 60 * 6,  # 6시간 (같은 재료 조합이라도 추천은 가끔 바뀌는 게 좋음)
+    "generate_detail": 60 * 60 * 24 * 7,  # 7일
+    "search_recipe": 60 * 60 * 24 * 7,  # 7일
+}
+
+
+class LLMResponseCache:
+    """
+    LLM 응답(파싱 완료된 pydantic 객체)을 Redis에 저장하는 캐시
+    키는 메서드 + 모델 + 완성된 프롬프트의 해시 -> 프롬프트 템플릿이 바뀌면 자동으로 다른 키가 됨
+    """
+
+    def __init__(self, redis: Redis):
+        self.redis = redis
+
+    @staticmethod
+    def make_key(method: str, model: str, prompt: str) -> str:
+        digest = hashlib.sha256(f"{method}\n{model}\n{prompt}".encode("UTF-8")).hexdigest()
+        return f"LLM:{method}:{digest}"
+
+    async def get(self, key: str, response_model: Type[T]) -> T | None:
+        try:
+            raw = await self.redis.get(key)
+            if not raw:
+                return None
+            return response_model.model_validate_json(raw)
+
+        except ValidationError:
+            # 스키마가 바뀌어 예전 캐시를 읽을 수 없는 경우 -> miss 처리
+            return None
+
+        except Exception as e:
+            print(f"LLM Cache Read Error: {e}")
+            return None
+
+    async def set(self, key: str, value: BaseModel, ttl: int):
+        try:
+            await self.redis.set(key, value.model_dump_json(), ex=ttl)
+        except Exception as e:
+            print(f"LLM Cache Write Error: {e}")
+
+
+IMAGE_CACHE_TTL = 60 * 60 * 24 * 30  # 30일
+IMAGE_NEGATIVE_CACHE_TTL = 60 * 10  # 검색 실패/결과 없음은 10분만 기억
+IMAGE_LOCAL_TTL = 60 * 60  # 프로세스 내 LRU 유지 시간
+IMAGE_LOCAL_MAX_SIZE = 2048
+IMAGE_NEGATIVE = ""  # 실패를 나타내는 캐시 값
+
+
+class ImageUrlCache:
+    """
+    요리 이름(food_en) -> Unsplash 이미지 URL 2단계 캐시
+    - 1차: 프로세스 내 LRU
+    - 2차: Redis `IMG:{query}`
+    실패는 IMAGE_NEGATIVE 값으로 짧게 저장해서 같은 실패 요청이 반복되지 않게 함
+    """
+
+    def __init__(self, max_size: int = IMAGE_LOCAL_MAX_SIZE, local_ttl: float = IMAGE_LOCAL_TTL):
+        self.max_size = max_size
+        self.local_ttl = local_ttl
+        self._local: OrderedDict[str, tuple[float, str]] = OrderedDict()
+
+    @staticmethod
+    def normalize(query: str) -> str:
+        return " ".join(query.lower().split())
+
+    @staticmethod
+    def _key(query: str) -> str:
+        return f"IMG:{query}"
+
+    def _set_local(self, query: str, value: str, ttl: float):
+        self._local[query] = (time.monotonic() + min(ttl, self.local_ttl), value)
+        self._local.move_to_end(query)
+        while len(self._local) > self.max_size:
+            self._local.popitem(last=False)
+
+    async def get(self, redis: Redis, query: str) -> str | None:
+        """캐시된 URL, 캐시된 실패면 IMAGE_NEGATIVE, 캐시에 없으면 None"""
+        query = self.normalize(query)
+
+        entry = self._local.get(query)
+        if entry is not None:
+            expires_at, value = entry
+            if expires_at >= time.monotonic():
+                self._local.move_to_end(query)
+                return value
+            self._local.pop(query, None)
+
+        try:
+            value = await redis.get(self._key(query))
+        except Exception as e:
+            print(f"Image Cache Read Error: {e}")
+            return None
+
+        if not isinstance(value, str):
+            return None
+
+        ttl = IMAGE_CACHE_TTL if value else IMAGE_NEGATIVE_CACHE_TTL
+        self._set_local(query, value, ttl)
+        return value
+
+    async def set(self, redis: Redis, query: str, url: str | None):
+        query = self.normalize(query)
+        value = url or IMAGE_NEGATIVE
+        ttl = IMAGE_CACHE_TTL if url else IMAGE_NEGATIVE_CACHE_TTL
+
+        self._set_local(query, value, ttl)
+        try:
+            await redis.set(self._key(query), value, ex=ttl)
+        except Exception as e:
+            print(f"Image Cache Write Error: {e}")
+
+    async def get_missing(self, redis: Redis, queries: list[str]) -> list[str]:
+        """Redis에 캐시가 없는 검색어만 반환 (프리웜 작업용)"""
+        normalized = list(dict.fromkeys(self.normalize(q) for q in queries))
+        if not normalized:
+            return []
+
+        values = await redis.mget([self._key(q) for q in normalized])
+        return [q for q, value in zip(normalized, values) if value is None]
+
+
+image_url_cache = ImageUrlCache()
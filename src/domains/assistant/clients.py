@@ -1,9 +1,12 @@
 import httpx
+import json
 import uuid
 import base64
 import time
+from typing import AsyncIterator
 
 from core.config import settings
+from core.http import http_clients
 from domains.assistant.exceptions import (
     AIServiceException,
     AITimeoutException,
@@ -19,9 +22,7 @@ class LLMClient:
         self.max_tokens = 1000  # 최대 토큰값
         self.temperature = 0.7  # 창의성 설정(0~1)
 
-        self.timeout = httpx.Timeout(50.0, connect=10.0)
-
-    async def get_response(self, prompt: str) -> str:
+    def _make_request(self, prompt: str, stream: bool = False) -> tuple[dict, dict]:
         if not self.api_key:
             raise AIServiceException(detail="OpenAI API Key가 설정되지 않았습니다.")
 
@@ -36,12 +37,27 @@ class LLMClient:
             "max_tokens": self.max_tokens,
             "temperature": self.temperature,
         }
+        if stream:
+            payload["stream"] = True
 
-        try:
-            async with httpx.AsyncClient(timeout=self.timeout) as client:
-                response = await client.post(self.base_url, headers=headers, json=payload)
+        return headers, payload
 
-                response.raise_for_status()
+    @staticmethod
+    def _status_error(e: httpx.HTTPStatusError) -> AIServiceException:
+        if e.response.status_code == 429:
+            return AIServiceException("AI 요청 한도를 초과했습니다. 잠시 후 시도해주세요.")
+        if e.response.status_code == 401:
+            return AIServiceException("AI 인증에 실패했습니다. (API Key 확인 필요)")
+
+        return AIServiceException(f"OpenAI 에러 ({e.response.status_code}): {e.response.text}")
+
+    async def get_response(self, prompt: str) -> str:
+        headers, payload = self._make_request(prompt)
+
+        try:
+            client = http_clients.get("openai")
+            response = await client.post(self.base_url, headers=headers, json=payload)
+            response.raise_for_status()
 
             data = response.json()
             return data["choices"][0]["message"]["content"]
@@ -50,12 +66,7 @@ class LLMClient:
             raise AITimeoutException()
 
         except httpx.HTTPStatusError as e:
-            if e.response.status_code == 429:
-                raise AIServiceException("AI 요청 한도를 초과했습니다. 잠시 후 시도해주세요.")
-            if e.response.status_code == 401:
-                raise AIServiceException("AI 인증에 실패했습니다. (API Key 확인 필요)")
-
-            raise AIServiceException(f"OpenAI 에러 ({e.response.status_code}): {e.response.text}")
+            raise self._status_error(e)
 
         except httpx.RequestError as e:
             raise AIConnectionException(f"네트워크 연결 오류: {str(e)}")
@@ -63,6 +74,43 @@ class LLMClient:
         except Exception as e:
             raise AIServiceException(f"AI Client 알 수 없는 오류: {str(e)}")
 
+    async def stream_response(self, prompt: str) -> AsyncIterator[str]:
+        """OpenAI stream 모드로 응답 텍스트 조각(delta)을 도착하는 대로 반환"""
+        headers, payload = self._make_request(prompt, stream=True)
+
+        try:
+            client = http_clients.get("openai")
+            async with client.stream("POST", self.base_url, headers=headers, json=payload) as response:
+                if response.is_error:
+                    await response.aread()
+                    response.raise_for_status()
+
+                async for line in response.aiter_lines():
+                    if not line.startswith("data:"):
+                        continue
+
+                    data = line[len("data:") :].strip()
+                    if data == "[DONE]":
+                        break
+
+                    try:
+                        choices = json.loads(data).get("choices") or []
+                    except json.JSONDecodeError:
+                        continue
+
+                    content = choices[0].get("delta", {}).get("content") if choices else None
+                    if content:
+                        yield content
+
+        except httpx.TimeoutException:
+            raise AITimeoutException()
+
+        except httpx.HTTPStatusError as e:
+            raise self._status_error(e)
+
+        except httpx.RequestError as e:
+            raise AIConnectionException(f"네트워크 연결 오류: {str(e)}")
+
 
 llm_client = LLMClient()
 
@@ -71,7 +119,6 @@ class OCRClient:
     def __init__(self):
         self.api_url = settings.NAVER_OCR_API_URL
         self.secret_key = settings.NAVER_OCR_SECRET_KEY.get_secret_value()
-        self.timeout = httpx.Timeout(30.0, connect=10.0)
 
     async def get_ocr_text(self, image_content: bytes, ext: str = "jpg") -> str:
         if not self.secret_key:
@@ -85,9 +132,9 @@ class OCRClient:
         payload = self._make_payload(image_content, ext)
 
         try:
-            async with httpx.AsyncClient(timeout=self.timeout) as client:
-                response = await client.post(self.api_url, headers=headers, json=payload)
-                response.raise_for_status()
+            client = http_clients.get("naver_ocr")
+            response = await client.post(self.api_url, headers=headers, json=payload)
+            response.raise_for_status()
 
             return self._parse_response(response.json())
 
@@ -139,3 +186,35 @@ class OCRClient:
 
 
 ocr_client = OCRClient()
+
+
+class UnsplashClient:
+    def __init__(self):
+        self.api_url = "https://api.unsplash.com/search/photos"
+        self.access_key = settings.UNSPLASH_ACCESS_KEY
+
+    async def search_image(self, query: str) -> str | None:
+        """검색 결과 첫 번째 이미지 URL, 결과가 없거나 실패하면 None"""
+        params = {
+            "query": query,
+            "page": 1,
+            "per_page": 1,
+            "orientation": "landscape",
+            "client_id": self.access_key,
+        }
+
+        try:
+            client = http_clients.get("unsplash")
+            response = await client.get(self.api_url, params=params)
+            if response.status_code == 200:
+                data = response.json()
+                results = data.get("results", [])
+                if results:
+                    return results[0]["urls"]["regular"]
+        except Exception as e:
+            print(f"Unsplash Error ({query}): {e}")
+
+        return None
+
+
+unsplash_client = UnsplashClient()
@@ -0,0 +1,75 @@
+"""
+Assistant 도메인 배치 작업
+
+실행 (src 디렉토리 기준):
+    python -m domains.assistant.jobs
+"""
+
+import asyncio
+
+from redis.asyncio import Redis
+
+from core.database import async_session_factory, redis_pool
+from core.http import http_clients
+from domains.assistant.cache import image_url_cache
+from domains.assistant.clients import unsplash_client
+from domains.assistant.service import DEFAULT_FOOD_IMAGE_URL
+from domains.recipe.repository import RecipeRepository
+
+PREWARM_CONCURRENCY = 4  # Unsplash rate limit을 고려한 동시 요청 수
+
+# 저장된 레시피에 들어있어도 캐시에 넣지 않을 기본/대체 이미지
+NON_CACHEABLE_IMAGE_PREFIXES = ("https://via.placeholder.com", DEFAULT_FOOD_IMAGE_URL)
+
+
+async def prewarm_image_cache(redis: Redis) -> dict:
+    """recipes 테이블의 요리 이름으로 이미지 URL 캐시를 미리 채움"""
+    async with async_session_factory() as session:
+        rows = await RecipeRepository(session).get_image_queries(exclude_url_prefixes=NON_CACHEABLE_IMAGE_PREFIXES)
+
+    # 1. 저장된 레시피에 이미 이미지가 있으면 API 호출 없이 그대로 사용
+    stored_urls = {image_url_cache.normalize(query): url for query, url in rows if query and url}
+    queries = list(dict.fromkeys(image_url_cache.normalize(query) for query, _ in rows if query))
+    missing = await image_url_cache.get_missing(redis, queries)
+
+    seeded = 0
+    to_fetch = []
+    for query in missing:
+        if query in stored_urls:
+            await image_url_cache.set(redis, query, stored_urls[query])
+            seeded += 1
+        else:
+            to_fetch.append(query)
+
+    # 2. 나머지만 Unsplash 검색 (실패는 negative cache로 저장됨)
+    semaphore = asyncio.Semaphore(PREWARM_CONCURRENCY)
+
+    async def fetch(query: str) -> bool:
+        async with semaphore:
+            url = await unsplash_client.search_image(query)
+            await image_url_cache.set(redis, query, url)
+            return url is not None
+
+    fetched = await asyncio.gather(*(fetch(query) for query in to_fetch))
+
+    return {
+        "total": len(queries),
+        "already_cached": len(queries) - len(missing),
+        "seeded_from_recipes": seeded,
+        "fetched": sum(fetched),
+        "failed": len(fetched) - sum(fetched),
+    }
+
+
+async def main():
+    redis_client = Redis(connection_pool=redis_pool)
+    try:
+        result = await prewarm_image_cache(redis_client)
+        print(f"Image cache prewarm finished: {result}")
+    finally:
+        await redis_client.close()
+        await http_clients.close()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -1,23 +1,36 @@
-from typing import Type, TypeVar, List, Dict
+import asyncio
+import json
+from contextlib import aclosing
+from typing import Type, TypeVar, List, Dict, AsyncIterator, Any
 from pydantic import BaseModel, ValidationError
+from redis.asyncio import Redis
 
+from domains.assistant.cache import LLMResponseCache, LLM_CACHE_TTL
 from domains.assistant.clients import llm_client
-from domains.assistant.exceptions import AISchemaMismatchException
-from domains.assistant.parser import LLMParser
+from domains.assistant.exceptions import AISchemaMismatchException, AIJsonDecodeException
+from domains.assistant.parser import LLMParser, IncrementalJSONParser
 from domains.assistant.prompt_builder import PromptBuilder
 from domains.assistant.schemas import RecommendationResponse, DetailRecipeResponse, ReceiptIngredientResponse
 
 T = TypeVar("T", bound=BaseModel)
 
+LLM_PARSE_RETRIES = 1  # JSON 파싱 실패 시 재요청 횟수
+
+# 같은 키로 동시에 들어온 cache miss는 한 번만 OpenAI를 호출 (프로세스 단위)
+_inflight: Dict[str, asyncio.Future] = {}
+
+
+def _normalize_text(text: str) -> str:
+    return " ".join(text.split())
+
 
 class LLMHandler:
-    def __init__(self):
+    def __init__(self, redis: Redis | None = None):
         self.client = llm_client
+        self.cache = LLMResponseCache(redis) if redis else None
 
-    async def _process(self, prompt: str, response_model: Type[T]) -> T:
-        raw_text = await self.client.get_response(prompt)
-        parsed_dict = LLMParser.parse(raw_text)
-
+    @staticmethod
+    def _validate(parsed_dict: Dict, response_model: Type[T]) -> T:
         try:
             return response_model(**parsed_dict)
 
@@ -25,22 +38,170 @@ class LLMHandler:
             print(f"Schema Error: {e}")
             raise AISchemaMismatchException("AI 응답 형식이 올바르지 않습니다.")
 
+    async def _request(self, prompt: str, response_model: Type[T]) -> tuple[T, bool]:
+        """(검증된 응답, 잘린 응답을 복구했는지 여부) - 복구된 응답은 캐시하지 않음"""
+        for attempt in range(LLM_PARSE_RETRIES + 1):
+            raw_text = await self.client.get_response(prompt)
+            try:
+                parsed_dict, repaired = LLMParser.parse_with_repair(raw_text)
+                break
+            except AIJsonDecodeException as e:
+                if attempt == LLM_PARSE_RETRIES:
+                    raise
+                print(f"LLM Parse Error (retrying): {e.detail}")
+
+        return self._validate(parsed_dict, response_model), repaired
+
+    async def _stream(
+        self, prompt: str, response_model: Type[T], cache_method: str | None = None
+    ) -> AsyncIterator[tuple[str, Any]]:
+        """
+        스트리밍 응답을 파싱하면서 (이벤트 이름, 데이터)를 순서대로 반환
+        - ("field", {"key", "value"}): 최상위 필드 완성 (food, tip 등)
+        - ("item", {"key", "index", "value"}): 배열 원소 완성 (use_ingredients, steps)
+        - ("result", response_model): 검증이 끝난 최종 응답 (마지막 이벤트)
+        문법 오류가 보이는 즉시 연결을 끊고, 아직 보낸 이벤트가 없으면 한 번 더 요청
+        """
+        for attempt in range(LLM_PARSE_RETRIES + 1):
+            parser = IncrementalJSONParser()
+            sent = False
+
+            try:
+                async with aclosing(self.client.stream_response(prompt)) as chunks:
+                    async for chunk in chunks:
+                        for event in parser.feed(chunk):
+                            sent = True
+                            if event.kind == "item":
+                                yield "item", {"key": event.key, "index": event.index, "value": event.value}
+                            else:
+                                yield "field", {"key": event.key, "value": event.value}
+
+                        if parser.done:
+                            break
+
+                # max_tokens에서 잘린 경우 완성된 값까지만 살려서 사용
+                parsed_dict = parser.finish(repair=True)
+                break
+
+            except AIJsonDecodeException as e:
+                if sent or attempt == LLM_PARSE_RETRIES:
+                    raise
+                print(f"LLM Stream Parse Error (retrying): {e.detail}")
+
+        result = self._validate(parsed_dict, response_model)
+
+        if self.cache and cache_method and not parser.repaired:
+            key = self.cache.make_key(cache_method, self.client.model, prompt)
+            await self.cache.set(key, result, LLM_CACHE_TTL[cache_method])
+
+        yield "result", result
+
+    async def _process(self, prompt: str, response_model: Type[T], cache_method: str | None = None) -> T:
+        if not self.cache or not cache_method:
+            result, _ = await self._request(prompt, response_model)
+            return result
+
+        key = self.cache.make_key(cache_method, self.client.model, prompt)
+
+        while True:
+            cached = await self.cache.get(key, response_model)
+            if cached:
+                return cached
+
+            leader = _inflight.get(key)
+            if leader is None:
+                break
+
+            try:
+                # 먼저 요청한 쪽의 결과(또는 예외)를 공유, 호출하는 쪽에서 수정할 수 있으므로 복사본 반환
+                result = await asyncio.shield(leader)
+                return result.model_copy(deep=True)
+            except asyncio.CancelledError:
+                # 먼저 요청한 쪽이 취소된 경우에만 직접 다시 시도
+                if leader.cancelled():
+                    continue
+                raise
+
+        future = asyncio.get_running_loop().create_future()
+        _inflight[key] = future
+
+        try:
+            result, repaired = await self._request(prompt, response_model)
+            if not repaired:
+                await self.cache.set(key, result, LLM_CACHE_TTL[cache_method])
+            future.set_result(result.model_copy(deep=True))
+            return result
+
+        except asyncio.CancelledError:
+            future.cancel()
+            raise
+
+        except Exception as e:
+            future.set_exception(e)
+            future.exception()  # 기다리는 쪽이 없어도 경고가 남지 않도록 소비
+            raise
+
+        finally:
+            _inflight.pop(key, None)
+
+    async def _get_cached(self, prompt: str, response_model: Type[T], cache_method: str) -> T | None:
+        if not self.cache:
+            return None
+        key = self.cache.make_key(cache_method, self.client.model, prompt)
+        return await self.cache.get(key, response_model)
+
+    # --- 캐시 키가 입력 순서/공백에 영향받지 않도록 정규화된 입력으로 프롬프트 생성 ---
+    @staticmethod
+    def _suggestion_prompt(ingredients: List[str]) -> str:
+        normalized = sorted({_normalize_text(name) for name in ingredients})
+        return PromptBuilder.build_suggestion_prompt(normalized)
+
+    @staticmethod
+    def _recipe_prompt(food: str, ingredients: List[Dict]) -> str:
+        normalized = sorted(ingredients, key=lambda i: json.dumps(i, ensure_ascii=False, sort_keys=True))
+        return PromptBuilder.build_recipe_prompt(_normalize_text(food), normalized)
+
+    @staticmethod
+    def _search_prompt(food_name: str) -> str:
+        return PromptBuilder.build_search_prompt(_normalize_text(food_name))
+
+    async def get_cached_recommendation(self, ingredients: List[str]) -> RecommendationResponse | None:
+        return await self._get_cached(self._suggestion_prompt(ingredients), RecommendationResponse, "recommend_menus")
+
+    async def get_cached_detail(self, food: str, ingredients: List[Dict]) -> DetailRecipeResponse | None:
+        return await self._get_cached(self._recipe_prompt(food, ingredients), DetailRecipeResponse, "generate_detail")
+
+    async def get_cached_search(self, food_name: str) -> DetailRecipeResponse | None:
+        return await self._get_cached(self._search_prompt(food_name), DetailRecipeResponse, "search_recipe")
+
     async def recommend_menus(self, ingredients: List[str]) -> RecommendationResponse:
-        prompt = PromptBuilder.build_suggestion_prompt(ingredients)
-        return await self._process(prompt, RecommendationResponse)
+        prompt = self._suggestion_prompt(ingredients)
+        return await self._process(prompt, RecommendationResponse, cache_method="recommend_menus")
 
     async def generate_detail(self, food: str, ingredients: List[Dict]) -> DetailRecipeResponse:
-        prompt = PromptBuilder.build_recipe_prompt(food, ingredients)
-        return await self._process(prompt, DetailRecipeResponse)
+        prompt = self._recipe_prompt(food, ingredients)
+        return await self._process(prompt, DetailRecipeResponse, cache_method="generate_detail")
 
     async def search_recipe(self, food_name: str) -> DetailRecipeResponse:
-        prompt = PromptBuilder.build_search_prompt(food_name)
-        return await self._process(prompt, DetailRecipeResponse)
+        prompt = self._search_prompt(food_name)
+        return await self._process(prompt, DetailRecipeResponse, cache_method="search_recipe")
 
     async def quick_recipe(self, chat: str) -> DetailRecipeResponse:
         prompt = PromptBuilder.build_quick_prompt(chat)
         return await self._process(prompt, DetailRecipeResponse)
 
+    def stream_detail(self, food: str, ingredients: List[Dict]) -> AsyncIterator[tuple[str, Any]]:
+        prompt = self._recipe_prompt(food, ingredients)
+        return self._stream(prompt, DetailRecipeResponse, cache_method="generate_detail")
+
+    def stream_search(self, food_name: str) -> AsyncIterator[tuple[str, Any]]:
+        prompt = self._search_prompt(food_name)
+        return self._stream(prompt, DetailRecipeResponse, cache_method="search_recipe")
+
+    def stream_quick(self, chat: str) -> AsyncIterator[tuple[str, Any]]:
+        prompt = PromptBuilder.build_quick_prompt(chat)
+        return self._stream(prompt, DetailRecipeResponse)
+
     async def parse_receipt_ingredients(self, ocr_text: str) -> ReceiptIngredientResponse:
         prompt = PromptBuilder.build_receipt_parsing_prompt(ocr_text)
         return await self._process(prompt, ReceiptIngredientResponse)
@@ -1,5 +1,6 @@
 import json
 import re
+from dataclasses import dataclass
 from typing import Dict, Any, Union
 from domains.assistant.exceptions import (
     AIJsonDecodeException,
@@ -7,10 +8,26 @@ from domains.assistant.exceptions import (
     AIRefusalException,
 )
 
+MAX_PREAMBLE = 200  # JSON 시작('{') 전에 허용하는 글자 수 (코드 블록 표시, 짧은 안내 문구 등)
+ERROR_CONTEXT = 20  # 에러 위치 앞뒤로 보여줄 글자 수
+
+
+def describe_error(text: str, pos: int, message: str) -> str:
+    """파싱 실패 위치를 줄/칸 번호와 주변 텍스트로 표시"""
+    line = text.count("\n", 0, pos) + 1
+    column = pos - text.rfind("\n", 0, pos)
+    context = text[max(0, pos - ERROR_CONTEXT) : pos + ERROR_CONTEXT]
+    return f"AI 응답 파싱 실패: {message} (line {line}, column {column}, 근처: {context!r})"
+
 
 class LLMParser:
     @staticmethod
     def parse(response_text: str) -> Union[Dict[str, Any], list[Any]]:
+        return LLMParser.parse_with_repair(response_text)[0]
+
+    @staticmethod
+    def parse_with_repair(response_text: str) -> tuple[Union[Dict[str, Any], list[Any]], bool]:
+        """(파싱 결과, 잘린 응답을 복구했는지 여부)"""
         if not response_text or not response_text.strip():
             raise AINullResponseException()
 
@@ -23,10 +40,277 @@ class LLMParser:
         try:
             parsed_data = json.loads(clean_text)
 
-            if isinstance(parsed_data, dict) and "error" in parsed_data:
-                raise AIRefusalException(detail=parsed_data["error"])
+        except json.JSONDecodeError as e:
+            start = LLMParser._json_start(clean_text)
+            try:
+                # 완성된 JSON 뒤에 설명 문장 등이 붙은 경우는 JSON 부분만 사용 (복구 아님)
+                parsed_data, _ = json.JSONDecoder().raw_decode(clean_text, start)
+            except json.JSONDecodeError:
+                # max_tokens에서 잘린 응답 등은 점진 파서로 복구 시도
+                # 점진 파서는 최상위 객체만 다루므로 최상위가 배열이면 복구하지 않음 (첫 원소만 남아 타입이 바뀜)
+                if start < len(clean_text) and clean_text[start] == "[":
+                    raise AIJsonDecodeException(detail=describe_error(clean_text, e.pos, e.msg))
+                try:
+                    return IncrementalJSONParser.parse_text(response_text), True
+                except AIJsonDecodeException:
+                    raise AIJsonDecodeException(detail=describe_error(clean_text, e.pos, e.msg))
+
+        if isinstance(parsed_data, dict) and "error" in parsed_data:
+            raise AIRefusalException(detail=parsed_data["error"])
+
+        return parsed_data, False
+
+    @staticmethod
+    def _json_start(text: str) -> int:
+        """첫 '{' 또는 '[' 위치 (앞에 붙은 짧은 안내 문구 건너뛰기), 없으면 0"""
+        positions = [pos for pos in (text.find("{"), text.find("[")) if pos != -1]
+        return min(positions) if positions else 0
+
+
+@dataclass
+class ParseEvent:
+    kind: str  # "field": 최상위 값 완성, "item": 최상위 배열의 원소 완성
+    key: str
+    value: Any
+    index: int | None = None
+
+
+CLOSERS = {"{": "}", "[": "]"}
+
+
+class IncrementalJSONParser:
+    """
+    스트리밍으로 들어오는 LLM 응답을 조각 단위로 받아 최상위 JSON 객체를 점진적으로 파싱
+    - 최상위 필드 값이 완성될 때마다 "field" 이벤트
+    - 최상위 배열(steps, use_ingredients 등)은 원소가 완성될 때마다 "item" 이벤트
+    - 첫 '{' 이전(코드 블록 시작 등)과 객체가 닫힌 이후의 텍스트는 무시
+    - 문법 오류는 해당 글자가 도착하는 즉시 AIJsonDecodeException (남은 생성을 기다리지 않음)
+    - 응답이 중간에 끊기면 마지막으로 완성된 필드/원소까지 잘라내고 열린 괄호를 닫아서 복구
+    """
+
+    def __init__(self):
+        self._text = ""
+        self._pos = 0
+        self._start: int | None = None
+        self.done = False
+        self.repaired = False
+
+        # 열려 있는 컨테이너와 각 컨테이너에서 다음에 와야 하는 토큰
+        # 객체: key_or_end -> colon -> value -> comma_or_end -> key -> ...
+        # 배열: value_or_end -> comma_or_end -> value -> ...
+        self._stack: list[list[str]] = []
+        self._in_string = False
+        self._escape = False
+        self._is_key = False
+        self._string_start = 0
+        self._primitive_start: int | None = None
+
+        # 복구 지점: 여기까지 자르고 closers를 붙이면 올바른 JSON
+        self._safe_end = 0
+        self._safe_closers = ""
+
+        # 최상위 필드 추적
+        self._key: str | None = None
+        self._value_start = 0
+        self._is_array = False
+        self._item_start = 0
+        self._items: list[Any] = []
+
+        self.result: Dict[str, Any] = {}
+
+    @classmethod
+    def parse_text(cls, text: str) -> Dict[str, Any]:
+        """완성된(또는 잘린) 응답 전체를 한 번에 파싱"""
+        parser = cls()
+        parser.feed(text)
+        return parser.finish(repair=True)
+
+    @property
+    def partial(self) -> Dict[str, Any]:
+        """지금까지 완성된 필드 (작성 중인 최상위 배열은 완성된 원소까지)"""
+        if self._is_array and self._key is not None and self._key not in self.result:
+            return {**self.result, self._key: list(self._items)}
+        return dict(self.result)
+
+    def feed(self, chunk: str) -> list[ParseEvent]:
+        self._text += chunk
+        events: list[ParseEvent] = []
+
+        while self._pos < len(self._text) and not self.done:
+            self._step(self._pos, self._text[self._pos], events)
+            self._pos += 1
+
+        return events
+
+    def finish(self, repair: bool = False) -> Dict[str, Any]:
+        if self.done:
+            return self.result
+
+        if self._start is None:
+            if not self._text.strip():
+                raise AINullResponseException()
+            raise self._error(len(self._text), "JSON 객체를 찾을 수 없습니다.")
+
+        if not repair:
+            raise self._error(len(self._text), "응답이 중간에 끊겼습니다.")
+
+        repaired = self._text[self._start : self._safe_end] + self._safe_closers
+        try:
+            data = json.loads(repaired)
+        except json.JSONDecodeError as e:
+            raise AIJsonDecodeException(detail=describe_error(repaired, e.pos, e.msg))
+
+        if "error" in data:
+            raise AIRefusalException(detail=data["error"])
+
+        if not data:
+            raise self._error(len(self._text), "응답이 중간에 끊겼습니다.")
+
+        self.repaired = True
+        return data
+
+    def _error(self, pos: int, message: str) -> AIJsonDecodeException:
+        return AIJsonDecodeException(detail=describe_error(self._text, pos, message))
+
+    def _step(self, i: int, c: str, events: list[ParseEvent]):
+        if self._start is None:
+            if c == "{":
+                self._start = i
+                self._open(i, c)
+            elif i >= MAX_PREAMBLE:
+                raise self._error(i, "JSON 객체로 시작하지 않습니다.")
+            return
+
+        if self._in_string:
+            if self._escape:
+                self._escape = False
+            elif c == "\\":
+                self._escape = True
+            elif c == '"':
+                self._in_string = False
+                self._end_string(i, events)
+            return
+
+        if self._primitive_start is not None:
+            if not (c.isspace() or c in ",]}"):
+                return
+            self._end_primitive(i, events)
+
+        if c.isspace():
+            return
+
+        container = self._stack[-1]
+        kind, expect = container
+
+        if expect in ("key_or_end", "key"):
+            if c == '"':
+                self._begin_string(i, is_key=True)
+            elif c == "}" and expect == "key_or_end":
+                self._close(i, events)
+            else:
+                raise self._error(i, "필드 이름이 와야 합니다.")
+
+        elif expect == "colon":
+            if c != ":":
+                raise self._error(i, "':'가 와야 합니다.")
+            container[1] = "value"
+
+        elif expect in ("value", "value_or_end"):
+            if c == "]" and expect == "value_or_end":
+                self._close(i, events)
+            else:
+                self._begin_value(i, c)
+
+        elif expect == "comma_or_end":
+            if c == ",":
+                container[1] = "key" if kind == "{" else "value"
+            elif c == CLOSERS[kind]:
+                self._close(i, events)
+            else:
+                raise self._error(i, f"',' 또는 '{CLOSERS[kind]}'가 와야 합니다.")
 
-            return parsed_data
+    def _begin_value(self, i: int, c: str):
+        if len(self._stack) == 1:
+            self._value_start = i
+            self._is_array = c == "["
+            self._items = []
+        elif len(self._stack) == 2 and self._is_array:
+            self._item_start = i
 
+        if c == '"':
+            self._begin_string(i, is_key=False)
+        elif c in "{[":
+            self._open(i, c)
+        elif c in "-0123456789tfn":
+            self._primitive_start = i
+        else:
+            raise self._error(i, "올바른 값이 아닙니다.")
+
+    def _begin_string(self, i: int, is_key: bool):
+        self._in_string = True
+        self._is_key = is_key
+        self._string_start = i
+
+    def _end_string(self, i: int, events: list[ParseEvent]):
+        if not self._is_key:
+            self._end_value(i + 1, events)
+            return
+
+        if len(self._stack) == 1:
+            self._key = json.loads(self._text[self._string_start : i + 1])
+            self._is_array = False
+        self._stack[-1][1] = "colon"
+
+    def _end_primitive(self, end: int, events: list[ParseEvent]):
+        start, self._primitive_start = self._primitive_start, None
+        try:
+            json.loads(self._text[start:end])
+        except json.JSONDecodeError:
+            raise self._error(start, "올바른 값이 아닙니다.")
+        self._end_value(end, events)
+
+    def _open(self, i: int, c: str):
+        self._stack.append([c, "key_or_end" if c == "{" else "value_or_end"])
+        self._mark_safe(i + 1)
+
+    def _close(self, i: int, events: list[ParseEvent]):
+        self._stack.pop()
+        if not self._stack:
+            self.done = True
+            return
+        self._end_value(i + 1, events)
+
+    def _mark_safe(self, end: int):
+        # 최상위 필드와 최상위 배열의 원소 단위로만 복구 (반쯤 채워진 재료 객체 등은 버림)
+        # 객체 값인 최상위 필드는 닫힐 때까지 복구 지점을 옮기지 않음 -> 잘리면 필드째 버림
+        depth = len(self._stack)
+        if depth > 2 or (depth == 2 and self._stack[1][0] != "["):
+            return
+        self._safe_end = end
+        self._safe_closers = "".join(CLOSERS[kind] for kind, _ in reversed(self._stack))
+
+    def _end_value(self, end: int, events: list[ParseEvent]):
+        self._stack[-1][1] = "comma_or_end"
+        self._mark_safe(end)
+
+        depth = len(self._stack)
+        if depth == 1:
+            value = self._loads(self._value_start, end)
+            self.result[self._key] = value
+
+            if self._key == "error":
+                raise AIRefusalException(detail=value)
+
+            if not self._is_array:
+                events.append(ParseEvent(kind="field", key=self._key, value=value))
+
+        elif depth == 2 and self._is_array:
+            value = self._loads(self._item_start, end)
+            events.append(ParseEvent(kind="item", key=self._key, value=value, index=len(self._items)))
+            self._items.append(value)
+
+    def _loads(self, start: int, end: int) -> Any:
+        try:
+            return json.loads(self._text[start:end])
         except json.JSONDecodeError as e:
-            raise AIJsonDecodeException(detail=f"AI 응답 파싱 실패: {str(e)}")
+            raise self._error(start + e.pos, e.msg)
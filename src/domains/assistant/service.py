@@ -1,12 +1,13 @@
 import asyncio
-import httpx
+from typing import AsyncIterator, Any
 
 from fastapi import UploadFile
-from datetime import datetime, timedelta, time
 from redis.asyncio import Redis
 
 from core.config import settings
-from domains.assistant.clients import ocr_client
+from core.rate_limit import RateLimit, RateLimiter
+from domains.assistant.cache import image_url_cache
+from domains.assistant.clients import ocr_client, unsplash_client
 from domains.assistant.llm_handler import LLMHandler
 from domains.assistant.schemas import DetailRecipeRequest, DetailRecipeResponse
 from domains.assistant.exceptions import InvalidAIRequestException
@@ -16,6 +17,8 @@ from domains.user.models import User
 LIMIT_RECIPE_DAILY = 10  # 하루 레시피 10회
 LIMIT_OCR_DAILY = 2  # 하루 영수증 2회
 
+DEFAULT_FOOD_IMAGE_URL = "https://images.unsplash.com/photo-1546069901-ba9599a7e63c?w=600&auto=format&fit=crop&q=60"
+
 
 class AssistantService:
     def __init__(self, user: User, llm_handler: LLMHandler, ingredient_repo: IngredientRepository, redis: Redis):
@@ -23,67 +26,71 @@ class AssistantService:
         self.llm_handler = llm_handler
         self.ingredient_repo = ingredient_repo
         self.redis = redis
+        self.limiter = RateLimiter(redis)
 
     async def _check_limit(self, action_type: str, limit: int):
-        today_str = datetime.now().strftime("%Y-%m-%d")
-        key = f"limit:{action_type}:{self.user.id}:{today_str}"
-
-        current_count = await self.redis.incr(key)
+        # 일일 한도 검사 + 차감을 한 번의 Redis 호출로 원자적으로 처리 (거절된 요청은 차감하지 않음)
+        result = await self.limiter.check(str(self.user.id), RateLimit.daily(action_type, limit))
 
-        if current_count == 1:
-            now = datetime.now()
-            midnight = datetime.combine(now.date() + timedelta(days=1), time.min)
-            seconds_until_midnight = int((midnight - now).total_seconds())
-            await self.redis.expire(key, seconds_until_midnight)
-
-        if current_count > limit:
-            await self.redis.decr(key)
+        if not result.allowed:
             raise InvalidAIRequestException(
                 f"일일 {action_type} 한도({limit}회)를 초과했습니다. 내일 다시 이용해주세요."
             )
 
-        return current_count
+        return limit - result.remaining[0]
 
     async def _fetch_unsplash_image(self, query: str) -> str:
         if not settings.UNSPLASH_ACCESS_KEY:
             return "https://via.placeholder.com/600x400?text=No+API+Key"
 
-        url = "https://api.unsplash.com/search/photos"
-        params = {
-            "query": query,
-            "page": 1,
-            "per_page": 1,
-            "orientation": "landscape",
-            "client_id": settings.UNSPLASH_ACCESS_KEY,
-        }
+        cached = await image_url_cache.get(self.redis, query)
+        if cached is not None:
+            return cached or DEFAULT_FOOD_IMAGE_URL
 
-        try:
-            async with httpx.AsyncClient() as client:
-                response = await client.get(url, params=params, timeout=3.0)
-                if response.status_code == 200:
-                    data = response.json()
-                    results = data.get("results", [])
-                    if results:
-                        return results[0]["urls"]["regular"]
-        except Exception as e:
-            print(f"Unsplash Error ({query}): {e}")
-
-        return "https://images.unsplash.com/photo-1546069901-ba9599a7e63c?w=600&auto=format&fit=crop&q=60"
+        url = await unsplash_client.search_image(query)
+        await image_url_cache.set(self.redis, query, url)
+
+        return url or DEFAULT_FOOD_IMAGE_URL
 
     async def _attach_image_url(self, response: DetailRecipeResponse) -> DetailRecipeResponse:
         query = response.food_en if response.food_en else f"{response.food} food"
         response.image_url = await self._fetch_unsplash_image(query)
         return response
 
+    async def _stream_with_image(self, events: AsyncIterator[tuple[str, Any]]) -> AsyncIterator[tuple[str, Any]]:
+        """LLM 스트림 이벤트를 그대로 전달하고, 최종 결과에는 이미지 URL을 붙여서 전달"""
+        image_task = None
+        try:
+            async for name, data in events:
+                # food_en이 도착하면 나머지 생성을 기다리지 않고 이미지 검색을 미리 시작
+                if name == "field" and data["key"] == "food_en" and data["value"] and image_task is None:
+                    image_task = asyncio.create_task(self._fetch_unsplash_image(data["value"]))
+
+                if name == "result":
+                    if image_task is not None and data.food_en:
+                        data.image_url = await image_task
+                    else:
+                        data = await self._attach_image_url(data)
+
+                yield name, data
+        finally:
+            if image_task is not None and not image_task.done():
+                image_task.cancel()
+
+    async def _stream_cached(self, response: DetailRecipeResponse) -> AsyncIterator[tuple[str, Any]]:
+        yield "result", await self._attach_image_url(response)
+
     async def recommend_menus(self):
-        # ... (기존 코드와 동일) ...
-        await self._check_limit("recipe", LIMIT_RECIPE_DAILY)
         ingredients_objects = await self.ingredient_repo.get_ingredients(user_id=self.user.id)
         if not ingredients_objects:
             raise InvalidAIRequestException("냉장고에 재료가 하나도 없어요! 재료를 먼저 등록해주세요.")
         ingredient_names = [i.ingredient_name for i in ingredients_objects]
 
-        response = await self.llm_handler.recommend_menus(ingredient_names)
+        # 캐시된 응답은 일일 한도에서 차감하지 않음
+        response = await self.llm_handler.get_cached_recommendation(ingredient_names)
+        if not response:
+            await self._check_limit("recipe", LIMIT_RECIPE_DAILY)
+            response = await self.llm_handler.recommend_menus(ingredient_names)
 
         tasks = []
         for recipe in response.recipes:
@@ -97,9 +104,11 @@ class AssistantService:
 
     # [수정] 이미지 첨부 로직 추가
     async def generate_recipe_detail(self, request: DetailRecipeRequest):
-        await self._check_limit("recipe", LIMIT_RECIPE_DAILY)
-        # 1. LLM에게 상세 레시피 요청
-        response = await self.llm_handler.generate_detail(food=request.food, ingredients=request.use_ingredients)
+        # 1. 캐시 확인 후 없으면 LLM에게 상세 레시피 요청 (캐시된 응답은 한도 차감 안 함)
+        response = await self.llm_handler.get_cached_detail(food=request.food, ingredients=request.use_ingredients)
+        if not response:
+            await self._check_limit("recipe", LIMIT_RECIPE_DAILY)
+            response = await self.llm_handler.generate_detail(food=request.food, ingredients=request.use_ingredients)
         # 2. 이미지 검색 및 첨부 후 반환
         return await self._attach_image_url(response)
 
@@ -107,9 +116,11 @@ class AssistantService:
     async def search_recipe(self, food_name: str):
         if not food_name or not food_name.strip():
             raise InvalidAIRequestException("요리명을 입력해주세요.")
-        await self._check_limit("recipe", LIMIT_RECIPE_DAILY)
-        # 1. LLM에게 검색 결과 요청
-        response = await self.llm_handler.search_recipe(food_name)
+        # 1. 캐시 확인 후 없으면 LLM에게 검색 결과 요청 (캐시된 응답은 한도 차감 안 함)
+        response = await self.llm_handler.get_cached_search(food_name)
+        if not response:
+            await self._check_limit("recipe", LIMIT_RECIPE_DAILY)
+            response = await self.llm_handler.search_recipe(food_name)
         # 2. 이미지 검색 및 첨부 후 반환
         return await self._attach_image_url(response)
 
@@ -123,6 +134,36 @@ class AssistantService:
         # 2. 이미지 검색 및 첨부 후 반환
         return await self._attach_image_url(response)
 
+    # --- SSE 스트리밍 버전 ---
+    # 입력 검증과 한도 차감은 스트림 시작 전에 끝내서 실패 시 일반 에러 응답(4xx)으로 반환
+    async def stream_recipe_detail(self, request: DetailRecipeRequest) -> AsyncIterator[tuple[str, Any]]:
+        cached = await self.llm_handler.get_cached_detail(food=request.food, ingredients=request.use_ingredients)
+        if cached:
+            return self._stream_cached(cached)
+
+        await self._check_limit("recipe", LIMIT_RECIPE_DAILY)
+        return self._stream_with_image(
+            self.llm_handler.stream_detail(food=request.food, ingredients=request.use_ingredients)
+        )
+
+    async def stream_search_recipe(self, food_name: str) -> AsyncIterator[tuple[str, Any]]:
+        if not food_name or not food_name.strip():
+            raise InvalidAIRequestException("요리명을 입력해주세요.")
+
+        cached = await self.llm_handler.get_cached_search(food_name)
+        if cached:
+            return self._stream_cached(cached)
+
+        await self._check_limit("recipe", LIMIT_RECIPE_DAILY)
+        return self._stream_with_image(self.llm_handler.stream_search(food_name))
+
+    async def stream_quick_recipe(self, chat: str) -> AsyncIterator[tuple[str, Any]]:
+        if not chat or not chat.strip():
+            raise InvalidAIRequestException("재료나 상황을 입력해주세요.")
+
+        await self._check_limit("recipe", LIMIT_RECIPE_DAILY)
+        return self._stream_with_image(self.llm_handler.stream_quick(chat))
+
     async def process_receipt_image(self, file: UploadFile):
         if not file or not file.filename:
             raise InvalidAIRequestException("업로드된 파일이 없습니다.")
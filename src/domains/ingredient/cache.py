@@ -0,0 +1,364 @@
+"""
+Ingredient 도메인 캐시 / 인덱스
+
+ingredients_expiry, ingredient_aliases, non_ingredients는 앱에서 수정하지 않는 참조 테이블
+-> 직접 수정(SQL, 마이그레이션)한 뒤에는 버전을 올려서 실행 중인 프로세스가 다시 로드하도록 함 (src 디렉토리 기준):
+    python -m domains.ingredient.cache
+"""
+
+import asyncio
+import hashlib
+import json
+from dataclasses import dataclass
+from datetime import date
+
+from redis.asyncio import Redis
+from redis.exceptions import NoScriptError
+
+from core.database import async_session_factory, redis_pool
+from domains.ingredient.matching import IngredientNameMatcher
+from domains.ingredient.repository import IngredientRepository
+from util.bloom import BloomFilter
+
+EXPIRY_VERSION_KEY = "VERSION:ingredients_expiry"
+EXPIRY_REFRESH_INTERVAL = 30  # Redis 버전 확인 주기 (초)
+
+
+@dataclass(frozen=True)
+class ExpiryInfo:
+    ingredient_name: str
+    expiry_day: int
+    storage_type: str
+
+
+class ExpiryCache:
+    """
+    ingredients_expiry 참조 테이블의 프로세스 내 캐시 (ingredient_name 기준)
+    - 앱 시작 시 전체 로드
+    - Redis의 버전 값이 바뀌면 다시 로드
+    - 로드되지 않은 상태에서는 호출하는 쪽이 DB 조회로 대체해야 함 (정확히 같은 이름만 매칭됨)
+    - 로드할 때 이름 매칭 인덱스(matcher)도 같이 만듦 ("두부 2입" -> "두부", 조회에만 쓰고 저장하는 이름은 그대로)
+    """
+
+    def __init__(self):
+        self._infos: dict[str, ExpiryInfo] = {}
+        self.matcher = IngredientNameMatcher([])
+        self._version: str | None = None
+        self._loaded = False
+        self._lock = asyncio.Lock()
+
+    @property
+    def is_loaded(self) -> bool:
+        return self._loaded
+
+    def get_many(self, ingredient_names: list[str]) -> dict[str, ExpiryInfo]:
+        """입력한 이름 기준으로 반환 (이름이 canonical과 다르면 matcher로 찾은 canonical의 데이터)"""
+        result = {}
+        for name, expiry_name in zip(ingredient_names, self.expiry_names(ingredient_names)):
+            if expiry_name in self._infos:
+                result[name] = self._infos[expiry_name]
+        return result
+
+    def expiry_names(self, ingredient_names: list[str]) -> list[str]:
+        """유통기한 데이터 조회에 쓸 이름 (순서 유지, 매칭되지 않으면 입력 그대로)"""
+        return self.matcher.canonicalize(ingredient_names)
+
+    async def load(self, redis: Redis | None = None):
+        async with self._lock:
+            # 버전을 먼저 읽어야 로드 도중에 올라간 버전을 다음 확인 때 놓치지 않음
+            version = await redis.get(EXPIRY_VERSION_KEY) if redis else None
+
+            async with async_session_factory() as session:
+                repo = IngredientRepository(session)
+                rows = await repo.get_all_expiry_infos()
+                aliases = await repo.get_all_ingredient_aliases()
+
+            self._infos = {
+                row.ingredient_name: ExpiryInfo(
+                    ingredient_name=row.ingredient_name,
+                    expiry_day=row.expiry_day,
+                    storage_type=row.storage_type,
+                )
+                for row in rows
+            }
+            self.matcher = IngredientNameMatcher(self._infos.keys(), aliases)
+            self._version = version
+            self._loaded = True
+
+    async def invalidate(self, redis: Redis):
+        # 버전을 올리면 모든 프로세스가 다음 확인 주기에 다시 로드함
+        self._loaded = False
+        self._version = str(await redis.incr(EXPIRY_VERSION_KEY))
+
+    async def watch(self, redis: Redis, interval: float = EXPIRY_REFRESH_INTERVAL):
+        while True:
+            await asyncio.sleep(interval)
+            try:
+                version = await redis.get(EXPIRY_VERSION_KEY)
+                if not self._loaded or version != self._version:
+                    await self.load(redis)
+            except Exception as e:
+                print(f"ExpiryCache Refresh Error: {e}")
+
+
+expiry_cache = ExpiryCache()
+
+
+NON_INGREDIENT_VERSION_KEY = "VERSION:non_ingredients"
+NON_INGREDIENT_BLOOM_THRESHOLD = 100_000  # 제외 식재료가 이보다 많으면 set 대신 Bloom filter 사용
+NON_INGREDIENT_BLOOM_ERROR_RATE = 0.001
+
+
+class NonIngredientIndex:
+    """
+    non_ingredients(제외 식재료) 목록의 프로세스 내 멤버십 인덱스
+    - 목록이 작으면 frozenset(정확), 커지면 Bloom filter(메모리 절약)로 로드
+    - 대부분의 이름은 제외 대상이 아니므로 "없음" 판정은 DB 조회 없이 끝남
+    - Bloom filter의 "있을 수도 있음"만 DB로 확인
+    - 로드/갱신 방식은 ExpiryCache와 같음 (앱 시작 시 로드, Redis 버전이 바뀌면 다시 로드)
+    """
+
+    def __init__(self, bloom_threshold: int = NON_INGREDIENT_BLOOM_THRESHOLD):
+        self.bloom_threshold = bloom_threshold
+        self._names: frozenset[str] | BloomFilter = frozenset()
+        self._version: str | None = None
+        self._loaded = False
+        self._lock = asyncio.Lock()
+
+    @property
+    def is_loaded(self) -> bool:
+        return self._loaded
+
+    @property
+    def is_exact(self) -> bool:
+        return isinstance(self._names, frozenset)
+
+    def build(self, names: list[str]):
+        if len(names) > self.bloom_threshold:
+            bloom = BloomFilter(len(names), NON_INGREDIENT_BLOOM_ERROR_RATE)
+            for name in names:
+                bloom.add(name)
+            self._names = bloom
+        else:
+            self._names = frozenset(names)
+        self._loaded = True
+
+    async def filter(self, ingredient_names: list[str], repo: IngredientRepository) -> list[str]:
+        """제외 식재료를 뺀 이름 목록 (입력 순서/중복 유지)"""
+        candidates = {name for name in ingredient_names if name in self._names}
+        if candidates and not self.is_exact:
+            # Bloom filter 양성은 false positive일 수 있으므로 해당 이름만 DB에서 확인
+            candidates = set(await repo.get_existing_non_ingredients(list(candidates)))
+        return [name for name in ingredient_names if name not in candidates]
+
+    async def load(self, redis: Redis | None = None):
+        async with self._lock:
+            version = await redis.get(NON_INGREDIENT_VERSION_KEY) if redis else None
+
+            async with async_session_factory() as session:
+                names = await IngredientRepository(session).get_all_non_ingredient_names()
+
+            self.build(names)
+            self._version = version
+
+    async def invalidate(self, redis: Redis):
+        self._loaded = False
+        self._version = str(await redis.incr(NON_INGREDIENT_VERSION_KEY))
+
+    async def watch(self, redis: Redis, interval: float = EXPIRY_REFRESH_INTERVAL):
+        while True:
+            await asyncio.sleep(interval)
+            try:
+                version = await redis.get(NON_INGREDIENT_VERSION_KEY)
+                if not self._loaded or version != self._version:
+                    await self.load(redis)
+            except Exception as e:
+                print(f"NonIngredientIndex Refresh Error: {e}")
+
+
+non_ingredient_index = NonIngredientIndex()
+
+
+EXPIRING_INDEX_TTL = 60 * 60 * 24  # 하루 동안 조회/수정이 없으면 삭제 (다음 조회 때 DB에서 다시 생성)
+EXPIRING_SENTINEL = "_"  # score가 +inf인 표시용 멤버 -> 키가 있으면 (식재료가 0개여도) 인덱스가 준비된 상태
+
+# KEYS: zset, hash / ARGV: min score, max score, limit
+# 인덱스가 없으면 nil, 있으면 유통기한 순 식재료 JSON 목록
+EXPIRING_QUERY_SCRIPT = """
+if redis.call('EXISTS', KEYS[1]) == 0 then
+    return false
+end
+local ids = redis.call('ZRANGEBYSCORE', KEYS[1], ARGV[1], ARGV[2], 'LIMIT', 0, tonumber(ARGV[3]))
+if #ids == 0 then
+    return {}
+end
+return redis.call('HMGET', KEYS[2], unpack(ids))
+"""
+
+# KEYS: zset, hash, generation / ARGV: ttl, (id, score, payload) 반복 - score가 빈 문자열이면 삭제
+# 세대 값은 인덱스가 없어도 올림 -> 그 사이에 DB를 읽은 build가 오래된 결과를 저장하지 않음
+# 인덱스가 없으면 그 외에는 아무것도 하지 않음 (다음 조회 때 DB 기준으로 새로 만들어짐)
+EXPIRING_UPDATE_SCRIPT = """
+redis.call('INCR', KEYS[3])
+redis.call('EXPIRE', KEYS[3], ARGV[1])
+if redis.call('EXISTS', KEYS[1]) == 0 then
+    return 0
+end
+for i = 2, #ARGV, 3 do
+    if ARGV[i + 1] == '' then
+        redis.call('ZREM', KEYS[1], ARGV[i])
+        redis.call('HDEL', KEYS[2], ARGV[i])
+    else
+        redis.call('ZADD', KEYS[1], ARGV[i + 1], ARGV[i])
+        redis.call('HSET', KEYS[2], ARGV[i], ARGV[i + 2])
+    end
+end
+redis.call('EXPIRE', KEYS[1], ARGV[1])
+redis.call('EXPIRE', KEYS[2], ARGV[1])
+return 1
+"""
+
+# KEYS: zset, hash, generation / ARGV: DB를 읽기 전의 세대 값, ttl, 표시용 멤버, (id, score, payload) 반복
+# 읽은 뒤에 수정이 있었으면(세대 값이 다르면) 저장하지 않음 -> 0, 저장하면 1
+EXPIRING_BUILD_SCRIPT = """
+if (redis.call('GET', KEYS[3]) or '0') ~= ARGV[1] then
+    return 0
+end
+redis.call('DEL', KEYS[1], KEYS[2])
+redis.call('ZADD', KEYS[1], '+inf', ARGV[3])
+for i = 4, #ARGV, 3 do
+    redis.call('ZADD', KEYS[1], ARGV[i + 1], ARGV[i])
+    redis.call('HSET', KEYS[2], ARGV[i], ARGV[i + 2])
+end
+redis.call('EXPIRE', KEYS[1], ARGV[2])
+redis.call('EXPIRE', KEYS[2], ARGV[2])
+return 1
+"""
+
+EXPIRING_QUERY_SCRIPT_SHA = hashlib.sha1(EXPIRING_QUERY_SCRIPT.encode("UTF-8")).hexdigest()
+EXPIRING_UPDATE_SCRIPT_SHA = hashlib.sha1(EXPIRING_UPDATE_SCRIPT.encode("UTF-8")).hexdigest()
+EXPIRING_BUILD_SCRIPT_SHA = hashlib.sha1(EXPIRING_BUILD_SCRIPT.encode("UTF-8")).hexdigest()
+
+
+@dataclass(frozen=True)
+class ExpiringItem:
+    id: int
+    ingredient_name: str
+    purchase_date: date
+    expiration_date: date
+    storage_type: str | None
+
+
+class ExpiringSoonIndex:
+    """
+    유저별 유통기한 임박 조회용 Redis 인덱스
+    - ZSET `EXPIRING:{user_id}`: member=식재료 id, score=유통기한(date.toordinal)
+    - HASH `EXPIRING_DATA:{user_id}`: 식재료 id -> 응답에 필요한 값(JSON)
+    - 조회는 Lua 한 번(ZRANGEBYSCORE + HMGET)으로 O(log n + m)
+    - 식재료가 바뀔 때마다 update / remove로 반영, 인덱스가 없으면 호출하는 쪽이 DB 결과로 build
+    - STRING `EXPIRING_GEN:{user_id}`: 수정마다 올라가는 세대 값
+      -> DB를 읽기 전에 generation()을 받아 build에 넘기면, 그 사이에 수정이 있었을 때 오래된 결과를 저장하지 않음
+    Redis 오류는 호출하는 쪽에서 DB 조회로 대체할 수 있도록 그대로 올림
+    """
+
+    def __init__(self, redis: Redis, ttl: int = EXPIRING_INDEX_TTL):
+        self.redis = redis
+        self.ttl = ttl
+
+    @staticmethod
+    def _keys(user_id) -> list[str]:
+        return [f"EXPIRING:{user_id}", f"EXPIRING_DATA:{user_id}", f"EXPIRING_GEN:{user_id}"]
+
+    @staticmethod
+    def _encode(item) -> str:
+        return json.dumps(
+            {
+                "id": item.id,
+                "ingredient_name": item.ingredient_name,
+                "purchase_date": item.purchase_date.isoformat(),
+                "expiration_date": item.expiration_date.isoformat(),
+                "storage_type": item.storage_type,
+            },
+            ensure_ascii=False,
+        )
+
+    @staticmethod
+    def _decode(raw: str) -> ExpiringItem:
+        data = json.loads(raw)
+        return ExpiringItem(
+            id=data["id"],
+            ingredient_name=data["ingredient_name"],
+            purchase_date=date.fromisoformat(data["purchase_date"]),
+            expiration_date=date.fromisoformat(data["expiration_date"]),
+            storage_type=data["storage_type"],
+        )
+
+    async def _eval(self, script: str, sha: str, keys: list[str], args: list):
+        try:
+            return await self.redis.evalsha(sha, len(keys), *keys, *args)
+        except NoScriptError:
+            return await self.redis.eval(script, len(keys), *keys, *args)
+
+    async def query(
+        self, user_id, until: date, since: date | None = None, limit: int = 100
+    ) -> list[ExpiringItem] | None:
+        """since ~ until 사이에 유통기한이 끝나는 식재료 (유통기한 순), 인덱스가 없으면 None"""
+        args = [since.toordinal() if since else "-inf", until.toordinal(), limit]
+        values = await self._eval(EXPIRING_QUERY_SCRIPT, EXPIRING_QUERY_SCRIPT_SHA, self._keys(user_id)[:2], args)
+        if values is None:
+            return None
+        return [self._decode(raw) for raw in values if raw]
+
+    async def generation(self, user_id) -> str:
+        """build에 넘길 세대 값 (build할 데이터를 DB에서 읽기 전에 받아야 함)"""
+        return await self.redis.get(self._keys(user_id)[2]) or "0"
+
+    async def build(self, user_id, items: list, generation: str) -> bool:
+        """유통기한이 있는 식재료 전체로 인덱스를 새로 만듦 -> generation 이후 수정이 있었으면 만들지 않고 False"""
+        args = [generation, self.ttl, EXPIRING_SENTINEL]
+        for item in items:
+            args += [str(item.id), item.expiration_date.toordinal(), self._encode(item)]
+        built = await self._eval(EXPIRING_BUILD_SCRIPT, EXPIRING_BUILD_SCRIPT_SHA, self._keys(user_id), args)
+        return bool(built)
+
+    async def update(self, user_id, items: list):
+        """수정된 식재료 반영 (유통기한이 없어진 식재료는 인덱스에서 제거)"""
+        args = [self.ttl]
+        for item in items:
+            if item.expiration_date is None:
+                args += [str(item.id), "", ""]
+            else:
+                args += [str(item.id), item.expiration_date.toordinal(), self._encode(item)]
+
+        if len(args) > 1:
+            await self._eval(EXPIRING_UPDATE_SCRIPT, EXPIRING_UPDATE_SCRIPT_SHA, self._keys(user_id), args)
+
+    async def drop(self, user_id):
+        zset_key, hash_key, generation_key = self._keys(user_id)
+        async with self.redis.pipeline(transaction=True) as pipe:
+            pipe.incr(generation_key)
+            pipe.expire(generation_key, self.ttl)
+            pipe.delete(zset_key, hash_key)
+            await pipe.execute()
+
+    async def remove(self, user_id, ingredient_ids: list[int]):
+        args = [self.ttl]
+        for ingredient_id in ingredient_ids:
+            args += [str(ingredient_id), "", ""]
+
+        if len(args) > 1:
+            await self._eval(EXPIRING_UPDATE_SCRIPT, EXPIRING_UPDATE_SCRIPT_SHA, self._keys(user_id), args)
+
+
+async def main():
+    redis_client = Redis(connection_pool=redis_pool)
+    try:
+        await expiry_cache.invalidate(redis_client)
+        await non_ingredient_index.invalidate(redis_client)
+        print("Reference caches invalidated: ingredients_expiry, non_ingredients")
+    finally:
+        await redis_client.close()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
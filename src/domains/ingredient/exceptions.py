@@ -24,3 +24,8 @@ class NotFoundException(BaseCustomException):
 class InvalidIngredientException(BaseCustomException):
     def __init__(self, detail="등록할 수 없는 식재료가 포함되어 있습니다."):
         super().__init__(status_code=400, detail=detail, code="INVALID_INGREDIENT")
+
+
+class InvalidCursorException(BaseCustomException):
+    def __init__(self, detail="잘못된 페이지 커서입니다."):
+        super().__init__(status_code=400, detail=detail, code="INVALID_CURSOR")
@@ -0,0 +1,141 @@
+"""
+Ingredient 도메인 배치 작업
+
+실행 (src 디렉토리 기준):
+    python -m domains.ingredient.jobs
+"""
+
+import asyncio
+import math
+from datetime import datetime, timedelta, timezone
+
+from sqlalchemy.ext.asyncio import async_sessionmaker
+
+from core.database import async_session_factory, engine
+from domains.ingredient.repository import IngredientRepository
+
+EXPIRY_LEARNING_JOB = "expiry_learning"
+EXPIRY_LEARNING_CHUNK_SIZE = 50_000  # 한 트랜잭션에서 집계할 로그 id 범위
+EXPIRY_LOG_SETTLE_SECONDS = 60 * 5  # 최근 로그는 아직 커밋 중일 수 있으므로 다음 실행에서 처리
+EXPIRY_PROPOSAL_BATCH_SIZE = 500  # 제안 값을 한 번에 계산/저장할 (식재료, 보관 방법) 개수
+EXPIRY_MIN_SAMPLES = 20  # 이보다 적게 모인 식재료는 제안하지 않음
+EXPIRY_TRIM_RATIO = 0.1  # 절사 평균에서 양쪽 끝을 버리는 비율
+
+
+def _value_at(histogram: list[tuple[int, int]], position: int) -> int:
+    seen = 0
+    for day, count in histogram:
+        seen += count
+        if position < seen:
+            return day
+    raise IndexError(position)
+
+
+def robust_stats(histogram: list[tuple[int, int]], trim_ratio: float = EXPIRY_TRIM_RATIO) -> tuple[int, float, float]:
+    """
+    (유통기한 일수, 개수) 히스토그램 -> (표본 수, 중앙값, 절사 평균)
+    히스토그램은 일수 오름차순이어야 함
+    """
+    total = sum(count for _, count in histogram)
+    if total == 0:
+        raise ValueError("empty histogram")
+
+    median = (_value_at(histogram, (total - 1) // 2) + _value_at(histogram, total // 2)) / 2
+
+    # 양쪽 끝 cut개씩 버리고 [low, high) 구간에 들어가는 표본만 평균
+    cut = int(total * trim_ratio)
+    low, high = cut, total - cut
+    weighted_sum = 0
+    start = 0
+    for day, count in histogram:
+        end = start + count
+        weighted_sum += day * max(0, min(end, high) - max(start, low))
+        start = end
+
+    return total, median, weighted_sum / (high - low)
+
+
+async def learn_expiry_days(
+    session_factory: async_sessionmaker = async_session_factory,
+    chunk_size: int = EXPIRY_LEARNING_CHUNK_SIZE,
+    settle_seconds: int = EXPIRY_LOG_SETTLE_SECONDS,
+) -> dict:
+    """
+    유저가 입력한 유통기한(편차 로그)으로 식재료/보관 방법별 expiry_day 제안 값을 계산
+    1. 워터마크 이후의 로그만 id 구간(chunk_size)별로 DB 안에서 집계해 히스토그램에 누적
+    2. 이번에 갱신된 (식재료, 보관 방법)만 히스토그램으로 중앙값/절사 평균 계산
+    3. expiry_day_proposals(staging)에 저장 -> ingredients_expiry 반영은 검토 후 별도로 진행 (반영 후 python -m domains.ingredient.cache)
+    """
+    async with session_factory() as session:
+        repo = IngredientRepository(session)
+
+        start_id = watermark = await repo.get_job_watermark(EXPIRY_LEARNING_JOB)
+        settled_before = datetime.now(timezone.utc) - timedelta(seconds=settle_seconds)
+        until_id = await repo.get_last_deviation_log_id(settled_before)
+
+        touched: set[tuple[str, str]] = set()
+        chunks = 0
+        while watermark < until_id:
+            upper = min(watermark + chunk_size, until_id)
+            keys = await repo.accumulate_expiry_histogram(EXPIRY_LEARNING_JOB, watermark, upper)
+            if keys is None:
+                print("Expiry Learning: 다른 실행이 같은 구간을 처리 중이라 중단합니다.")
+                break
+
+            touched |= keys
+            watermark = upper
+            chunks += 1
+
+        keys = sorted(touched)
+        proposals = 0
+        for i in range(0, len(keys), EXPIRY_PROPOSAL_BATCH_SIZE):
+            batch = keys[i : i + EXPIRY_PROPOSAL_BATCH_SIZE]
+            histograms = await repo.get_expiry_histograms(batch)
+            expiry_infos = await repo.get_expiry_infos(sorted({name for name, _ in batch}))
+
+            rows = []
+            for (name, storage_type), histogram in histograms.items():
+                sample_count, median, trimmed_mean = robust_stats(histogram)
+                if sample_count < EXPIRY_MIN_SAMPLES:
+                    continue
+
+                info = expiry_infos.get(name)
+                rows.append(
+                    {
+                        "ingredient_name": name,
+                        "storage_type": storage_type,
+                        "sample_count": sample_count,
+                        "median_day": median,
+                        "trimmed_mean_day": trimmed_mean,
+                        "current_expiry_day": info.expiry_day if info and info.storage_type == storage_type else None,
+                        "proposed_expiry_day": math.floor(median + 0.5),
+                    }
+                )
+
+            await repo.upsert_expiry_proposals(rows)
+            proposals += len(rows)
+
+    return {
+        "from_id": start_id,
+        "until_id": watermark,
+        "chunks": chunks,
+        "updated_keys": len(touched),
+        "proposals": proposals,
+    }
+
+
+async def main():
+    # 관계(Ingredient.user 등)를 해석할 수 있도록 모든 모델 등록
+    import domains.recipe.models  # noqa: F401
+    import domains.shopping.models  # noqa: F401
+    import domains.user.models  # noqa: F401
+
+    try:
+        result = await learn_expiry_days()
+        print(f"Expiry learning finished: {result}")
+    finally:
+        await engine.dispose()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,145 @@
+"""
+식재료 이름 정규화 / 매칭 인덱스
+
+"두부 2입", "국산 양퍄(특)"처럼 사용자가 입력하거나 영수증에서 읽은 이름에 해당하는
+ingredients_expiry의 이름(canonical)을 찾음. LLM 호출 없이 메모리에서만 처리
+저장되는 이름은 바꾸지 않고 유통기한 조회에만 사용
+"""
+
+import re
+import unicodedata
+from collections import defaultdict
+from typing import Iterable
+
+# 한글 음절 -> 초성/중성/종성 (호환용 자모)
+_CHOSEONG = "ㄱㄲㄴㄷㄸㄹㅁㅂㅃㅅㅆㅇㅈㅉㅊㅋㅌㅍㅎ"
+_JUNGSEONG = "ㅏㅐㅑㅒㅓㅔㅕㅖㅗㅘㅙㅚㅛㅜㅝㅞㅟㅠㅡㅢㅣ"
+_JONGSEONG = " ㄱㄲㄳㄴㄵㄶㄷㄹㄺㄻㄼㄽㄾㄿㅀㅁㅂㅄㅅㅆㅇㅈㅊㅋㅌㅍㅎ"
+_HANGUL_BASE = 0xAC00
+_HANGUL_COUNT = 11172
+
+_UNITS = "kg|mg|ml|g|l|리터|개입|개|입|봉지|봉|팩|병|캔|구|망|단|송이|포기|마리|판|줄|알|통|박스|box|ea|인분|p"
+_BRACKET_PATTERN = re.compile(r"[(\[{<][^)\]}>]*[)\]}>]")
+_QUANTITY_PATTERN = re.compile(rf"[x*×]?\d+(?:[.,]\d+)?\s*(?:{_UNITS})?", re.IGNORECASE)
+_NON_WORD_PATTERN = re.compile(r"[^0-9a-z가-힣]")
+
+FUZZY_MIN_SCORE = 0.7  # 자모 bigram Dice 유사도가 이보다 낮으면 매칭하지 않음
+MATCH_CACHE_SIZE = 10000
+
+
+def normalize_ingredient_name(name: str) -> str:
+    """괄호 내용, 수량/규격, 공백/기호 제거 + 소문자 ("서울우유 1L" -> "서울우유")"""
+    text = unicodedata.normalize("NFC", name).lower()
+    text = _BRACKET_PATTERN.sub(" ", text)
+    text = _QUANTITY_PATTERN.sub(" ", text)
+    return _NON_WORD_PATTERN.sub("", text)
+
+
+def decompose_hangul(text: str) -> str:
+    """한글 음절을 자모로 분해 ("양파" -> "ㅇㅑㅇㅍㅏ"), 한글이 아닌 글자는 그대로"""
+    jamo = []
+    for char in text:
+        code = ord(char) - _HANGUL_BASE
+        if 0 <= code < _HANGUL_COUNT:
+            jamo.append(_CHOSEONG[code // 588])
+            jamo.append(_JUNGSEONG[(code % 588) // 28])
+            if code % 28:
+                jamo.append(_JONGSEONG[code % 28])
+        else:
+            jamo.append(char)
+    return "".join(jamo)
+
+
+def _bigrams(text: str) -> set[str]:
+    jamo = decompose_hangul(text)
+    if len(jamo) < 2:
+        return {jamo}
+    return {jamo[i : i + 2] for i in range(len(jamo) - 1)}
+
+
+class IngredientNameMatcher:
+    """
+    canonical 이름 목록(+ 별칭)으로 만든 매칭 인덱스 (읽기 전용, 목록이 바뀌면 새로 생성)
+    매칭 순서 (부분 문자열로는 매칭하지 않음: "감자칩" -> "감자" X):
+    1. 정규화한 이름이 canonical / 별칭과 같음 ("서울우유" 같은 상품명은 별칭으로 등록)
+    2. 단어 단위로 canonical / 별칭과 같음 (뒤 단어 우선: "국산 쪽파" -> 별칭 "쪽파")
+    3. 글자 수가 같은 canonical과 자모 bigram 유사도 (오타 / OCR 오인식: "양퍄" -> "양파"), 전체 -> 단어 순
+    """
+
+    def __init__(self, canonical_names: Iterable[str], aliases: dict[str, str] | None = None):
+        self._canonical: set[str] = set(canonical_names)
+        self._exact: dict[str, str] = {}
+        self._fuzzy_keys: list[tuple[str, int]] = []  # (canonical, bigram 개수)
+        self._postings: dict[tuple[int, str], list[int]] = defaultdict(list)  # (글자 수, bigram) -> 후보
+        self._cache: dict[str, str | None] = {}
+
+        for name in sorted(self._canonical):
+            key = normalize_ingredient_name(name)
+            if not key or key in self._exact:
+                continue
+            self._exact[key] = name
+
+            grams = _bigrams(key)
+            for gram in grams:
+                self._postings[(len(key), gram)].append(len(self._fuzzy_keys))
+            self._fuzzy_keys.append((name, len(grams)))
+
+        # 별칭은 가리키는 canonical이 있을 때만 등록
+        for alias, name in sorted((aliases or {}).items()):
+            key = normalize_ingredient_name(alias)
+            if key and name in self._canonical:
+                self._exact.setdefault(key, name)
+
+    def __len__(self) -> int:
+        return len(self._canonical)
+
+    def _match_fuzzy(self, key: str) -> str | None:
+        grams = _bigrams(key)
+        shared: dict[int, int] = defaultdict(int)
+        for gram in grams:
+            for idx in self._postings.get((len(key), gram), ()):
+                shared[idx] += 1
+
+        best, best_score = None, FUZZY_MIN_SCORE
+        for idx, count in shared.items():
+            name, size = self._fuzzy_keys[idx]
+            score = 2 * count / (len(grams) + size)
+            if score > best_score or (score == best_score and best is not None and name < best):
+                best, best_score = name, score
+        return best
+
+    def _match(self, name: str) -> str | None:
+        key = normalize_ingredient_name(name)
+        if not key:
+            return None
+        if key in self._exact:
+            return self._exact[key]
+
+        words = [word for word in (normalize_ingredient_name(word) for word in reversed(name.split())) if word]
+        if len(words) > 1:
+            for word in words:
+                if word in self._exact:
+                    return self._exact[word]
+
+        for candidate in [key, *words] if len(words) > 1 else [key]:
+            match = self._match_fuzzy(candidate)
+            if match:
+                return match
+        return None
+
+    def resolve(self, name: str) -> str | None:
+        """canonical 이름, 매칭되지 않으면 None"""
+        if name in self._canonical:
+            return name
+        if name in self._cache:
+            return self._cache[name]
+
+        result = self._match(name)
+        if len(self._cache) >= MATCH_CACHE_SIZE:
+            self._cache.clear()
+        self._cache[name] = result
+        return result
+
+    def canonicalize(self, names: list[str]) -> list[str]:
+        """매칭되는 이름은 canonical로 바꾸고 나머지는 그대로 (순서 유지)"""
+        return [self.resolve(name) or name for name in names]
@@ -1,10 +1,17 @@
-from sqlalchemy import Column, BigInteger, String, Date, ForeignKey, DateTime, Integer
+from sqlalchemy import Column, BigInteger, String, Date, ForeignKey, DateTime, Integer, Float, Index, literal_column
 from sqlalchemy.types import Uuid
 from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
 
 from core.database import Base
 
+# 유통기한 정렬에서 NULL(미분류)을 맨 뒤로 보내기 위한 값 -> 정렬/커서/인덱스 모두 같은 식을 사용해야 함
+INFINITY_DATE = literal_column("'infinity'::date", Date)
+
+
+def expiration_sort_key(expiration_date):
+    return func.coalesce(expiration_date, INFINITY_DATE)
+
 
 class Ingredient(Base):
     __tablename__ = "ingredients"
@@ -21,6 +28,44 @@ class Ingredient(Base):
     user = relationship("User", back_populates="ingredients")
     compartment = relationship("Compartment", back_populates="ingredients")
 
+    # 모든 조회가 user_id + deleted_at IS NULL 조건이므로 삭제되지 않은 행만 담는 부분 인덱스 사용
+    # 운영 DB 반영: python -m core.indexes
+    __table_args__ = (
+        # 보관 장소 필터 / 미분류(storage_type IS NULL) 조회
+        Index("ix_ingredients_user_storage_active", user_id, storage_type, postgresql_where=deleted_at.is_(None)),
+        # 냉장고 칸별 / 칸 미배정 조회 (purchase_date 정렬까지 인덱스로 처리)
+        Index(
+            "ix_ingredients_user_compartment_active",
+            user_id,
+            compartment_id,
+            purchase_date,
+            postgresql_where=deleted_at.is_(None),
+        ),
+        # 유통기한 미입력(expiration_date IS NULL) / 유통기한 범위 조회
+        Index(
+            "ix_ingredients_user_expiration_date_active",
+            user_id,
+            expiration_date,
+            postgresql_where=deleted_at.is_(None),
+        ),
+        # 목록 페이지네이션(keyset) 정렬용
+        Index(
+            "ix_ingredients_user_expiration_active",
+            user_id,
+            expiration_sort_key(expiration_date),
+            id,
+            postgresql_where=deleted_at.is_(None),
+        ),
+        Index(
+            "ix_ingredients_user_purchase_active",
+            user_id,
+            purchase_date,
+            id,
+            postgresql_where=deleted_at.is_(None),
+        ),
+        Index("ix_ingredients_user_id_active", user_id, id, postgresql_where=deleted_at.is_(None)),
+    )
+
 
 class IngredientExpiry(Base):
     __tablename__ = "ingredients_expiry"
@@ -37,11 +82,54 @@ class ExpiryDeviationLog(Base):
     ingredient_name = Column(String(45), nullable=False)
     deviation_day = Column(Integer, nullable=False)
     storage_type = Column(String(10), nullable=False)
+    # 유저가 입력한 유통기한 일수 (구매일 기준) -> 유통기한 학습에 사용, 이전에 쌓인 로그는 NULL
+    observed_day = Column(Integer, nullable=True)
     created_at = Column(DateTime(timezone=True), server_default=func.now(), nullable=False)
 
     user = relationship("User", back_populates="expiry_deviation_logs")
 
 
+class IngredientAlias(Base):
+    """식재료 별칭 -> ingredients_expiry의 이름 (예: "계란" -> "달걀"), 이름 매칭 인덱스에서 사용"""
+
+    __tablename__ = "ingredient_aliases"
+    alias = Column(String(45), primary_key=True)
+    ingredient_name = Column(String(45), nullable=False)
+
+
+class ExpiryDayHistogram(Base):
+    """편차 로그를 (식재료, 보관 방법, 유통기한 일수)별 개수로 누적한 집계 (유통기한 학습 배치가 갱신)"""
+
+    __tablename__ = "expiry_day_histograms"
+    ingredient_name = Column(String(45), primary_key=True)
+    storage_type = Column(String(10), primary_key=True)
+    observed_day = Column(Integer, primary_key=True)
+    sample_count = Column(BigInteger, nullable=False)
+
+
+class ExpiryDayProposal(Base):
+    """유통기한 학습 결과 -> 검토 후 ingredients_expiry에 반영할 제안 값 (staging)"""
+
+    __tablename__ = "expiry_day_proposals"
+    ingredient_name = Column(String(45), primary_key=True)
+    storage_type = Column(String(10), primary_key=True)
+    sample_count = Column(BigInteger, nullable=False)
+    median_day = Column(Float, nullable=False)
+    trimmed_mean_day = Column(Float, nullable=False)
+    current_expiry_day = Column(Integer, nullable=True)  # 같은 보관 방법의 현재 expiry_day (없으면 NULL)
+    proposed_expiry_day = Column(Integer, nullable=False)
+    updated_at = Column(DateTime(timezone=True), server_default=func.now(), nullable=False)
+
+
+class BatchJobWatermark(Base):
+    """배치 작업별로 마지막으로 처리한 로그 id (다음 실행은 그 이후 행만 읽음)"""
+
+    __tablename__ = "batch_job_watermarks"
+    job_name = Column(String(50), primary_key=True)
+    last_id = Column(BigInteger, nullable=False)
+    updated_at = Column(DateTime(timezone=True), server_default=func.now(), nullable=False)
+
+
 class MissingIngredientLog(Base):
     __tablename__ = "missing_ingredients_logs"
     id = Column(BigInteger, primary_key=True, index=True)
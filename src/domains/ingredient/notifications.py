@@ -0,0 +1,304 @@
+"""
+유통기한 임박 알림 엔진 / 스케줄러
+
+수동 실행 (src 디렉토리 기준, 스케줄러 잠금 없이 오늘 알림을 바로 보냄):
+    python -m domains.ingredient.notifications
+"""
+
+import asyncio
+import hashlib
+import time
+import uuid
+from collections import deque
+from dataclasses import dataclass, field
+from datetime import date, datetime, timedelta
+from typing import Protocol
+
+from redis.asyncio import Redis
+from redis.exceptions import NoScriptError
+from sqlalchemy.ext.asyncio import async_sessionmaker
+
+from core.config import settings
+from core.database import async_session_factory, engine, redis_pool
+from domains.ingredient.repository import IngredientRepository
+
+NOTIFICATION_SCAN_BATCH_SIZE = 5000  # keyset 스캔 한 번에 읽을 행 수
+NOTIFICATION_SEND_CONCURRENCY = 50  # sink로 동시에 보내는 유저 수
+NOTIFICATION_DEDUPE_TTL = 60 * 60 * 24 * 3  # 같은 알림을 다시 보내지 않도록 기억하는 시간
+NOTIFICATION_LOCK_TTL = 60 * 60 * 12  # 하루 한 번만 실행되도록 잡는 잠금 (여러 인스턴스 대비)
+
+# KEYS: 알림 키들 / ARGV: ttl -> 처음 보는(이번에 저장된) 키의 1부터 시작하는 인덱스 목록
+DEDUPE_SCRIPT = """
+local fresh = {}
+for i, key in ipairs(KEYS) do
+    if redis.call('SET', key, '1', 'NX', 'EX', ARGV[1]) then
+        fresh[#fresh + 1] = i
+    end
+end
+return fresh
+"""
+DEDUPE_SCRIPT_SHA = hashlib.sha1(DEDUPE_SCRIPT.encode("UTF-8")).hexdigest()
+
+
+@dataclass(frozen=True)
+class ExpiryAlert:
+    ingredient_id: int
+    ingredient_name: str
+    expiration_date: date
+    days_left: int
+    storage_type: str | None
+
+
+@dataclass(frozen=True)
+class ExpiryNotification:
+    user_id: uuid.UUID
+    alerts: tuple[ExpiryAlert, ...]
+
+    @property
+    def message(self) -> str:
+        first = min(self.alerts, key=lambda alert: (alert.days_left, alert.ingredient_id))
+        when = {0: "오늘", 1: "내일"}.get(first.days_left, f"{first.days_left}일 뒤")
+        name = (
+            first.ingredient_name if len(self.alerts) == 1 else f"{first.ingredient_name} 외 {len(self.alerts) - 1}개"
+        )
+        return f"{name}의 유통기한이 {when} 끝나요."
+
+
+class NotificationSink(Protocol):
+    async def send(self, notification: ExpiryNotification) -> None: ...
+
+
+class LocalNotificationSink:
+    """푸시 연동 전까지 쓰는 로컬 sink -> 보낸 알림을 최근 max_kept개만 메모리에 보관 (테스트/개발용)"""
+
+    def __init__(self, max_kept: int = 1000):
+        self.sent: deque[ExpiryNotification] = deque(maxlen=max_kept)
+
+    async def send(self, notification: ExpiryNotification) -> None:
+        self.sent.append(notification)
+
+
+@dataclass
+class NotificationRunMetrics:
+    run_date: date
+    scheduled_at: datetime | None = None
+    started_at: datetime = field(default_factory=datetime.now)
+    finished_at: datetime | None = None
+    batches: int = 0
+    scanned_rows: int = 0
+    users_notified: int = 0
+    alerts_sent: int = 0
+    alerts_deduplicated: int = 0
+    sink_errors: int = 0
+    max_batch_seconds: float = 0.0
+
+    def stats(self) -> dict:
+        duration = ((self.finished_at or datetime.now()) - self.started_at).total_seconds()
+        return {
+            "run_date": self.run_date.isoformat(),
+            "finished": self.finished_at is not None,
+            # 예정 시각보다 얼마나 늦게 시작했는지
+            "schedule_lag_seconds": (
+                round((self.started_at - self.scheduled_at).total_seconds(), 3) if self.scheduled_at else None
+            ),
+            "duration_seconds": round(duration, 3),
+            "batches": self.batches,
+            "scanned_rows": self.scanned_rows,
+            "rows_per_second": round(self.scanned_rows / duration, 1) if duration else None,
+            "users_notified": self.users_notified,
+            "alerts_sent": self.alerts_sent,
+            "alerts_deduplicated": self.alerts_deduplicated,
+            "sink_errors": self.sink_errors,
+            "max_batch_seconds": round(self.max_batch_seconds, 3),
+        }
+
+
+class ExpiryNotificationEngine:
+    """
+    전체 유저의 유통기한 임박 식재료를 배치로 훑어서 유저별 알림 하나씩 sink로 전달
+    - (user_id, id) keyset 스캔, 배치 경계에 걸친 유저는 다음 배치로 넘겨서 알림을 한 번에 묶음
+    - 다음 배치 조회와 현재 배치 전송을 겹쳐서 실행
+    - Redis(SET NX, Lua 한 번)로 이미 보낸 알림 제외, 전송 실패한 유저는 키를 지워 다음 실행에서 다시 시도
+    """
+
+    def __init__(
+        self,
+        redis: Redis,
+        sink: NotificationSink,
+        session_factory: async_sessionmaker = async_session_factory,
+        batch_size: int = NOTIFICATION_SCAN_BATCH_SIZE,
+        concurrency: int = NOTIFICATION_SEND_CONCURRENCY,
+        days_ahead: int = settings.EXPIRY_NOTIFICATION_DAYS,
+    ):
+        self.redis = redis
+        self.sink = sink
+        self.session_factory = session_factory
+        self.batch_size = batch_size
+        self.concurrency = concurrency
+        self.days_ahead = days_ahead
+
+    @staticmethod
+    def _dedupe_key(user_id, alert: ExpiryAlert) -> str:
+        # 남은 일수까지 키에 넣어서 "내일"과 "오늘" 알림은 각각 한 번씩 보냄
+        return f"NOTI:EXPIRY:{user_id}:{alert.ingredient_id}:{alert.expiration_date.isoformat()}:{alert.days_left}"
+
+    async def _dedupe(self, keys: list[str]) -> list[int]:
+        if not keys:
+            return []
+        try:
+            fresh = await self.redis.evalsha(DEDUPE_SCRIPT_SHA, len(keys), *keys, NOTIFICATION_DEDUPE_TTL)
+        except NoScriptError:
+            fresh = await self.redis.eval(DEDUPE_SCRIPT, len(keys), *keys, NOTIFICATION_DEDUPE_TTL)
+        return [int(i) - 1 for i in fresh]
+
+    async def _dispatch(self, rows: list, today: date, metrics: NotificationRunMetrics):
+        pending = [
+            (
+                row.user_id,
+                ExpiryAlert(
+                    ingredient_id=row.id,
+                    ingredient_name=row.ingredient_name,
+                    expiration_date=row.expiration_date,
+                    days_left=(row.expiration_date - today).days,
+                    storage_type=row.storage_type,
+                ),
+            )
+            for row in rows
+        ]
+        keys = [self._dedupe_key(user_id, alert) for user_id, alert in pending]
+        fresh = await self._dedupe(keys)
+        metrics.alerts_deduplicated += len(pending) - len(fresh)
+
+        by_user: dict = {}
+        for i in fresh:
+            user_id, alert = pending[i]
+            by_user.setdefault(user_id, []).append((alert, keys[i]))
+
+        semaphore = asyncio.Semaphore(self.concurrency)
+
+        async def send(user_id, items: list[tuple[ExpiryAlert, str]]):
+            async with semaphore:
+                try:
+                    await self.sink.send(ExpiryNotification(user_id=user_id, alerts=tuple(a for a, _ in items)))
+                except Exception as e:
+                    print(f"Expiry Notification Send Error ({user_id}): {e}")
+                    metrics.sink_errors += 1
+                    await self.redis.delete(*(key for _, key in items))
+                    return
+
+                metrics.users_notified += 1
+                metrics.alerts_sent += len(items)
+
+        await asyncio.gather(*(send(user_id, items) for user_id, items in by_user.items()))
+
+    async def run(
+        self, today: date | None = None, metrics: NotificationRunMetrics | None = None
+    ) -> NotificationRunMetrics:
+        """metrics를 넘기면 실행 중에도 진행 상황을 볼 수 있음"""
+        today = today or date.today()
+        until = today + timedelta(days=self.days_ahead)
+        metrics = metrics or NotificationRunMetrics(run_date=today)
+
+        async with self.session_factory() as session:
+            repo = IngredientRepository(session)
+            carry: list = []
+            next_batch = asyncio.create_task(repo.scan_expiring_ingredients(today, until, None, self.batch_size))
+
+            while True:
+                batch_started = time.perf_counter()
+                rows = await next_batch
+                metrics.batches += 1
+                metrics.scanned_rows += len(rows)
+                is_last = len(rows) < self.batch_size
+
+                if not is_last:
+                    # 다음 배치를 미리 조회해 두고 그동안 현재 배치를 전송
+                    after = (rows[-1].user_id, rows[-1].id)
+                    next_batch = asyncio.create_task(
+                        repo.scan_expiring_ingredients(today, until, after, self.batch_size)
+                    )
+
+                rows = carry + rows
+                carry = []
+                if not is_last and rows:
+                    # 마지막 유저는 다음 배치에 식재료가 더 있을 수 있으므로 넘김
+                    split = len(rows)
+                    while split > 0 and rows[split - 1].user_id == rows[-1].user_id:
+                        split -= 1
+                    rows, carry = rows[:split], rows[split:]
+
+                try:
+                    await self._dispatch(rows, today, metrics)
+                except BaseException:
+                    if not is_last:
+                        next_batch.cancel()
+                    raise
+
+                metrics.max_batch_seconds = max(metrics.max_batch_seconds, time.perf_counter() - batch_started)
+                if is_last:
+                    break
+
+        metrics.finished_at = datetime.now()
+        return metrics
+
+
+def next_run_at(now: datetime, hour: int = settings.EXPIRY_NOTIFICATION_HOUR) -> datetime:
+    run_at = now.replace(hour=hour, minute=0, second=0, microsecond=0)
+    return run_at if run_at > now else run_at + timedelta(days=1)
+
+
+class ExpiryNotificationScheduler:
+    """
+    매일 정해진 시각에 알림 엔진 실행 (FastAPI lifespan에서 run_forever를 백그라운드로 실행)
+    여러 인스턴스가 떠 있어도 Redis 잠금으로 날짜별 한 번만 실행
+    """
+
+    def __init__(self, sink: NotificationSink, hour: int = settings.EXPIRY_NOTIFICATION_HOUR):
+        self.sink = sink
+        self.hour = hour
+        self.last_run: NotificationRunMetrics | None = None
+
+    async def run_once(self, redis: Redis, scheduled_at: datetime | None = None) -> NotificationRunMetrics | None:
+        run_date = (scheduled_at or datetime.now()).date()
+        lock_key = f"LOCK:expiry_notifications:{run_date.isoformat()}"
+        if not await redis.set(lock_key, "1", nx=True, ex=NOTIFICATION_LOCK_TTL):
+            return None  # 다른 인스턴스가 이미 실행
+
+        self.last_run = NotificationRunMetrics(run_date=run_date, scheduled_at=scheduled_at)
+        return await ExpiryNotificationEngine(redis, self.sink).run(run_date, self.last_run)
+
+    async def run_forever(self, redis: Redis):
+        while True:
+            scheduled_at = next_run_at(datetime.now(), self.hour)
+            await asyncio.sleep((scheduled_at - datetime.now()).total_seconds())
+            try:
+                result = await self.run_once(redis, scheduled_at)
+                if result:
+                    print(f"Expiry notifications finished: {result.stats()}")
+            except Exception as e:
+                print(f"Expiry Notification Run Error: {e}")
+
+    def stats(self) -> dict | None:
+        return self.last_run.stats() if self.last_run else None
+
+
+expiry_notification_scheduler = ExpiryNotificationScheduler(LocalNotificationSink())
+
+
+async def main():
+    # 관계(Ingredient.user 등)를 해석할 수 있도록 모든 모델 등록
+    import domains.recipe.models  # noqa: F401
+    import domains.shopping.models  # noqa: F401
+    import domains.user.models  # noqa: F401
+
+    redis_client = Redis(connection_pool=redis_pool)
+    try:
+        metrics = await ExpiryNotificationEngine(redis_client, LocalNotificationSink()).run()
+        print(f"Expiry notifications finished: {metrics.stats()}")
+    finally:
+        await redis_client.close()
+        await engine.dispose()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
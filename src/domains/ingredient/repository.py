@@ -1,16 +1,24 @@
 from sqlalchemy.exc import SQLAlchemyError
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, update, exists
+from sqlalchemy import select, insert, update, exists, func, tuple_, bindparam, literal, Row
+from sqlalchemy.dialects.postgresql import ARRAY, insert as pg_insert
+from sqlalchemy.types import String, Date
 from datetime import datetime, timezone, date
 
 from core.exception.exceptions import DatabaseException
 from domains.ingredient.models import (
     Ingredient,
     IngredientExpiry,
-    MissingIngredientLog,
+    IngredientAlias,
     ExpiryDeviationLog,
+    ExpiryDayHistogram,
+    ExpiryDayProposal,
+    BatchJobWatermark,
     NonIngredient,
+    INFINITY_DATE,
+    expiration_sort_key,
 )
+from domains.ingredient.schemas import IngredientOrder
 from domains.refrigerator.models import Compartment, Refrigerator
 
 
@@ -31,22 +39,19 @@ class IngredientRepository:
         except SQLAlchemyError as e:
             raise DatabaseException(detail=f"유통기한 데이터 조회 실패: {str(e)}")
 
-    async def add_missing_logs(self, logs: list[MissingIngredientLog]):
+    async def get_all_expiry_infos(self) -> list[IngredientExpiry]:
         try:
-            if logs:
-                self.session.add_all(logs)
-                await self.session.commit()
+            result = await self.session.execute(select(IngredientExpiry))
+            return result.scalars().all()
         except SQLAlchemyError as e:
-            await self.session.rollback()
-            raise DatabaseException(detail=f"누락 로그 저장 실패: {str(e)}")
+            raise DatabaseException(detail=f"유통기한 데이터 전체 조회 실패: {str(e)}")
 
-    async def add_deviation_log(self, log: ExpiryDeviationLog):
+    async def get_all_ingredient_aliases(self) -> dict[str, str]:
         try:
-            self.session.add(log)
-            await self.session.commit()
+            result = await self.session.execute(select(IngredientAlias.alias, IngredientAlias.ingredient_name))
+            return {row.alias: row.ingredient_name for row in result.all()}
         except SQLAlchemyError as e:
-            await self.session.rollback()
-            raise DatabaseException(detail=f"편차 로그 저장 실패: {str(e)}")
+            raise DatabaseException(detail=f"식재료 별칭 전체 조회 실패: {str(e)}")
 
     async def add_ingredients(self, ingredients: list[Ingredient]) -> list[Ingredient]:
         try:
@@ -57,6 +62,89 @@ class IngredientRepository:
             await self.session.rollback()
             raise DatabaseException(detail=f"식재료 일괄 저장 중 오류 발생: {str(e)}")
 
+    async def bulk_add_ingredients(
+        self,
+        user_id: str,
+        ingredient_names: list[str],
+        purchase_date: date,
+        exclude_non_ingredients: bool = True,
+        expiry_names: list[str] | None = None,
+    ) -> list[Row]:
+        """
+        식재료 일괄 추가를 INSERT ... RETURNING 한 번으로 처리
+        - 제외 식재료(non_ingredients)는 CTE에서 걸러서 저장하지 않음
+          (호출하는 쪽에서 이미 걸렀으면 exclude_non_ingredients=False로 확인 생략)
+        - 자동 입력 가능 여부(ingredients_expiry 존재)도 같은 문장에서 계산
+          expiry_names: 이름마다 ingredients_expiry에서 찾을 이름 (같은 순서, 없으면 입력 이름 그대로)
+        - 반환: 입력 순서대로 저장된 행 (id, ingredient_name, purchase_date, expiration_date,
+          storage_type, is_auto_fillable) / 전부 제외 식재료면 빈 리스트 (아무것도 저장하지 않음)
+        """
+        if not ingredient_names:
+            return []
+
+        # 이름 목록을 배열로 바인딩 -> 개수와 상관없이 SQL 문장이 같아서 prepared statement 재사용
+        names = (
+            func.unnest(
+                bindparam("names", ingredient_names, type_=ARRAY(String)),
+                bindparam("expiry_names", expiry_names or ingredient_names, type_=ARRAY(String)),
+            )
+            .table_valued("name", "expiry_name", with_ordinality="ord")
+            .render_derived()
+        )
+
+        valid = select(names.c.ord, names.c.name, names.c.expiry_name)
+        if exclude_non_ingredients:
+            valid = valid.where(~exists().where(NonIngredient.ingredient_name == names.c.name))
+        valid = valid.cte("valid")
+
+        inserted = (
+            insert(Ingredient)
+            .from_select(
+                ["user_id", "ingredient_name", "purchase_date"],
+                select(literal(user_id, Ingredient.user_id.type), valid.c.name, literal(purchase_date, Date)).order_by(
+                    valid.c.ord
+                ),
+            )
+            .returning(
+                Ingredient.id,
+                Ingredient.ingredient_name,
+                Ingredient.purchase_date,
+                Ingredient.expiration_date,
+                Ingredient.storage_type,
+            )
+            .cte("inserted")
+        )
+
+        stmt = select(
+            inserted.c.id,
+            inserted.c.ingredient_name,
+            inserted.c.purchase_date,
+            inserted.c.expiration_date,
+            inserted.c.storage_type,
+            exists()
+            .where(valid.c.name == inserted.c.ingredient_name, IngredientExpiry.ingredient_name == valid.c.expiry_name)
+            .label("is_auto_fillable"),
+        ).order_by(inserted.c.id)
+
+        try:
+            result = await self.session.execute(stmt)
+            rows = result.all()
+            if rows:
+                await self.session.commit()
+            else:
+                await self.session.rollback()
+            return rows
+        except SQLAlchemyError as e:
+            await self.session.rollback()
+            raise DatabaseException(detail=f"식재료 일괄 저장 중 오류 발생: {str(e)}")
+
+    async def get_all_non_ingredient_names(self) -> list[str]:
+        try:
+            result = await self.session.execute(select(NonIngredient.ingredient_name))
+            return result.scalars().all()
+        except SQLAlchemyError as e:
+            raise DatabaseException(detail=f"제외 식재료 전체 조회 실패: {str(e)}")
+
     async def get_existing_non_ingredients(self, ingredient_names: list[str]) -> list[str]:
         try:
             stmt = select(NonIngredient.ingredient_name).where(NonIngredient.ingredient_name.in_(ingredient_names))
@@ -81,29 +169,229 @@ class IngredientRepository:
             await self.session.rollback()
             raise DatabaseException(detail=f"식재료 수정 중 오류 발생: {str(e)}")
 
+    @staticmethod
+    def _auto_fill_targets(stmt, user_id: str, ingredient_ids: list[int] | None, only_unclassified: bool):
+        stmt = stmt.where(Ingredient.user_id == user_id, Ingredient.deleted_at.is_(None))
+        if ingredient_ids:
+            stmt = stmt.where(Ingredient.id.in_(ingredient_ids))
+        if only_unclassified:
+            stmt = stmt.where(Ingredient.expiration_date.is_(None), Ingredient.storage_type.is_(None))
+        return stmt
+
+    async def get_auto_fill_target_names(
+        self, user_id: str, ingredient_ids: list[int] | None = None, only_unclassified: bool = False
+    ) -> list[str]:
+        """bulk_auto_fill 대상 식재료의 이름 목록 (중복 제거)"""
+        try:
+            stmt = self._auto_fill_targets(
+                select(Ingredient.ingredient_name).distinct(), user_id, ingredient_ids, only_unclassified
+            )
+            result = await self.session.execute(stmt)
+            return result.scalars().all()
+        except SQLAlchemyError as e:
+            raise DatabaseException(detail=f"식재료 조회 중 오류 발생: {str(e)}")
+
+    async def bulk_auto_fill(
+        self,
+        user_id: str,
+        ingredient_ids: list[int] | None = None,
+        only_unclassified: bool = False,
+        expiry_names: dict[str, str] | None = None,
+    ) -> list[Row]:
+        """
+        ingredients_expiry 기준 유통기한/보관방법 자동 채우기를 UPDATE ... FROM 한 문장으로 처리
+        - ingredient_ids: 해당 식재료만 / only_unclassified: 유통기한과 보관방법이 모두 없는 식재료 전체
+        - expiry_names: 식재료 이름 -> ingredients_expiry에서 찾을 이름 (없는 이름은 그대로 찾음)
+        - 자동 입력 데이터가 없는 식재료는 건드리지 않음
+        - 반환: 수정된 행 (id 순)
+        """
+        # 같은 이름의 참조 데이터가 여러 개면 id가 가장 작은 것 하나만 사용 (UPDATE ... FROM이 여러 행과 매칭되지 않도록)
+        expiry = (
+            select(IngredientExpiry.ingredient_name, IngredientExpiry.expiry_day, IngredientExpiry.storage_type)
+            .where(
+                # DISTINCT ON 대신 이름별 최소 id (select().distinct(*cols)는 SQLAlchemy 2.1에서 deprecated,
+                # 대체인 postgresql.distinct_on은 2.0에 없음)
+                IngredientExpiry.id.in_(
+                    select(func.min(IngredientExpiry.id)).group_by(IngredientExpiry.ingredient_name)
+                )
+            )
+            .subquery("expiry")
+        )
+
+        lookup_name = Ingredient.ingredient_name
+        if expiry_names:
+            mapping = (
+                func.unnest(
+                    bindparam("mapped_names", list(expiry_names), type_=ARRAY(String)),
+                    bindparam("mapped_expiry_names", list(expiry_names.values()), type_=ARRAY(String)),
+                )
+                .table_valued("name", "expiry_name")
+                .render_derived()
+            )
+            lookup_name = func.coalesce(
+                select(mapping.c.expiry_name).where(mapping.c.name == Ingredient.ingredient_name).scalar_subquery(),
+                Ingredient.ingredient_name,
+            )
+
+        stmt = (
+            update(Ingredient)
+            .where(lookup_name == expiry.c.ingredient_name)
+            .values(
+                expiration_date=Ingredient.purchase_date + expiry.c.expiry_day,
+                storage_type=expiry.c.storage_type,
+            )
+            .returning(
+                Ingredient.id,
+                Ingredient.ingredient_name,
+                Ingredient.purchase_date,
+                Ingredient.expiration_date,
+                Ingredient.storage_type,
+            )
+            .execution_options(synchronize_session=False)
+        )
+        stmt = self._auto_fill_targets(stmt, user_id, ingredient_ids, only_unclassified)
+
+        try:
+            result = await self.session.execute(stmt)
+            rows = sorted(result.all(), key=lambda row: row.id)
+            await self.session.commit()
+            return rows
+        except SQLAlchemyError as e:
+            await self.session.rollback()
+            raise DatabaseException(detail=f"식재료 자동 채우기 중 오류 발생: {str(e)}")
+
+    @staticmethod
+    def _filter_ingredients(stmt, user_id: str, storage: str | None, is_unclassified: bool | None):
+        stmt = stmt.where(
+            Ingredient.user_id == user_id,
+            Ingredient.deleted_at.is_(None),
+        )
+        if is_unclassified:
+            stmt = stmt.where(
+                Ingredient.expiration_date.is_(None),
+                Ingredient.storage_type.is_(None),
+            )
+        elif storage:
+            stmt = stmt.where(Ingredient.storage_type == storage)
+        return stmt
+
     async def get_ingredients(
         self,
         user_id: str,
         storage: str | None = None,
         is_unclassified: bool | None = None,
     ) -> list[Ingredient]:
+        try:
+            stmt = self._filter_ingredients(select(Ingredient), user_id, storage, is_unclassified)
+
+            result = await self.session.execute(stmt)
+            return result.scalars().all()
+        except SQLAlchemyError as e:
+            raise DatabaseException(detail=f"식재료 목록 조회 실패: {str(e)}")
+
+    async def get_ingredients_page(
+        self,
+        user_id: str,
+        order_by: IngredientOrder,
+        limit: int,
+        after: tuple[date | None, int] | None = None,
+        storage: str | None = None,
+        is_unclassified: bool | None = None,
+    ) -> list[Ingredient]:
+        """
+        (정렬 값, id) 기준 keyset 페이지네이션 -> after 다음 행부터 limit개
+        정렬 식은 models의 인덱스 식과 같아야 인덱스를 타고 바로 다음 위치로 이동함
+        """
+        if order_by == IngredientOrder.EXPIRATION_DATE:
+            sort_key = expiration_sort_key(Ingredient.expiration_date)
+        elif order_by == IngredientOrder.PURCHASE_DATE:
+            sort_key = Ingredient.purchase_date
+        else:
+            sort_key = None
+
+        try:
+            stmt = self._filter_ingredients(select(Ingredient), user_id, storage, is_unclassified)
+
+            if sort_key is None:
+                if after:
+                    stmt = stmt.where(Ingredient.id > after[1])
+                stmt = stmt.order_by(Ingredient.id)
+            else:
+                if after:
+                    value, last_id = after
+                    # 유통기한이 없는(NULL) 행의 커서는 infinity로 비교
+                    if value is None:
+                        value = INFINITY_DATE
+                    stmt = stmt.where(tuple_(sort_key, Ingredient.id) > tuple_(value, last_id))
+                stmt = stmt.order_by(sort_key, Ingredient.id)
+
+            result = await self.session.execute(stmt.limit(limit))
+            return result.scalars().all()
+        except SQLAlchemyError as e:
+            raise DatabaseException(detail=f"식재료 목록 조회 실패: {str(e)}")
+
+    async def count_ingredients(
+        self,
+        user_id: str,
+        storage: str | None = None,
+        is_unclassified: bool | None = None,
+    ) -> int:
+        try:
+            stmt = self._filter_ingredients(select(func.count(Ingredient.id)), user_id, storage, is_unclassified)
+            result = await self.session.execute(stmt)
+            return result.scalar_one()
+        except SQLAlchemyError as e:
+            raise DatabaseException(detail=f"식재료 개수 조회 실패: {str(e)}")
+
+    async def get_expiring_ingredients(
+        self, user_id: str, until: date, since: date | None = None, limit: int | None = None
+    ) -> list[Ingredient]:
+        """since ~ until 사이에 유통기한이 끝나는 식재료 (유통기한 순) -> (user_id, expiration_date) 인덱스 범위 조회"""
         try:
             stmt = select(Ingredient).where(
                 Ingredient.user_id == user_id,
                 Ingredient.deleted_at.is_(None),
+                Ingredient.expiration_date <= until,
             )
-            if is_unclassified:
-                stmt = stmt.where(
-                    Ingredient.expiration_date.is_(None),
-                    Ingredient.storage_type.is_(None),
-                )
-            elif storage:
-                stmt = stmt.where(Ingredient.storage_type == storage)
+            if since:
+                stmt = stmt.where(Ingredient.expiration_date >= since)
+            stmt = stmt.order_by(Ingredient.expiration_date, Ingredient.id)
+            if limit:
+                stmt = stmt.limit(limit)
 
             result = await self.session.execute(stmt)
             return result.scalars().all()
         except SQLAlchemyError as e:
-            raise DatabaseException(detail=f"식재료 목록 조회 실패: {str(e)}")
+            raise DatabaseException(detail=f"유통기한 임박 식재료 조회 실패: {str(e)}")
+
+    async def scan_expiring_ingredients(
+        self, since: date, until: date, after: tuple | None = None, limit: int = 5000
+    ) -> list[Row]:
+        """
+        전체 유저 대상 유통기한 임박 식재료 keyset 스캔 (알림 배치용)
+        - (user_id, id) 순서라 같은 유저의 식재료가 연속으로 나옴, after 다음 행부터 limit개
+        - ORM 객체 대신 필요한 컬럼만 조회
+        """
+        try:
+            stmt = select(
+                Ingredient.id,
+                Ingredient.user_id,
+                Ingredient.ingredient_name,
+                Ingredient.expiration_date,
+                Ingredient.storage_type,
+            ).where(
+                Ingredient.deleted_at.is_(None),
+                Ingredient.expiration_date >= since,
+                Ingredient.expiration_date <= until,
+            )
+            if after:
+                stmt = stmt.where(tuple_(Ingredient.user_id, Ingredient.id) > tuple_(*after))
+            stmt = stmt.order_by(Ingredient.user_id, Ingredient.id).limit(limit)
+
+            result = await self.session.execute(stmt)
+            return result.all()
+        except SQLAlchemyError as e:
+            raise DatabaseException(detail=f"유통기한 임박 식재료 스캔 실패: {str(e)}")
 
     async def get_ingredient(self, ingredient_id: int, user_id: str) -> Ingredient | None:
         stmt = select(Ingredient).where(
@@ -208,3 +496,141 @@ class IngredientRepository:
         result = await self.session.execute(stmt)
         await self.session.commit()
         return result.rowcount
+
+    # --- 유통기한 학습 배치 ---
+    async def get_job_watermark(self, job_name: str) -> int:
+        try:
+            stmt = pg_insert(BatchJobWatermark).values(job_name=job_name, last_id=0).on_conflict_do_nothing()
+            await self.session.execute(stmt)
+            await self.session.commit()
+
+            result = await self.session.execute(
+                select(BatchJobWatermark.last_id).where(BatchJobWatermark.job_name == job_name)
+            )
+            return result.scalar_one()
+        except SQLAlchemyError as e:
+            await self.session.rollback()
+            raise DatabaseException(detail=f"배치 진행 위치 조회 실패: {str(e)}")
+
+    async def get_last_deviation_log_id(self, settled_before: datetime) -> int:
+        """settled_before 이전에 저장된 마지막 로그 id (아직 커밋 중일 수 있는 최근 로그는 다음 실행에서 처리)"""
+        try:
+            stmt = select(func.max(ExpiryDeviationLog.id)).where(ExpiryDeviationLog.created_at < settled_before)
+            result = await self.session.execute(stmt)
+            return result.scalar_one() or 0
+        except SQLAlchemyError as e:
+            raise DatabaseException(detail=f"편차 로그 조회 실패: {str(e)}")
+
+    async def accumulate_expiry_histogram(
+        self, job_name: str, after_id: int, until_id: int
+    ) -> set[tuple[str, str]] | None:
+        """
+        (after_id, until_id] 구간의 편차 로그를 DB 안에서 GROUP BY 해서 히스토그램에 더하고 워터마크를 옮김
+        - 로그 행을 애플리케이션으로 가져오지 않음, 히스토그램 갱신과 워터마크 이동은 한 트랜잭션
+        - 반환: 갱신된 (식재료, 보관 방법) / 다른 실행이 먼저 처리한 구간이면 None
+        """
+        try:
+            # 워터마크 행을 잠가서 동시에 실행된 배치가 같은 구간을 두 번 더하지 않게 함
+            locked = await self.session.execute(
+                select(BatchJobWatermark.last_id).where(BatchJobWatermark.job_name == job_name).with_for_update()
+            )
+            if locked.scalar_one() != after_id:
+                await self.session.rollback()
+                return None
+
+            chunk = (
+                select(
+                    ExpiryDeviationLog.ingredient_name,
+                    ExpiryDeviationLog.storage_type,
+                    ExpiryDeviationLog.observed_day,
+                    func.count().label("sample_count"),
+                )
+                .where(
+                    ExpiryDeviationLog.id > after_id,
+                    ExpiryDeviationLog.id <= until_id,
+                    ExpiryDeviationLog.observed_day.is_not(None),
+                )
+                .group_by(
+                    ExpiryDeviationLog.ingredient_name,
+                    ExpiryDeviationLog.storage_type,
+                    ExpiryDeviationLog.observed_day,
+                )
+            )
+            stmt = pg_insert(ExpiryDayHistogram).from_select(
+                ["ingredient_name", "storage_type", "observed_day", "sample_count"], chunk
+            )
+            stmt = stmt.on_conflict_do_update(
+                index_elements=[
+                    ExpiryDayHistogram.ingredient_name,
+                    ExpiryDayHistogram.storage_type,
+                    ExpiryDayHistogram.observed_day,
+                ],
+                set_={"sample_count": ExpiryDayHistogram.sample_count + stmt.excluded.sample_count},
+            ).returning(ExpiryDayHistogram.ingredient_name, ExpiryDayHistogram.storage_type)
+            result = await self.session.execute(stmt)
+            touched = {(row.ingredient_name, row.storage_type) for row in result}
+
+            await self.session.execute(
+                update(BatchJobWatermark)
+                .where(BatchJobWatermark.job_name == job_name)
+                .values(last_id=until_id, updated_at=func.now())
+            )
+            await self.session.commit()
+            return touched
+        except SQLAlchemyError as e:
+            await self.session.rollback()
+            raise DatabaseException(detail=f"유통기한 히스토그램 집계 실패: {str(e)}")
+
+    async def get_expiry_histograms(self, keys: list[tuple[str, str]]) -> dict[tuple[str, str], list[tuple[int, int]]]:
+        """(식재료, 보관 방법) -> [(유통기한 일수, 개수), ...] (일수 오름차순)"""
+        if not keys:
+            return {}
+
+        try:
+            stmt = (
+                select(
+                    ExpiryDayHistogram.ingredient_name,
+                    ExpiryDayHistogram.storage_type,
+                    ExpiryDayHistogram.observed_day,
+                    ExpiryDayHistogram.sample_count,
+                )
+                .where(tuple_(ExpiryDayHistogram.ingredient_name, ExpiryDayHistogram.storage_type).in_(keys))
+                .order_by(
+                    ExpiryDayHistogram.ingredient_name,
+                    ExpiryDayHistogram.storage_type,
+                    ExpiryDayHistogram.observed_day,
+                )
+            )
+            result = await self.session.execute(stmt)
+
+            histograms: dict[tuple[str, str], list[tuple[int, int]]] = {}
+            for row in result:
+                histograms.setdefault((row.ingredient_name, row.storage_type), []).append(
+                    (row.observed_day, row.sample_count)
+                )
+            return histograms
+        except SQLAlchemyError as e:
+            raise DatabaseException(detail=f"유통기한 히스토그램 조회 실패: {str(e)}")
+
+    async def upsert_expiry_proposals(self, proposals: list[dict]):
+        if not proposals:
+            return
+
+        try:
+            stmt = pg_insert(ExpiryDayProposal)
+            stmt = stmt.on_conflict_do_update(
+                index_elements=[ExpiryDayProposal.ingredient_name, ExpiryDayProposal.storage_type],
+                set_={
+                    "sample_count": stmt.excluded.sample_count,
+                    "median_day": stmt.excluded.median_day,
+                    "trimmed_mean_day": stmt.excluded.trimmed_mean_day,
+                    "current_expiry_day": stmt.excluded.current_expiry_day,
+                    "proposed_expiry_day": stmt.excluded.proposed_expiry_day,
+                    "updated_at": func.now(),
+                },
+            )
+            await self.session.execute(stmt, proposals)
+            await self.session.commit()
+        except SQLAlchemyError as e:
+            await self.session.rollback()
+            raise DatabaseException(detail=f"유통기한 제안 저장 실패: {str(e)}")
@@ -1,4 +1,4 @@
-from pydantic import BaseModel, Field, ConfigDict, field_validator
+from pydantic import BaseModel, Field, ConfigDict, field_validator, model_validator
 from datetime import date
 from enum import Enum
 
@@ -9,6 +9,12 @@ class StorageType(str, Enum):
     ROOM = "ROOM"
 
 
+class IngredientOrder(str, Enum):
+    EXPIRATION_DATE = "expiration_date"  # 유통기한 임박순 (미분류는 맨 뒤)
+    PURCHASE_DATE = "purchase_date"  # 구매일순
+    ID = "id"  # 등록순
+
+
 # --- Request ---
 class AddIngredientRequest(BaseModel):
     # 유통기한 안넣을 시 Default -> Today
@@ -34,6 +40,17 @@ class UpdateIngredientRequest(BaseModel):
     storage_type: StorageType | None = None
 
 
+class BulkAutoFillRequest(BaseModel):
+    ingredient_ids: list[int] | None = Field(None, description="자동 채우기할 식재료 id 목록")
+    all_unclassified: bool = Field(False, description="true면 유통기한/보관방법이 없는 식재료 전체")
+
+    @model_validator(mode="after")
+    def check_target(self):
+        if self.all_unclassified == bool(self.ingredient_ids):
+            raise ValueError("ingredient_ids 또는 all_unclassified 중 하나만 입력해야 합니다.")
+        return self
+
+
 # --- Response ---
 
 
@@ -59,6 +76,20 @@ class GetIngredientResponse(BaseModel):
     model_config = ConfigDict(from_attributes=True)
 
 
+class IngredientPageResponse(BaseModel):
+    items: list[GetIngredientResponse]
+    next_cursor: str | None = Field(None, description="다음 페이지 커서 (마지막 페이지면 null)")
+    total: int | None = Field(None, description="전체 개수 (include_total=true 일 때만)")
+
+
+class BulkAutoFillResponse(BaseModel):
+    updated_count: int
+    ingredients: list[GetIngredientResponse]
+    skipped_ids: list[int] = Field(
+        default_factory=list, description="요청한 id 중 자동 입력 데이터가 없거나 존재하지 않아 건너뛴 id"
+    )
+
+
 class BulkMoveIngredientRequest(BaseModel):
     ingredient_ids: list[int]
 
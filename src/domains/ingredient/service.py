@@ -1,14 +1,20 @@
-from datetime import timedelta
+from datetime import timedelta, date
+
+from redis.asyncio import Redis
 
 from domains.ingredient.exceptions import (
     IngredientNotFoundException,
     ValueNotFoundException,
     NotFoundException,
     InvalidIngredientException,
+    InvalidCursorException,
 )
-from core.exception.exceptions import HaveNotPermissionException
+from core.exception.exceptions import HaveNotPermissionException, DatabaseException
+from core.log_buffer import LogBuffer, log_buffer as default_log_buffer
+from domains.ingredient.cache import expiry_cache, non_ingredient_index, ExpiringSoonIndex
 from domains.ingredient.repository import IngredientRepository
 from domains.user.models import User
+from util.pagination import encode_cursor, decode_cursor
 from domains.ingredient.schemas import (
     AddIngredientRequest,
     AddIngredientResponse,
@@ -18,6 +24,10 @@ from domains.ingredient.schemas import (
     UpdateIngredientRequest,
     BulkMoveIngredientRequest,
     BulkMoveResponse,
+    BulkAutoFillRequest,
+    BulkAutoFillResponse,
+    IngredientOrder,
+    IngredientPageResponse,
 )
 from domains.ingredient.models import (
     Ingredient,
@@ -25,58 +35,96 @@ from domains.ingredient.models import (
     ExpiryDeviationLog,
 )
 
+EXPIRING_SOON_DEFAULT_LIMIT = 100
+
 
 class IngredientService:
-    def __init__(self, user: User, ingredient_repo: IngredientRepository):
+    def __init__(
+        self,
+        user: User,
+        ingredient_repo: IngredientRepository,
+        log_buffer: LogBuffer | None = None,
+        redis: Redis | None = None,
+    ):
         self.user = user
         self.ingredient_repo = ingredient_repo
+        # 유통기한 임박 조회용 Redis 인덱스 (redis가 없으면 DB 인덱스로만 조회)
+        self.expiring_index = ExpiringSoonIndex(redis) if redis else None
+        # 분석 로그는 응답을 기다리게 하지 않도록 버퍼에 넣고 백그라운드에서 저장
+        self.log_buffer = log_buffer if log_buffer is not None else default_log_buffer
+
+    async def _get_expiry_infos(self, ingredient_names: list[str]) -> dict:
+        # 참조 데이터는 캐시에서 조회하고, 캐시가 준비되지 않았을 때만 DB 조회
+        # 캐시가 로드되기 전(시작 직후 / 로드 실패 후 다음 watch 주기 전)에는 별칭 / 유사 매칭 없이 정확히 같은 이름만 찾음
+        # ("두부 2입" -> 자동 입력 불가, add_ingredient / bulk_auto_fill의 expiry_names=None과 같은 기준)
+        if expiry_cache.is_loaded:
+            return expiry_cache.get_many(ingredient_names)
+        return await self.ingredient_repo.get_expiry_infos(ingredient_names)
+
+    async def _sync_expiring_index(self, ingredients: list):
+        if not self.expiring_index or not ingredients:
+            return
+        try:
+            await self.expiring_index.update(self.user.id, ingredients)
+        except Exception as e:
+            # 반영에 실패하면 인덱스를 지워서 다음 조회 때 DB 기준으로 다시 만들게 함
+            print(f"Expiring Index Update Error: {e}")
+            await self._drop_expiring_index()
+
+    async def _remove_from_expiring_index(self, ingredient_ids: list[int]):
+        if not self.expiring_index:
+            return
+        try:
+            await self.expiring_index.remove(self.user.id, ingredient_ids)
+        except Exception as e:
+            print(f"Expiring Index Update Error: {e}")
+            await self._drop_expiring_index()
+
+    async def _drop_expiring_index(self):
+        try:
+            await self.expiring_index.drop(self.user.id)
+        except Exception as e:
+            print(f"Expiring Index Delete Error: {e}")
 
     async def add_ingredient(self, request: AddIngredientRequest) -> list[AddIngredientResponse]:
-        banned_names = await self.ingredient_repo.get_existing_non_ingredients(request.ingredients)
-
-        banned_set = set(banned_names)
-
-        valid_names = [name for name in request.ingredients if name not in banned_set]
+        ingredient_names = request.ingredients
+        # 제외 식재료 인덱스가 로드되어 있으면 메모리에서 거르고, 아니면 저장 문장 안에서 거름
+        use_index = non_ingredient_index.is_loaded
+        if use_index:
+            ingredient_names = await non_ingredient_index.filter(ingredient_names, self.ingredient_repo)
+            if not ingredient_names:
+                raise InvalidIngredientException()
+
+        # 이름은 입력한 그대로 저장하고, 자동 입력 가능 여부만 매칭한 이름으로 확인 ("두부 2입" -> "두부")
+        expiry_names = expiry_cache.expiry_names(ingredient_names) if expiry_cache.is_loaded else None
+
+        # 저장 / 자동 입력 가능 여부를 한 문장으로 처리
+        saved_rows = await self.ingredient_repo.bulk_add_ingredients(
+            user_id=self.user.id,
+            ingredient_names=ingredient_names,
+            purchase_date=request.purchase_date,
+            exclude_non_ingredients=not use_index,
+            expiry_names=expiry_names,
+        )
 
-        if not valid_names:
+        if not saved_rows:
             raise InvalidIngredientException()
 
-        ingredients_to_save = [
-            Ingredient(
-                user_id=self.user.id,
-                ingredient_name=name,
-                purchase_date=request.purchase_date,
-            )
-            for name in valid_names
-        ]
-
-        saved_ingredients = await self.ingredient_repo.add_ingredients(ingredients_to_save)
-
-        expiry_info_map = await self.ingredient_repo.get_expiry_infos(valid_names)
-
-        missing_logs = []
-        response_list = []
+        for row in saved_rows:
+            if not row.is_auto_fillable:
+                self.log_buffer.add(MissingIngredientLog, user_id=self.user.id, ingredient_name=row.ingredient_name)
 
-        for ing in saved_ingredients:
-            if ing.ingredient_name not in expiry_info_map:
-                missing_logs.append(MissingIngredientLog(user_id=self.user.id, ingredient_name=ing.ingredient_name))
-
-            can_auto = ing.ingredient_name in expiry_info_map
-
-            resp = AddIngredientResponse(
-                id=ing.id,
-                ingredient_name=ing.ingredient_name,
-                purchase_date=ing.purchase_date,
-                expiration_date=ing.expiration_date,
-                storage_type=ing.storage_type,
-                is_auto_fillable=can_auto,
+        return [
+            AddIngredientResponse(
+                id=row.id,
+                ingredient_name=row.ingredient_name,
+                purchase_date=row.purchase_date,
+                expiration_date=row.expiration_date,
+                storage_type=row.storage_type,
+                is_auto_fillable=row.is_auto_fillable,
             )
-            response_list.append(resp)
-
-        if missing_logs:
-            await self.ingredient_repo.add_missing_logs(missing_logs)
-
-        return response_list
+            for row in saved_rows
+        ]
 
     async def set_expiration_and_storage(
         self, ingredient_id: int, request: SetIngredientRequest
@@ -90,26 +138,23 @@ class IngredientService:
         if not ingredient:
             raise IngredientNotFoundException()
 
-        expiry_infos = await self.ingredient_repo.get_expiry_infos([ingredient.ingredient_name])
+        expiry_infos = await self._get_expiry_infos([ingredient.ingredient_name])
         can_auto = ingredient.ingredient_name in expiry_infos
 
         if can_auto:
             info = expiry_infos[ingredient.ingredient_name]
             user_days = (request.expiration_date - ingredient.purchase_date).days
-            server_days = info.expiry_day
-            diff = abs(user_days - server_days)
-
-            is_date_deviated = diff >= 2
-            is_storage_deviated = request.storage_type.value != info.storage_type
-
-            if is_date_deviated or is_storage_deviated:
-                log = ExpiryDeviationLog(
-                    user_id=self.user.id,
-                    ingredient_name=ingredient.ingredient_name,
-                    deviation_day=diff,
-                    storage_type=request.storage_type.value,
-                )
-                await self.ingredient_repo.add_deviation_log(log)
+            # 기본값과 같게 입력한 경우도 저장 -> 편차가 있는 입력만 쌓이면 학습한 중앙값이 기본값에서 멀어지는 쪽으로 치우침
+            # (편차만 보려면 deviation_day >= 2 또는 보관 방법이 다른 행으로 거름)
+            self.log_buffer.add(
+                ExpiryDeviationLog,
+                user_id=self.user.id,
+                # 학습은 유통기한 데이터의 이름 기준
+                ingredient_name=info.ingredient_name,
+                deviation_day=abs(user_days - info.expiry_day),
+                storage_type=request.storage_type.value,
+                observed_day=user_days,
+            )
 
         updated = await self.ingredient_repo.set_ingredient(
             ingredient_id,
@@ -121,6 +166,8 @@ class IngredientService:
         if not updated:
             raise IngredientNotFoundException()
 
+        await self._sync_expiring_index([updated])
+
         return GetIngredientResponse(
             id=updated.id,
             ingredient_name=updated.ingredient_name,
@@ -135,7 +182,7 @@ class IngredientService:
         if not ingredient:
             raise IngredientNotFoundException()
 
-        expiry_infos = await self.ingredient_repo.get_expiry_infos([ingredient.ingredient_name])
+        expiry_infos = await self._get_expiry_infos([ingredient.ingredient_name])
 
         if ingredient.ingredient_name not in expiry_infos:
             raise NotFoundException(detail="자동 입력 데이터가 없는 식재료입니다.")
@@ -146,9 +193,52 @@ class IngredientService:
         updated = await self.ingredient_repo.set_ingredient(
             ingredient_id, self.user.id, calculated_expiry, info.storage_type
         )
+        if updated:
+            await self._sync_expiring_index([updated])
 
         return updated
 
+    async def bulk_auto_fill(self, request: BulkAutoFillRequest) -> BulkAutoFillResponse:
+        expiry_names = None
+        if expiry_cache.is_loaded:
+            # 입력한 이름 그대로 저장되어 있으므로 매칭한 이름으로 찾도록 대상 이름만 먼저 조회 ("두부 2입" -> "두부")
+            names = await self.ingredient_repo.get_auto_fill_target_names(
+                self.user.id, request.ingredient_ids, request.all_unclassified
+            )
+            expiry_names = {
+                name: expiry_name
+                for name, expiry_name in zip(names, expiry_cache.expiry_names(names))
+                if name != expiry_name
+            }
+
+        updated_rows = await self.ingredient_repo.bulk_auto_fill(
+            user_id=self.user.id,
+            ingredient_ids=request.ingredient_ids,
+            only_unclassified=request.all_unclassified,
+            expiry_names=expiry_names,
+        )
+
+        await self._sync_expiring_index(updated_rows)
+
+        updated_ids = {row.id for row in updated_rows}
+        skipped_ids = [i for i in dict.fromkeys(request.ingredient_ids or []) if i not in updated_ids]
+
+        return BulkAutoFillResponse(
+            updated_count=len(updated_rows),
+            ingredients=[
+                GetIngredientResponse(
+                    id=row.id,
+                    ingredient_name=row.ingredient_name,
+                    purchase_date=row.purchase_date,
+                    expiration_date=row.expiration_date,
+                    storage_type=row.storage_type,
+                    is_auto_fillable=True,
+                )
+                for row in updated_rows
+            ],
+            skipped_ids=skipped_ids,
+        )
+
     async def get_ingredients(self, storage: StorageType | None = None, is_unclassified: bool | None = None):
         ingredient_list = await self.ingredient_repo.get_ingredients(
             user_id=self.user.id, storage=storage, is_unclassified=is_unclassified
@@ -157,8 +247,11 @@ class IngredientService:
         if not ingredient_list:
             return []
 
+        return await self._to_responses(ingredient_list)
+
+    async def _to_responses(self, ingredient_list: list[Ingredient]) -> list[GetIngredientResponse]:
         names = [ing.ingredient_name for ing in ingredient_list]
-        expiry_info_map = await self.ingredient_repo.get_expiry_infos(names)
+        expiry_info_map = await self._get_expiry_infos(names)
 
         response_list = []
         for ing in ingredient_list:
@@ -175,13 +268,98 @@ class IngredientService:
 
         return response_list
 
+    @staticmethod
+    def _decode_ingredient_cursor(cursor: str, order_by: IngredientOrder) -> tuple[date | None, int]:
+        try:
+            data = decode_cursor(cursor)
+            if data["o"] != order_by.value:
+                raise ValueError("order_by changed")
+            value = date.fromisoformat(data["v"]) if data["v"] is not None else None
+            return value, int(data["id"])
+        except (ValueError, KeyError, TypeError):
+            raise InvalidCursorException()
+
+    async def get_ingredients_page(
+        self,
+        limit: int,
+        cursor: str | None = None,
+        order_by: IngredientOrder = IngredientOrder.EXPIRATION_DATE,
+        include_total: bool = False,
+        storage: StorageType | None = None,
+        is_unclassified: bool | None = None,
+    ) -> IngredientPageResponse:
+        after = self._decode_ingredient_cursor(cursor, order_by) if cursor else None
+
+        # 다음 페이지가 있는지 알기 위해 1개 더 조회
+        rows = await self.ingredient_repo.get_ingredients_page(
+            user_id=self.user.id,
+            order_by=order_by,
+            limit=limit + 1,
+            after=after,
+            storage=storage,
+            is_unclassified=is_unclassified,
+        )
+        has_next = len(rows) > limit
+        rows = rows[:limit]
+
+        next_cursor = None
+        if has_next:
+            last = rows[-1]
+            value = getattr(last, order_by.value) if order_by != IngredientOrder.ID else None
+            next_cursor = encode_cursor({"o": order_by.value, "v": value.isoformat() if value else None, "id": last.id})
+
+        total = None
+        if include_total:
+            total = await self.ingredient_repo.count_ingredients(
+                user_id=self.user.id, storage=storage, is_unclassified=is_unclassified
+            )
+
+        return IngredientPageResponse(items=await self._to_responses(rows), next_cursor=next_cursor, total=total)
+
+    async def get_expiring_soon(
+        self, days: int, include_expired: bool = False, limit: int = EXPIRING_SOON_DEFAULT_LIMIT
+    ) -> list[GetIngredientResponse]:
+        """오늘부터 days일 안에 유통기한이 끝나는 식재료 (include_expired면 이미 지난 것도 포함)"""
+        today = date.today()
+        until = today + timedelta(days=days)
+        since = None if include_expired else today
+
+        items = None
+        if self.expiring_index:
+            try:
+                items = await self.expiring_index.query(self.user.id, until, since, limit)
+                if items is None:
+                    # 인덱스가 없으면 유통기한이 있는 식재료 전체로 만들고, 이번 응답은 그 결과에서 바로 계산
+                    # 세대 값을 먼저 받아서, 읽는 도중에 반영된 수정을 오래된 결과로 덮어쓰지 않도록 함
+                    generation = await self.expiring_index.generation(self.user.id)
+                    dated = await self.ingredient_repo.get_expiring_ingredients(self.user.id, until=date.max)
+                    await self.expiring_index.build(self.user.id, dated, generation)
+                    items = [
+                        i for i in dated if i.expiration_date <= until and (not since or i.expiration_date >= since)
+                    ]
+                    items = items[:limit]
+            except DatabaseException:
+                raise
+            except Exception as e:
+                print(f"Expiring Index Read Error: {e}")
+                items = None
+
+        if items is None:
+            items = await self.ingredient_repo.get_expiring_ingredients(
+                self.user.id, until=until, since=since, limit=limit
+            )
+
+        if not items:
+            return []
+        return await self._to_responses(items)
+
     async def get_ingredient(self, ingredient_id: int) -> GetIngredientResponse | None:
         ingredient = await self.ingredient_repo.get_ingredient(ingredient_id, self.user.id)
 
         if not ingredient:
             raise IngredientNotFoundException()
 
-        expiry_infos = await self.ingredient_repo.get_expiry_infos([ingredient.ingredient_name])
+        expiry_infos = await self._get_expiry_infos([ingredient.ingredient_name])
         can_auto = ingredient.ingredient_name in expiry_infos
 
         return GetIngredientResponse(
@@ -198,6 +376,8 @@ class IngredientService:
         if not is_deleted:
             raise IngredientNotFoundException()
 
+        await self._remove_from_expiring_index([ingredient_id])
+
     async def update_ingredient(self, ingredient_id: int, request: UpdateIngredientRequest) -> GetIngredientResponse:
         storage_value = request.storage_type.value if request.storage_type else None
 
@@ -212,7 +392,9 @@ class IngredientService:
         if not updated:
             raise IngredientNotFoundException()
 
-        expiry_infos = await self.ingredient_repo.get_expiry_infos([updated.ingredient_name])
+        await self._sync_expiring_index([updated])
+
+        expiry_infos = await self._get_expiry_infos([updated.ingredient_name])
         can_auto = updated.ingredient_name in expiry_infos
 
         return GetIngredientResponse(
@@ -231,7 +413,7 @@ class IngredientService:
             return []
 
         names = [ing.ingredient_name for ing in ingredients]
-        expiry_info_map = await self.ingredient_repo.get_expiry_infos(names)
+        expiry_info_map = await self._get_expiry_infos(names)
 
         return [
             GetIngredientResponse(
@@ -252,7 +434,7 @@ class IngredientService:
             return []
 
         names = [ing.ingredient_name for ing in ingredients]
-        expiry_info_map = await self.ingredient_repo.get_expiry_infos(names)
+        expiry_info_map = await self._get_expiry_infos(names)
 
         return [
             GetIngredientResponse(
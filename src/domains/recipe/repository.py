@@ -1,4 +1,5 @@
-from sqlalchemy import select
+from sqlalchemy import and_, select, func
+from sqlalchemy.dialects.postgresql import aggregate_order_by
 from sqlalchemy.exc import SQLAlchemyError
 from sqlalchemy.ext.asyncio import AsyncSession
 
@@ -30,3 +31,24 @@ class RecipeRepository:
         except SQLAlchemyError as e:
             await self.session.rollback()
             raise DatabaseException(detail=f"레시피 조회 실패: {str(e)}")
+
+    async def get_image_queries(self, exclude_url_prefixes: tuple[str, ...] = ()) -> list[tuple[str, str | None]]:
+        """
+        저장된 레시피의 (이미지 검색어, 저장된 이미지 URL) 목록 - 검색어 기준 중복 제거
+        URL은 검색어별로 가장 최근 레시피의 것 (exclude_url_prefixes로 시작하는 기본/대체 이미지는 건너뜀, 없으면 None)
+        """
+        try:
+            query = func.coalesce(Recipe.recipe["food_en"].astext, Recipe.food_name + " food")
+            image_url = Recipe.recipe["image_url"].astext
+            usable = and_(
+                image_url.isnot(None),
+                *(~image_url.startswith(prefix, autoescape=True) for prefix in exclude_url_prefixes),
+            )
+            latest_url = func.array_agg(
+                aggregate_order_by(image_url, Recipe.created_at.desc(), Recipe.id.desc())
+            ).filter(usable)[1]
+            stmt = select(query, latest_url).group_by(query)
+            result = await self.session.execute(stmt)
+            return [(row[0], row[1]) for row in result.all()]
+        except SQLAlchemyError as e:
+            raise DatabaseException(detail=f"레시피 이미지 검색어 조회 실패: {str(e)}")
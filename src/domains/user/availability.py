@@ -0,0 +1,204 @@
+"""
+닉네임 / 이메일 사용 가능 여부 확인용 Redis Bloom filter
+
+- `AVAILABILITY:{field}` (STRING 비트맵): users의 nickname / email을 넣은 Bloom filter
+- 비트가 하나라도 0이면 "확실히 사용 가능" -> DB 조회 없이 응답, 나머지만 DB로 확인
+- 가입 / 닉네임 변경 때 add로 반영, Bloom filter는 삭제가 안 되므로 바뀐 이전 값은 재생성 전까지 DB로 확인됨
+
+재생성 (src 디렉토리 기준):
+    python -m domains.user.availability
+"""
+
+import asyncio
+import hashlib
+import itertools
+
+from redis.asyncio import Redis
+from redis.exceptions import NoScriptError
+from sqlalchemy.ext.asyncio import async_sessionmaker
+
+from core.database import async_session_factory, engine, redis_pool
+from domains.user.repository import UserRepository
+from util.bloom import bloom_parameters, bloom_positions
+
+AVAILABILITY_FIELDS = ("nickname", "email")
+AVAILABILITY_CAPACITY = 1_000_000  # 예상 유저 수 (넘으면 false positive가 늘어나므로 키우고 재생성)
+AVAILABILITY_ERROR_RATE = 0.01
+AVAILABILITY_REBUILD_BATCH_SIZE = 5000
+AVAILABILITY_REBUILD_TTL = 60 * 60  # 재생성 도중 실패하면 임시 키가 남지 않도록
+AVAILABILITY_REBUILD_LOCK_TTL = 60 * 10
+
+# KEYS: filter / ARGV: 비트 위치들 -> -1: filter 없음, 0: 확실히 없음, 1: 있을 수도 있음
+CHECK_SCRIPT = """
+if redis.call('EXISTS', KEYS[1]) == 0 then
+    return -1
+end
+for i = 1, #ARGV do
+    if redis.call('GETBIT', KEYS[1], ARGV[i]) == 0 then
+        return 0
+    end
+end
+return 1
+"""
+
+# KEYS: (filter, 재생성 중인 filter) 반복 / ARGV: 해시 개수, 값마다 비트 위치들
+# 없는 filter에는 쓰지 않음 (일부만 채워진 filter가 "준비된" 것처럼 보이지 않도록)
+ADD_SCRIPT = """
+local k = tonumber(ARGV[1])
+for f = 0, #KEYS / 2 - 1 do
+    for j = 1, 2 do
+        local key = KEYS[f * 2 + j]
+        if redis.call('EXISTS', key) == 1 then
+            for i = 1, k do
+                redis.call('SETBIT', key, ARGV[1 + f * k + i], 1)
+            end
+        end
+    end
+end
+return 1
+"""
+
+CHECK_SCRIPT_SHA = hashlib.sha1(CHECK_SCRIPT.encode("UTF-8")).hexdigest()
+ADD_SCRIPT_SHA = hashlib.sha1(ADD_SCRIPT.encode("UTF-8")).hexdigest()
+
+
+class UserAvailabilityIndex:
+    """
+    닉네임 / 이메일 Bloom filter (Redis 비트맵, RedisBloom 모듈 없이 SETBIT/GETBIT만 사용)
+    - 확인 / 추가는 Lua 한 번
+    - filter가 없으면 might_exist가 None -> 호출하는 쪽이 DB로 확인
+    - 재생성은 임시 키에 채운 뒤 RENAME으로 교체, 재생성 중에 가입한 값은 add가 양쪽에 씀
+    """
+
+    def __init__(
+        self, redis: Redis, capacity: int = AVAILABILITY_CAPACITY, error_rate: float = AVAILABILITY_ERROR_RATE
+    ):
+        self.redis = redis
+        self.size, self.hash_count = bloom_parameters(capacity, error_rate)
+
+    @staticmethod
+    def _key(field: str) -> str:
+        return f"AVAILABILITY:{field}"
+
+    @staticmethod
+    def _building_key(field: str) -> str:
+        return f"AVAILABILITY:{field}:building"
+
+    def _positions(self, value: str) -> list[int]:
+        return bloom_positions(value, self.size, self.hash_count)
+
+    async def _eval(self, script: str, sha: str, keys: list[str], args: list):
+        try:
+            return await self.redis.evalsha(sha, len(keys), *keys, *args)
+        except NoScriptError:
+            return await self.redis.eval(script, len(keys), *keys, *args)
+
+    async def might_exist(self, field: str, value: str) -> bool | None:
+        """False: 확실히 사용 중이 아님 / True: 사용 중일 수도 있음 / None: filter 없음"""
+        result = int(await self._eval(CHECK_SCRIPT, CHECK_SCRIPT_SHA, [self._key(field)], self._positions(value)))
+        return None if result < 0 else bool(result)
+
+    async def add(self, **values: str | None):
+        """예: add(nickname="도먹", email="a@b.com") - 값이 None인 항목은 건너뜀"""
+        keys, args = [], [self.hash_count]
+        for field, value in values.items():
+            if value:
+                keys += [self._key(field), self._building_key(field)]
+                args += self._positions(value)
+        if keys:
+            await self._eval(ADD_SCRIPT, ADD_SCRIPT_SHA, keys, args)
+
+    async def drop(self):
+        await self.redis.delete(*(self._key(field) for field in AVAILABILITY_FIELDS))
+
+    async def mark_taken(self, **values: str | None):
+        """add와 같지만 실패하면 filter를 지움 -> 반영되지 않은 값을 "사용 가능"으로 응답하지 않도록 DB 확인으로 대체"""
+        try:
+            await self.add(**values)
+        except Exception as e:
+            print(f"Availability Index Update Error: {e}")
+            try:
+                await self.drop()
+            except Exception as e:
+                print(f"Availability Index Drop Error: {e}")
+
+    async def rebuild(
+        self,
+        session_factory: async_sessionmaker = async_session_factory,
+        batch_size: int = AVAILABILITY_REBUILD_BATCH_SIZE,
+    ) -> int:
+        """users 전체로 filter를 새로 만듦 -> 넣은 유저 수"""
+        building = {field: self._building_key(field) for field in AVAILABILITY_FIELDS}
+
+        # 임시 키를 먼저 만들어야 스캔 도중 가입한 값도 add가 임시 키에 씀 (크기만큼 미리 할당)
+        async with self.redis.pipeline(transaction=True) as pipe:
+            for key in building.values():
+                pipe.delete(key)
+                pipe.setbit(key, self.size - 1, 0)
+                pipe.expire(key, AVAILABILITY_REBUILD_TTL)
+            await pipe.execute()
+
+        count = 0
+        after = None
+        async with session_factory() as session:
+            repo = UserRepository(session)
+            while True:
+                rows = await repo.scan_user_identities(after, batch_size)
+                if not rows:
+                    break
+
+                async with self.redis.pipeline(transaction=False) as pipe:
+                    for row in rows:
+                        for field, key in building.items():
+                            value = getattr(row, field)
+                            if value:
+                                ops = (("SET", "u1", pos, 1) for pos in self._positions(value))
+                                pipe.execute_command("BITFIELD", key, *itertools.chain.from_iterable(ops))
+                    await pipe.execute()
+
+                count += len(rows)
+                after = rows[-1].id
+                if len(rows) < batch_size:
+                    break
+
+        async with self.redis.pipeline(transaction=True) as pipe:
+            for field, key in building.items():
+                pipe.rename(key, self._key(field))
+                pipe.persist(self._key(field))
+            await pipe.execute()
+        return count
+
+    async def ensure_built(self, session_factory: async_sessionmaker = async_session_factory) -> int | None:
+        """filter가 없으면 (다른 인스턴스가 만들고 있지 않을 때만) 재생성 (앱 시작 시 백그라운드로 실행)"""
+        if await self.redis.exists(*(self._key(field) for field in AVAILABILITY_FIELDS)) == len(AVAILABILITY_FIELDS):
+            return None
+        if not await self.redis.set("LOCK:availability_rebuild", "1", nx=True, ex=AVAILABILITY_REBUILD_LOCK_TTL):
+            return None
+        try:
+            return await self.rebuild(session_factory)
+        except Exception as e:
+            # 만들지 못해도 확인은 DB로 동작함
+            print(f"Availability Index Rebuild Error: {e}")
+            return None
+        finally:
+            await self.redis.delete("LOCK:availability_rebuild")
+
+
+async def main():
+    # 관계(User.ingredients 등)를 해석할 수 있도록 모든 모델 등록
+    import domains.ingredient.models  # noqa: F401
+    import domains.recipe.models  # noqa: F401
+    import domains.refrigerator.models  # noqa: F401
+    import domains.shopping.models  # noqa: F401
+
+    redis_client = Redis(connection_pool=redis_pool)
+    try:
+        count = await UserAvailabilityIndex(redis_client).rebuild()
+        print(f"Availability filter rebuilt: users={count}")
+    finally:
+        await redis_client.close()
+        await engine.dispose()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
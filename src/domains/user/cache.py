@@ -0,0 +1,105 @@
+import json
+import time
+import uuid
+from collections import OrderedDict
+
+from redis.asyncio import Redis
+
+from domains.user.models import User
+
+USER_SNAPSHOT_TTL = 60  # Redis 스냅샷 유지 시간 (초)
+USER_LOCAL_TTL = 5  # 프로세스 내 LRU 유지 시간 (초) - 다른 프로세스의 무효화가 늦게 반영되는 최대 시간
+USER_LOCAL_MAX_SIZE = 10_000
+
+
+class UserSnapshotCache:
+    """
+    인증된 유저(principal) 스냅샷 캐시
+    - 1차: 프로세스 내 LRU (짧은 TTL)
+    - 2차: Redis `USER:{user_id}` (USER_SNAPSHOT_TTL)
+    비밀번호, 전화번호 같은 민감 정보는 스냅샷에 담지 않음
+    """
+
+    def __init__(self, max_size: int = USER_LOCAL_MAX_SIZE, local_ttl: float = USER_LOCAL_TTL):
+        self.max_size = max_size
+        self.local_ttl = local_ttl
+        self._local: OrderedDict[str, tuple[float, dict]] = OrderedDict()
+
+    @staticmethod
+    def _key(user_id) -> str:
+        return f"USER:{user_id}"
+
+    @staticmethod
+    def _to_snapshot(user: User) -> dict:
+        return {
+            "id": str(user.id),
+            "email": user.email,
+            "nickname": user.nickname,
+            "name": user.name,
+            "provider": user.provider,
+        }
+
+    @staticmethod
+    def _to_user(snapshot: dict) -> User:
+        # 세션에 붙지 않은 읽기 전용 객체 (수정이 필요하면 DB에서 다시 조회해야 함)
+        return User(
+            id=uuid.UUID(snapshot["id"]),
+            email=snapshot["email"],
+            nickname=snapshot["nickname"],
+            name=snapshot["name"],
+            provider=snapshot["provider"],
+        )
+
+    def _get_local(self, user_id: str) -> dict | None:
+        entry = self._local.get(user_id)
+        if entry is None:
+            return None
+
+        expires_at, snapshot = entry
+        if expires_at < time.monotonic():
+            self._local.pop(user_id, None)
+            return None
+
+        self._local.move_to_end(user_id)
+        return snapshot
+
+    def _set_local(self, user_id: str, snapshot: dict):
+        self._local[user_id] = (time.monotonic() + self.local_ttl, snapshot)
+        self._local.move_to_end(user_id)
+        while len(self._local) > self.max_size:
+            self._local.popitem(last=False)
+
+    async def get(self, redis: Redis, user_id: str) -> User | None:
+        user_id = str(user_id)
+
+        snapshot = self._get_local(user_id)
+        if snapshot is not None:
+            return self._to_user(snapshot)
+
+        raw = await redis.get(self._key(user_id))
+        if not raw:
+            return None
+
+        try:
+            snapshot = json.loads(raw)
+        except (TypeError, ValueError):
+            return None
+
+        self._set_local(user_id, snapshot)
+        return self._to_user(snapshot)
+
+    async def set(self, redis: Redis, user: User):
+        if user.deleted_at is not None:
+            return
+
+        snapshot = self._to_snapshot(user)
+        self._set_local(snapshot["id"], snapshot)
+        await redis.set(self._key(snapshot["id"]), json.dumps(snapshot, ensure_ascii=False), ex=USER_SNAPSHOT_TTL)
+
+    async def invalidate(self, redis: Redis, user_id):
+        user_id = str(user_id)
+        self._local.pop(user_id, None)
+        await redis.delete(self._key(user_id))
+
+
+user_snapshot_cache = UserSnapshotCache()
@@ -0,0 +1,122 @@
+"""
+소셜 로그인 제공자
+
+- 제공자마다 다른 부분(엔드포인트, 토큰 요청 파라미터, 유저 정보 응답 형식)만 OAuthProvider를 상속해 구현
+- state 검증 / 유저 upsert / 세션 발급은 SocialAuthService가 제공자와 상관없이 같은 흐름으로 처리
+  -> 제공자를 추가해도 로그인 한 번에 드는 Redis / DB 왕복 수는 그대로
+"""
+
+from abc import ABC, abstractmethod
+from dataclasses import dataclass
+from urllib.parse import urlencode
+
+import httpx
+
+from core.config import settings
+from core.http import http_clients
+from domains.user.exceptions import InvalidCredentialsException
+
+
+@dataclass(frozen=True)
+class OAuthProfile:
+    """제공자 유저 정보 중 가입 / 로그인에 쓰는 값"""
+
+    provider: str
+    social_id: str
+    email: str | None = None
+    name: str | None = None
+
+
+class OAuthProvider(ABC):
+    name: str
+    authorize_endpoint: str
+    token_endpoint: str
+    user_info_endpoint: str
+    http_client_name: str
+
+    @abstractmethod
+    def authorize_params(self, state: str) -> dict: ...
+
+    @abstractmethod
+    def token_request_data(self, code: str) -> dict: ...
+
+    @abstractmethod
+    def parse_profile(self, data: dict) -> OAuthProfile: ...
+
+    def nickname_for(self, profile: OAuthProfile) -> str:
+        """가입 시 기본 닉네임 (social_id가 유일하므로 겹치지 않음)"""
+        return f"{self.name[0]}_{profile.social_id}"
+
+    def authorize_url(self, state: str) -> str:
+        return f"{self.authorize_endpoint}?{urlencode(self.authorize_params(state))}"
+
+    @property
+    def client(self) -> httpx.AsyncClient:
+        # 제공자별로 커넥션을 재사용하는 공용 클라이언트
+        return http_clients.get(self.http_client_name)
+
+    async def exchange_code(self, code: str) -> str:
+        """인가 코드 -> 제공자 액세스 토큰"""
+        response = await self.client.post(
+            self.token_endpoint,
+            headers={"Content-Type": "application/x-www-form-urlencoded"},
+            data=self.token_request_data(code),
+        )
+        access_token = response.json().get("access_token") if response.status_code == 200 else None
+        if not access_token:
+            raise InvalidCredentialsException(detail=f"{self.name} 토큰 발급 실패")
+        return access_token
+
+    async def fetch_user_info(self, access_token: str) -> dict:
+        response = await self.client.get(
+            self.user_info_endpoint,
+            headers={"Authorization": f"Bearer {access_token}"},
+        )
+        if response.status_code != 200:
+            raise InvalidCredentialsException(detail=f"{self.name} 유저 정보 조회 실패")
+        return response.json()
+
+
+class KakaoOAuthProvider(OAuthProvider):
+    name = "kakao"
+    authorize_endpoint = "https://kauth.kakao.com/oauth/authorize"
+    token_endpoint = "https://kauth.kakao.com/oauth/token"
+    user_info_endpoint = "https://kapi.kakao.com/v2/user/me"
+    http_client_name = "kakao"
+
+    def authorize_params(self, state: str) -> dict:
+        return {
+            "client_id": settings.KAKAO_REST_API_KEY,
+            "redirect_uri": settings.KAKAO_REDIRECT_URI,
+            "response_type": "code",
+            "state": state,
+        }
+
+    def token_request_data(self, code: str) -> dict:
+        return {
+            "grant_type": "authorization_code",
+            "client_id": settings.KAKAO_REST_API_KEY,
+            "redirect_uri": settings.KAKAO_REDIRECT_URI,
+            "code": code,
+            "client_secret": settings.KAKAO_CLIENT_SECRET.get_secret_value(),
+        }
+
+    def parse_profile(self, data: dict) -> OAuthProfile:
+        kakao_account = data.get("kakao_account", {})
+        profile = kakao_account.get("profile", {})
+        return OAuthProfile(
+            provider=self.name,
+            social_id=str(data["id"]),
+            email=kakao_account.get("email"),
+            name=profile.get("nickname", "Unknown"),
+        )
+
+
+OAUTH_PROVIDERS: dict[str, OAuthProvider] = {provider.name: provider for provider in (KakaoOAuthProvider(),)}
+
+
+def get_oauth_provider(name: str) -> OAuthProvider:
+    provider = OAUTH_PROVIDERS.get(name)
+    if provider is None:
+        raise InvalidCredentialsException(detail="지원하지 않는 소셜 로그인입니다.")
+    return provider
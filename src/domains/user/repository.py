@@ -1,10 +1,24 @@
-from sqlalchemy import select
-from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy import select, or_, exists, literal_column, Row
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.exc import IntegrityError, SQLAlchemyError
 from sqlalchemy.ext.asyncio.session import AsyncSession
 
 from core.exception.exceptions import DatabaseException, UnexpectedException
+from domains.user.exceptions import (
+    DuplicateEmailException,
+    DuplicateNicknameException,
+    DuplicatePhoneNumException,
+    InvalidCredentialsException,
+)
 from domains.user.models import User
 
+# 유니크 제약 위반 -> 중복 예외 (PostgreSQL 기본 제약 이름: {table}_{column}_key)
+UNIQUE_VIOLATION_EXCEPTIONS = {
+    "users_email_key": DuplicateEmailException,
+    "users_nickname_key": DuplicateNicknameException,
+    "users_phone_hash_key": DuplicatePhoneNumException,
+}
+
 
 class UserRepository:
     def __init__(self, session: AsyncSession):
@@ -16,10 +30,43 @@ class UserRepository:
             await self.session.commit()
             await self.session.refresh(user)
             return user
+        except IntegrityError as e:
+            # 중복 확인 이후 다른 요청이 먼저 저장한 경우 -> 어떤 값이 겹쳤는지 중복 예외로 변환
+            await self.session.rollback()
+            raise self._unique_violation(e)
         except SQLAlchemyError as e:
             await self.session.rollback()
             raise DatabaseException(detail=f"유저 저장 실패: {str(e)}")
 
+    @staticmethod
+    def _unique_violation(e: IntegrityError) -> Exception:
+        for constraint, exception in UNIQUE_VIOLATION_EXCEPTIONS.items():
+            if constraint in str(e.orig):
+                return exception()
+        return DatabaseException(detail=f"유저 저장 실패: {str(e)}")
+
+    async def find_duplicate_fields(self, email: str, nickname: str, phone_hash: str | None = None) -> set[str]:
+        """email / nickname / phone_hash 중 이미 사용 중인 항목 (SELECT 한 번)"""
+        conditions = [User.email == email, User.nickname == nickname]
+        if phone_hash:
+            conditions.append(User.phone_hash == phone_hash)
+
+        try:
+            stmt = select(User.email, User.nickname, User.phone_hash).where(or_(*conditions))
+            result = await self.session.execute(stmt)
+        except SQLAlchemyError as e:
+            raise DatabaseException(detail=f"DB 조회 오류: {str(e)}")
+
+        duplicates = set()
+        for row in result.all():
+            if row.email == email:
+                duplicates.add("email")
+            if row.nickname == nickname:
+                duplicates.add("nickname")
+            if phone_hash and row.phone_hash == phone_hash:
+                duplicates.add("phone_hash")
+        return duplicates
+
     async def _get_one(self, *where_conditions) -> User | None:
         try:
             stmt = select(User).where(*where_conditions)
@@ -39,6 +86,30 @@ class UserRepository:
     async def get_user_by_phone_num(self, phone_hash: str) -> User | None:
         return await self._get_one(User.phone_hash == phone_hash)
 
+    async def _exists(self, *where_conditions) -> bool:
+        try:
+            result = await self.session.execute(select(exists().where(*where_conditions)))
+            return result.scalar()
+        except SQLAlchemyError as e:
+            raise DatabaseException(detail=f"DB 조회 오류: {str(e)}")
+
+    async def is_nickname_taken(self, nickname: str) -> bool:
+        return await self._exists(User.nickname == nickname)
+
+    async def is_email_taken(self, email: str) -> bool:
+        return await self._exists(User.email == email)
+
+    async def scan_user_identities(self, after_id=None, limit: int = 5000) -> list[Row]:
+        """id 순 keyset 스캔 (id, nickname, email) - 탈퇴한 유저도 유니크 제약에 걸리므로 포함"""
+        try:
+            stmt = select(User.id, User.nickname, User.email).order_by(User.id).limit(limit)
+            if after_id is not None:
+                stmt = stmt.where(User.id > after_id)
+            result = await self.session.execute(stmt)
+            return result.all()
+        except SQLAlchemyError as e:
+            raise DatabaseException(detail=f"DB 조회 오류: {str(e)}")
+
     async def get_user_by_id(self, user_id: str) -> User | None:
         return await self._get_one(User.id == user_id)
 
@@ -58,3 +129,39 @@ class UserRepository:
 
     async def get_user_by_social_id(self, provider: str, social_id: str) -> User | None:
         return await self._get_one(User.provider == provider, User.social_id == social_id)
+
+    async def upsert_social_user(
+        self, provider: str, social_id: str, nickname: str, email: str | None = None, name: str | None = None
+    ) -> tuple[User, bool]:
+        """
+        INSERT ... ON CONFLICT (social_id) -> (유저, 새로 가입했는지)
+        - 조회 후 저장하던 것을 쿼리 한 번으로 처리, 같은 계정으로 동시에 로그인해도 유저가 하나만 생김
+        - 충돌 대상은 기존 유니크 제약(users_social_id_key) -> 별도 인덱스 생성 없이 바로 동작
+        - 이미 있으면 값을 바꾸지 않고 기존 행을 그대로 반환 (xmax = 0이면 이번에 INSERT된 행)
+        - 같은 social_id를 다른 제공자가 쓰고 있으면 갱신 조건(provider 일치)에 걸려 행이 반환되지 않음
+        """
+        stmt = insert(User).values(
+            provider=provider, social_id=social_id, nickname=nickname, email=email, name=name, password=None
+        )
+        stmt = stmt.on_conflict_do_update(
+            constraint="users_social_id_key",
+            set_={"social_id": stmt.excluded.social_id},
+            where=User.provider == stmt.excluded.provider,
+        ).returning(User, literal_column("xmax = 0").label("inserted"))
+
+        try:
+            result = await self.session.execute(stmt, execution_options={"populate_existing": True})
+            row = result.one_or_none()
+            await self.session.commit()
+        except IntegrityError as e:
+            # 다른 계정과 email / nickname이 겹친 경우
+            await self.session.rollback()
+            raise self._unique_violation(e)
+        except SQLAlchemyError as e:
+            await self.session.rollback()
+            raise DatabaseException(detail=f"유저 저장 실패: {str(e)}")
+
+        if row is None:
+            raise InvalidCredentialsException(detail="다른 소셜 로그인으로 가입된 계정입니다.")
+        user, inserted = row
+        return user, inserted
@@ -70,3 +70,8 @@ class InfoResponse(BaseModel):
 
 class FindEmailResponse(BaseModel):
     email: str
+
+
+class AvailabilityResponse(BaseModel):
+    value: str = Field(..., examples=["도먹"])
+    available: bool = Field(..., description="사용 가능 여부", examples=[True])
@@ -1,10 +1,11 @@
+import asyncio
+
 from fastapi import Request
 from redis.asyncio import Redis
-import httpx
 import secrets
 
 from core import security
-from core.config import settings
+from core.hashing import password_hash_pool
 
 from domains.user.exceptions import (
     DuplicateEmailException,
@@ -19,7 +20,11 @@ from domains.user.exceptions import (
     PasswordMismatchException,
     IncorrectPasswordException,
 )
+from domains.user.availability import UserAvailabilityIndex
+from domains.user.cache import user_snapshot_cache
 from domains.user.repository import UserRepository
+from domains.user.oauth import OAuthProfile, OAuthProvider, get_oauth_provider
+from domains.user.session import SessionStore
 from domains.user.schemas import (
     SignUpRequest,
     LogInRequest,
@@ -32,79 +37,95 @@ from domains.user.schemas import (
     ChangePasswordRequest,
     ResetPasswordRequest,
     ChangeNicknameRequest,
+    AvailabilityResponse,
 )
 from domains.user.models import User
 
+OAUTH_STATE_KEY_PREFIX = "OAUTH_STATE:"
+OAUTH_STATE_TTL = 300
+
+
+def _discard(task: asyncio.Future | None):
+    """쓰지 않을 해싱 취소 (이미 끝나서 예외가 들어 있어도 확인 처리 -> 경고가 남지 않도록)"""
+    if task is None:
+        return
+    task.cancel()
+    task.add_done_callback(lambda t: t.cancelled() or t.exception())
+
 
 class UserService:
     def __init__(self, user_repo: UserRepository, redis: Redis):
         self.user_repo = user_repo
         self.redis = redis
+        self.sessions = SessionStore(redis)
+        self.availability = UserAvailabilityIndex(redis)
 
     async def get_user_by_token(self, access_token: str, req: Request) -> User:
         user_id: str = security.decode_jwt(access_token=access_token)
+
+        cached_user = await user_snapshot_cache.get(self.redis, user_id)
+        if cached_user:
+            return cached_user
+
         user: User | None = await self.user_repo.get_user_by_id(user_id)
 
         if not user:
             raise UserNotFoundException()
+
+        await user_snapshot_cache.set(self.redis, user)
         return user
 
     async def sign_up(self, request: SignUpRequest):
-        try:
-            if await self.user_repo.get_user_by_email(request.email):
-                raise DuplicateEmailException()
-
-            if await self.user_repo.get_user_by_nickname(request.nickname):
-                raise DuplicateNicknameException()
-
-            if request.password != request.checked_password:
-                raise InvalidCheckedPasswordException()
-
-            # 전화번호 처리 로직
-            phone_hash = None
-            encrypted_phone = None
-
-            if request.phone_num:
-                phone_hash = security.make_phone_hash(request.phone_num)
+        if request.password != request.checked_password:
+            raise InvalidCheckedPasswordException()
 
-                if await self.user_repo.get_user_by_phone_num(phone_hash):
-                    raise DuplicatePhoneNumException()
+        phone_hash = security.make_phone_hash(request.phone_num) if request.phone_num else None
 
-                encrypted_phone = security.encrypt_phone(request.phone_num)
-
-            hashed_password = security.hash_password(request.password)
-
-            user = User(
-                email=request.email,
-                password=hashed_password,
-                nickname=request.nickname,
-                name=request.name,
-                birth=request.birth,
-                phone=encrypted_phone,
-                phone_hash=phone_hash,
-            )
-            saved_user = await self.user_repo.save_user(user)
-            return saved_user
+        # 워커가 비어 있으면 중복 확인(SELECT 한 번)과 argon2 해싱(워커 스레드)을 동시에 진행
+        # 바쁠 때는 중복 확인을 통과한 요청만 해싱 (중복 가입 요청이 워커를 차지하지 않도록)
+        hashing = None
+        if password_hash_pool.has_capacity():
+            hashing = asyncio.ensure_future(security.hash_password_async(request.password))
+        try:
+            duplicates = await self.user_repo.find_duplicate_fields(request.email, request.nickname, phone_hash)
+        except BaseException:
+            _discard(hashing)
+            raise
 
-        except Exception as e:
-            raise e
+        if duplicates:
+            _discard(hashing)
+            if "email" in duplicates:
+                raise DuplicateEmailException()
+            if "nickname" in duplicates:
+                raise DuplicateNicknameException()
+            raise DuplicatePhoneNumException()
+
+        if hashing is None:
+            hashing = security.hash_password_async(request.password)
+
+        user = User(
+            email=request.email,
+            password=await hashing,
+            nickname=request.nickname,
+            name=request.name,
+            birth=request.birth,
+            phone=security.encrypt_phone(request.phone_num) if request.phone_num else None,
+            phone_hash=phone_hash,
+        )
+        # 확인 이후 동시에 가입한 요청과 겹치면 save_user가 유니크 제약 위반을 중복 예외로 변환
+        saved_user = await self.user_repo.save_user(user)
+        await self.availability.mark_taken(nickname=saved_user.nickname, email=saved_user.email)
+        return saved_user
 
     async def log_in(self, request: LogInRequest, req: Request):
         try:
             user = await self.user_repo.get_user_by_email(email=request.email)
 
-            if not user or not security.verify_password(request.password, user.password):
+            if not user or not await security.verify_password_async(request.password, user.password):
                 raise InvalidCredentialsException()
 
-            user_id = str(user.id)
-
             access_token = security.create_jwt(user_id=user.id)
-            refresh_token = security.create_refresh_token()
-            await self.redis.set(
-                name=f"RT:{refresh_token}",
-                value=user_id,
-                ex=60 * 60 * 24 * 14,  # 14일 뒤 자동 삭제
-            )
+            refresh_token = await self.sessions.issue(user.id)
 
             return LogInResponse(
                 access_token=access_token,
@@ -126,8 +147,7 @@ class UserService:
         return InfoResponse(email=user.email, nickname=user.nickname)
 
     async def refresh_token(self, request: RefreshTokenRequest) -> LogInResponse:
-        redis_key = f"RT:{request.refresh_token}"
-        user_id = await self.redis.get(redis_key)
+        user_id = await self.sessions.get_user_id(request.refresh_token)
 
         if not user_id:
             raise TokenExpiredException()
@@ -140,9 +160,7 @@ class UserService:
         )
 
     async def log_out(self, request: LogOutRequest, user_id: str) -> None:
-        redis_key = f"RT:{request.refresh_token}"
-
-        stored_user_id = await self.redis.get(redis_key)
+        stored_user_id = await self.sessions.get_user_id(request.refresh_token)
 
         if not stored_user_id:
             raise TokenExpiredException()
@@ -150,7 +168,7 @@ class UserService:
         if stored_user_id != str(user_id):
             raise TokenForbiddenException()
 
-        await self.redis.delete(redis_key)
+        await self.sessions.revoke(user_id, request.refresh_token)
 
         return None
 
@@ -171,17 +189,21 @@ class UserService:
         if not user:
             raise UserNotFoundException()
 
-        if not security.verify_password(request.current_password, user.password):
+        if not await security.verify_password_async(request.current_password, user.password):
             raise IncorrectPasswordException()
 
-        if security.verify_password(request.new_password, user.password):
+        # 현재 비밀번호가 검증되었으므로 평문 비교만으로 동일 여부를 알 수 있음 (해시 검증 1회 절약)
+        if request.new_password == request.current_password:
             raise PasswordUnchangedException()
 
         if request.new_password != request.checked_new_password:
             raise PasswordMismatchException()
 
-        user.password = security.hash_password(request.new_password)
+        user.password = await security.hash_password_async(request.new_password)
         await self.user_repo.update_user(user)
+        await user_snapshot_cache.invalidate(self.redis, user.id)
+        # 비밀번호가 바뀌었으므로 현재 기기를 포함한 모든 세션(리프레시 토큰)을 끊음 -> 다시 로그인 필요
+        await self.sessions.revoke_all(user.id)
 
     async def reset_password(self, request: ResetPasswordRequest) -> None:
         if request.new_password != request.checked_new_password:
@@ -193,11 +215,14 @@ class UserService:
         if not user or user.name != request.name or user.birth != request.birth or user.phone_hash != phone_hash:
             raise UserNotFoundException()
 
-        if security.verify_password(request.new_password, user.password):
+        if await security.verify_password_async(request.new_password, user.password):
             raise PasswordUnchangedException()
 
-        user.password = security.hash_password(request.new_password)
+        user.password = await security.hash_password_async(request.new_password)
         await self.user_repo.update_user(user)
+        await user_snapshot_cache.invalidate(self.redis, user.id)
+        # 모든 세션을 끊어 탈취됐을 수 있는 기존 로그인도 무효화
+        await self.sessions.revoke_all(user.id)
 
     async def change_nickname(self, request: ChangeNicknameRequest, user_id: str) -> None:
         user = await self.user_repo.get_user_by_id(user_id)
@@ -214,109 +239,90 @@ class UserService:
 
         user.nickname = request.nickname
         await self.user_repo.update_user(user)
+        await user_snapshot_cache.invalidate(self.redis, user.id)
+        await self.availability.mark_taken(nickname=user.nickname)
 
 
-class SocialAuthService:
+class AvailabilityService:
+    """
+    닉네임 / 이메일 사용 가능 여부 확인 (입력 중 실시간 확인용)
+    Bloom filter에서 "확실히 없음"이면 DB 조회 없이 응답하고, 있을 수도 있으면 DB로 확인
+    """
+
     def __init__(self, user_repo: UserRepository, redis: Redis):
         self.user_repo = user_repo
-        self.redis = redis
-
-    async def get_kakao_auth_url(self) -> str:
-        state = secrets.token_urlsafe(32)
-        await self.redis.set(f"OAUTH_STATE:{state}", "valid", ex=300)
-
-        return (
-            f"https://kauth.kakao.com/oauth/authorize?"
-            f"client_id={settings.KAKAO_REST_API_KEY}&"
-            f"redirect_uri={settings.KAKAO_REDIRECT_URI}&"
-            f"response_type=code&"
-            f"state={state}"
-        )
-
-    async def kakao_login(self, code: str, state: str) -> LogInResponse:
-        # 0. State 검증
-        redis_key = f"OAUTH_STATE:{state}"
-        saved_state = await self.redis.get(redis_key)
-
-        if not saved_state:
-            raise InvalidCredentialsException(detail="유효하지 않은 접근입니다. (State 불일치)")
+        self.index = UserAvailabilityIndex(redis)
 
-        await self.redis.delete(redis_key)
+    async def _is_available(self, field: str, value: str, is_taken) -> bool:
+        try:
+            might_exist = await self.index.might_exist(field, value)
+        except Exception as e:
+            print(f"Availability Check Error: {e}")
+            might_exist = None
 
-        kakao_token = await self._get_kakao_token(code)
+        if might_exist is False:
+            return True
+        return not await is_taken(value)
 
-        kakao_user_info = await self._get_kakao_user_info(kakao_token)
+    async def check_nickname(self, nickname: str) -> AvailabilityResponse:
+        available = await self._is_available("nickname", nickname, self.user_repo.is_nickname_taken)
+        return AvailabilityResponse(value=nickname, available=available)
 
-        social_id = str(kakao_user_info["id"])
+    async def check_email(self, email: str) -> AvailabilityResponse:
+        available = await self._is_available("email", email, self.user_repo.is_email_taken)
+        return AvailabilityResponse(value=email, available=available)
 
-        user = await self.user_repo.get_user_by_social_id(provider="kakao", social_id=social_id)
 
-        if not user:
-            kakao_account = kakao_user_info.get("kakao_account", {})
-            profile = kakao_account.get("profile", {})
-
-            nickname = f"k_{social_id}"
-            email = kakao_account.get("email")
-
-            new_user = User(
-                email=email,
-                nickname=nickname,
-                password=None,
-                name=profile.get("nickname", "Unknown"),
-                provider="kakao",
-                social_id=social_id,
-                phone=None,
-                phone_hash=None,
-            )
-            user = await self.user_repo.save_user(new_user)
-
-        return await self._issue_tokens(user)
+class SocialAuthService:
+    def __init__(self, user_repo: UserRepository, redis: Redis):
+        self.user_repo = user_repo
+        self.redis = redis
+        self.sessions = SessionStore(redis)
+        self.availability = UserAvailabilityIndex(redis)
 
-    async def _get_kakao_token(self, code: str) -> str:
-        url = "https://kauth.kakao.com/oauth/token"
-        headers = {"Content-Type": "application/x-www-form-urlencoded"}
-        data = {
-            "grant_type": "authorization_code",
-            "client_id": settings.KAKAO_REST_API_KEY,
-            "redirect_uri": settings.KAKAO_REDIRECT_URI,
-            "code": code,
-            "client_secret": settings.KAKAO_CLIENT_SECRET.get_secret_value(),
-        }
+    async def get_auth_url(self, provider_name: str) -> str:
+        provider = get_oauth_provider(provider_name)
+        state = secrets.token_urlsafe(32)
+        # 값으로 제공자를 저장 -> 다른 제공자의 콜백에 state를 재사용할 수 없음
+        await self.redis.set(f"{OAUTH_STATE_KEY_PREFIX}{state}", provider.name, ex=OAUTH_STATE_TTL)
+        return provider.authorize_url(state)
 
-        async with httpx.AsyncClient() as client:
-            response = await client.post(url, headers=headers, data=data)
+    async def login(self, provider_name: str, code: str, state: str) -> LogInResponse:
+        provider = get_oauth_provider(provider_name)
 
-            if response.status_code != 200:
-                raise InvalidCredentialsException(detail="카카오 토큰 발급 실패")
+        # 0. State 검증 (GETDEL로 조회와 삭제를 한 번에 -> 같은 state로 동시에 들어온 콜백은 하나만 통과)
+        saved_state = await self.redis.getdel(f"{OAUTH_STATE_KEY_PREFIX}{state}")
+        if saved_state != provider.name:
+            raise InvalidCredentialsException(detail="유효하지 않은 접근입니다. (State 불일치)")
 
-            return response.json().get("access_token")
+        profile = await self._fetch_profile(provider, code)
 
-    async def _get_kakao_user_info(self, access_token: str) -> dict:
-        url = "https://kapi.kakao.com/v2/user/me"
+        user, created = await self.user_repo.upsert_social_user(
+            provider=profile.provider,
+            social_id=profile.social_id,
+            nickname=provider.nickname_for(profile),
+            email=profile.email,
+            name=profile.name,
+        )
+        if created:
+            await self.availability.mark_taken(nickname=user.nickname, email=user.email)
 
-        headers = {
-            "Authorization": f"Bearer {access_token}",
-            "Content-Type": "application/x-www-form-urlencoded;charset=utf-8",
-        }
+        return await self._issue_tokens(user)
 
-        async with httpx.AsyncClient() as client:
-            response = await client.get(url, headers=headers)
+    async def _fetch_profile(self, provider: OAuthProvider, code: str) -> OAuthProfile:
+        """인가 코드 -> 제공자 유저 정보 (인가 코드는 한 번만 쓸 수 있어 재시도된 콜백은 여기까지 오지 않음)"""
+        access_token = await provider.exchange_code(code)
+        return provider.parse_profile(await provider.fetch_user_info(access_token))
 
-            if response.status_code != 200:
-                raise InvalidCredentialsException(detail="카카오 유저 정보 조회 실패")
+    async def get_kakao_auth_url(self) -> str:
+        return await self.get_auth_url("kakao")
 
-            return response.json()
+    async def kakao_login(self, code: str, state: str) -> LogInResponse:
+        return await self.login("kakao", code, state)
 
     async def _issue_tokens(self, user: User) -> LogInResponse:
-        user_id = str(user.id)
-        access_token = security.create_jwt(user_id=user_id)
-        refresh_token = security.create_refresh_token()
-
-        await self.redis.set(
-            name=f"RT:{refresh_token}",
-            value=user_id,
-            ex=60 * 60 * 24 * 14,
-        )
+        access_token = security.create_jwt(user_id=str(user.id))
+        refresh_token = await self.sessions.issue(user.id)
 
         return LogInResponse(
             access_token=access_token,
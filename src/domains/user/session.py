@@ -0,0 +1,166 @@
+"""
+리프레시 토큰 세션 저장소
+
+- `RT:{token}` -> user_id (STRING, TTL) : 토큰으로 유저 조회 O(1)
+- `SESSIONS:{user_id}` -> token (ZSET, score=만료 시각(마이크로초)) : 유저별 세션 목록
+  -> 유저의 모든 세션 폐기가 SCAN 없이 O(세션 수)
+
+만료된 세션은 다음 발급 때 정리되고, 로그인이 없는 유저의 목록은 키 TTL로 사라짐
+전체 정리 (src 디렉토리 기준):
+    python -m domains.user.session
+"""
+
+import asyncio
+import hashlib
+
+from redis.asyncio import Redis
+from redis.exceptions import NoScriptError
+
+from core import security
+from core.database import redis_pool
+
+REFRESH_TOKEN_TTL = 60 * 60 * 24 * 14  # 14일 뒤 자동 삭제
+MAX_SESSIONS_PER_USER = 10  # 넘으면 가장 오래된 세션부터 폐기
+SESSION_CLEANUP_BATCH_SIZE = 500
+
+TOKEN_KEY_PREFIX = "RT:"
+SESSIONS_KEY_PREFIX = "SESSIONS:"
+
+# KEYS: RT:{token}, SESSIONS:{user_id} / ARGV: user_id, token, ttl, 최대 세션 수, 토큰 키 prefix
+# 토큰 저장 + 만료된 세션 정리 + 최대 세션 수를 넘는 오래된 세션 폐기를 한 번에 처리 -> 폐기한 세션 수
+# score를 마이크로초로 둬서 같은 초에 발급된 세션도 발급 순서대로 폐기됨
+ISSUE_SCRIPT = """
+local clock = redis.call('TIME')
+local now = tonumber(clock[1]) * 1000000 + tonumber(clock[2])
+local ttl = tonumber(ARGV[3])
+local max_sessions = tonumber(ARGV[4])
+
+redis.call('SET', KEYS[1], ARGV[1], 'EX', ttl)
+redis.call('ZREMRANGEBYSCORE', KEYS[2], '-inf', string.format('%.0f', now))
+redis.call('ZADD', KEYS[2], string.format('%.0f', now + ttl * 1000000), ARGV[2])
+
+local evicted = 0
+local overflow = redis.call('ZCARD', KEYS[2]) - max_sessions
+if overflow > 0 then
+    local tokens = redis.call('ZRANGE', KEYS[2], 0, overflow - 1)
+    for _, token in ipairs(tokens) do
+        redis.call('UNLINK', ARGV[5] .. token)
+    end
+    redis.call('ZREMRANGEBYRANK', KEYS[2], 0, overflow - 1)
+    evicted = #tokens
+end
+redis.call('EXPIRE', KEYS[2], ttl)
+return evicted
+"""
+
+# KEYS: RT:{token}, SESSIONS:{user_id} / ARGV: token
+REVOKE_SCRIPT = """
+redis.call('UNLINK', KEYS[1])
+return redis.call('ZREM', KEYS[2], ARGV[1])
+"""
+
+# KEYS: SESSIONS:{user_id} / ARGV: 토큰 키 prefix -> 폐기한 세션 수
+REVOKE_ALL_SCRIPT = """
+local tokens = redis.call('ZRANGE', KEYS[1], 0, -1)
+for i = 1, #tokens, 1000 do
+    local keys = {}
+    for j = i, math.min(i + 999, #tokens) do
+        keys[#keys + 1] = ARGV[1] .. tokens[j]
+    end
+    redis.call('UNLINK', unpack(keys))
+end
+redis.call('UNLINK', KEYS[1])
+return #tokens
+"""
+
+ISSUE_SCRIPT_SHA = hashlib.sha1(ISSUE_SCRIPT.encode("UTF-8")).hexdigest()
+REVOKE_SCRIPT_SHA = hashlib.sha1(REVOKE_SCRIPT.encode("UTF-8")).hexdigest()
+REVOKE_ALL_SCRIPT_SHA = hashlib.sha1(REVOKE_ALL_SCRIPT.encode("UTF-8")).hexdigest()
+
+
+class SessionStore:
+    """
+    리프레시 토큰 발급 / 조회 / 폐기
+    - 조회는 GET 한 번, 발급/폐기는 Lua 한 번(왕복 1회)으로 원자적으로 처리
+    - 기존에 발급된 `RT:{token}` 키도 그대로 조회/폐기 가능 (유저별 목록에만 없음)
+    """
+
+    def __init__(self, redis: Redis, ttl: int = REFRESH_TOKEN_TTL, max_sessions: int = MAX_SESSIONS_PER_USER):
+        self.redis = redis
+        self.ttl = ttl
+        self.max_sessions = max_sessions
+
+    @staticmethod
+    def _token_key(token: str) -> str:
+        return f"{TOKEN_KEY_PREFIX}{token}"
+
+    @staticmethod
+    def _sessions_key(user_id) -> str:
+        return f"{SESSIONS_KEY_PREFIX}{user_id}"
+
+    async def _eval(self, script: str, sha: str, keys: list[str], args: list):
+        try:
+            return await self.redis.evalsha(sha, len(keys), *keys, *args)
+        except NoScriptError:
+            return await self.redis.eval(script, len(keys), *keys, *args)
+
+    async def issue(self, user_id) -> str:
+        """새 리프레시 토큰 발급 (최대 세션 수를 넘으면 가장 오래된 세션 폐기)"""
+        user_id = str(user_id)
+        token = security.create_refresh_token()
+        await self._eval(
+            ISSUE_SCRIPT,
+            ISSUE_SCRIPT_SHA,
+            [self._token_key(token), self._sessions_key(user_id)],
+            [user_id, token, self.ttl, self.max_sessions, TOKEN_KEY_PREFIX],
+        )
+        return token
+
+    async def get_user_id(self, token: str) -> str | None:
+        return await self.redis.get(self._token_key(token))
+
+    async def revoke(self, user_id, token: str):
+        await self._eval(
+            REVOKE_SCRIPT, REVOKE_SCRIPT_SHA, [self._token_key(token), self._sessions_key(user_id)], [token]
+        )
+
+    async def revoke_all(self, user_id) -> int:
+        """유저의 모든 세션 폐기 (비밀번호 변경/재설정) -> 폐기한 세션 수"""
+        return await self._eval(
+            REVOKE_ALL_SCRIPT, REVOKE_ALL_SCRIPT_SHA, [self._sessions_key(user_id)], [TOKEN_KEY_PREFIX]
+        )
+
+    async def cleanup(self, batch_size: int = SESSION_CLEANUP_BATCH_SIZE) -> int:
+        """모든 유저 목록에서 만료된 세션 제거 (배치마다 pipeline 한 번) -> 제거한 세션 수"""
+        seconds, microseconds = await self.redis.time()
+        now = int(seconds) * 1_000_000 + int(microseconds)
+        removed = 0
+        batch: list[str] = []
+
+        async def flush():
+            async with self.redis.pipeline(transaction=False) as pipe:
+                for key in batch:
+                    pipe.zremrangebyscore(key, "-inf", now)
+                return sum(await pipe.execute())
+
+        async for key in self.redis.scan_iter(match=f"{SESSIONS_KEY_PREFIX}*", count=batch_size):
+            batch.append(key)
+            if len(batch) >= batch_size:
+                removed += await flush()
+                batch = []
+        if batch:
+            removed += await flush()
+        return removed
+
+
+async def main():
+    redis_client = Redis(connection_pool=redis_pool)
+    try:
+        removed = await SessionStore(redis_client).cleanup()
+        print(f"Session cleanup finished: removed={removed}")
+    finally:
+        await redis_client.close()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
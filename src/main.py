@@ -1,8 +1,20 @@
-from fastapi import FastAPI
+import asyncio
+import hmac
+from contextlib import asynccontextmanager
+
+from fastapi import Depends, FastAPI, Header
 from fastapi.exceptions import RequestValidationError
+from redis.asyncio import Redis
 from starlette.exceptions import HTTPException as StarletteHTTPException
 
 from api.v1.api import api_router
+from core.config import settings
+from core.database import redis_pool, engine, get_pool_stats
+from core.hashing import password_hash_pool
+from core.indexes import ensure_tables, load_models
+from core.http import http_clients
+from core.log_buffer import log_buffer
+from core.security import verified_token_cache
 from core.exception.exceptions import BaseCustomException
 from core.exception.exception_handlers import (
     custom_exception_handler,
@@ -10,8 +22,60 @@ from core.exception.exception_handlers import (
     http_exception_handler,
     validation_exception_handler,
 )
+from domains.ingredient.cache import expiry_cache, non_ingredient_index
+from domains.ingredient.notifications import expiry_notification_scheduler
+from domains.user.availability import UserAvailabilityIndex
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    redis_client = Redis(connection_pool=redis_pool)
+    http_clients.start()
+
+    try:
+        # 새 테이블 / 컬럼 반영 (없으면 로그 저장, 유통기한 학습 등이 실패함), 인덱스는 python -m core.indexes
+        changed = await ensure_tables(engine, load_models())
+        if changed:
+            print(f"Schema updated: {changed}")
+    except Exception as e:
+        print(f"Schema Update Error: {e}")
+
+    log_buffer.start()
+
+    try:
+        await expiry_cache.load(redis_client)
+    except Exception as e:
+        # 로드에 실패해도 서비스는 DB 조회로 동작하고, 백그라운드에서 다시 시도함
+        print(f"ExpiryCache Load Error: {e}")
+
+    try:
+        await non_ingredient_index.load(redis_client)
+    except Exception as e:
+        # 로드 전에는 식재료 저장 문장에서 제외 식재료를 걸러냄
+        print(f"NonIngredientIndex Load Error: {e}")
+
+    background_tasks = [
+        asyncio.create_task(expiry_cache.watch(redis_client)),
+        asyncio.create_task(non_ingredient_index.watch(redis_client)),
+        # 닉네임/이메일 Bloom filter가 없으면 만들어 둠 (그 전까지 확인은 DB로)
+        asyncio.create_task(UserAvailabilityIndex(redis_client).ensure_built()),
+    ]
+    if settings.EXPIRY_NOTIFICATION_ENABLED:
+        background_tasks.append(asyncio.create_task(expiry_notification_scheduler.run_forever(redis_client)))
 
-app = FastAPI()
+    yield
+
+    for task in background_tasks:
+        task.cancel()
+    await asyncio.gather(*background_tasks, return_exceptions=True)
+    await log_buffer.close()  # 남은 분석 로그 저장 후 DB 엔진 정리
+    await redis_client.close()
+    await http_clients.close()
+    password_hash_pool.shutdown()
+    await engine.dispose()
+
+
+app = FastAPI(lifespan=lifespan)
 
 app.add_exception_handler(BaseCustomException, custom_exception_handler)
 app.add_exception_handler(Exception, system_exception_handler)
@@ -24,3 +88,21 @@ app.include_router(api_router, prefix="/api/v1")
 @app.get("/health", status_code=200)
 def health_check():
     return {"status": "ok"}
+
+
+def verify_metrics_token(x_metrics_token: str | None = Header(default=None)):
+    # 내부 모니터링용 -> 토큰이 설정되지 않았거나 다르면 없는 경로처럼 404
+    token = settings.METRICS_TOKEN
+    if token is None or not hmac.compare_digest((x_metrics_token or "").encode(), token.get_secret_value().encode()):
+        raise StarletteHTTPException(status_code=404, detail="Not Found")
+
+
+@app.get("/metrics", status_code=200, include_in_schema=False, dependencies=[Depends(verify_metrics_token)])
+def metrics():
+    return {
+        "db_pool": get_pool_stats(),
+        "password_hash": password_hash_pool.stats(),
+        "log_buffer": log_buffer.stats(),
+        "expiry_notifications": expiry_notification_scheduler.stats(),
+        "verified_tokens": verified_token_cache.stats(),
+    }
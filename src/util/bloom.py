@@ -0,0 +1,42 @@
+# src/util/bloom.py
+import hashlib
+import math
+
+
+def bloom_parameters(capacity: int, error_rate: float) -> tuple[int, int]:
+    """(비트 수, 해시 개수) - capacity개를 넣었을 때 false positive 비율이 약 error_rate"""
+    capacity = max(capacity, 1)
+    size = max(int(-capacity * math.log(error_rate) / (math.log(2) ** 2)), 8)
+    hash_count = max(round(size / capacity * math.log(2)), 1)
+    return size, hash_count
+
+
+def bloom_positions(item: str, size: int, hash_count: int) -> list[int]:
+    """blake2b 한 번으로 두 값을 얻어서 hash_count개 비트 위치 계산 (double hashing)"""
+    digest = hashlib.blake2b(item.encode("UTF-8"), digest_size=16).digest()
+    h1 = int.from_bytes(digest[:8], "little")
+    h2 = int.from_bytes(digest[8:], "little") | 1
+    return [(h1 + i * h2) % size for i in range(hash_count)]
+
+
+class BloomFilter:
+    """
+    비트 배열 Bloom filter
+    - might_contain이 False면 확실히 없음, True면 있을 수도 있음 (false positive 비율 약 error_rate)
+    """
+
+    def __init__(self, capacity: int, error_rate: float = 0.01):
+        self.size, self.hash_count = bloom_parameters(capacity, error_rate)
+        self._bits = bytearray((self.size + 7) // 8)
+
+    def positions(self, item: str) -> list[int]:
+        return bloom_positions(item, self.size, self.hash_count)
+
+    def add(self, item: str):
+        for pos in self.positions(item):
+            self._bits[pos >> 3] |= 1 << (pos & 7)
+
+    def might_contain(self, item: str) -> bool:
+        return all(self._bits[pos >> 3] & (1 << (pos & 7)) for pos in self.positions(item))
+
+    __contains__ = might_contain
@@ -0,0 +1,19 @@
+# src/util/pagination.py
+import base64
+import json
+
+
+# 커서는 클라이언트가 내용을 신경 쓰지 않도록 JSON을 base64url로 감싼 문자열
+def encode_cursor(data: dict) -> str:
+    raw = json.dumps(data, separators=(",", ":"), default=str).encode("UTF-8")
+    return base64.urlsafe_b64encode(raw).decode("ascii").rstrip("=")
+
+
+def decode_cursor(cursor: str) -> dict:
+    """형식이 잘못된 커서면 ValueError"""
+    padded = cursor + "=" * (-len(cursor) % 4)
+    data = json.loads(base64.urlsafe_b64decode(padded.encode("ascii")))
+
+    if not isinstance(data, dict):
+        raise ValueError("cursor must be a JSON object")
+    return data
@@ -0,0 +1,40 @@
+# src/util/sse.py
+import json
+from typing import AsyncIterator, Any
+
+from fastapi.responses import StreamingResponse
+from pydantic import BaseModel
+
+from core.exception.exceptions import BaseCustomException
+
+SSE_HEADERS = {
+    "Cache-Control": "no-cache",
+    "X-Accel-Buffering": "no",  # nginx 프록시 버퍼링 끄기 (이벤트가 모였다가 한꺼번에 나가지 않도록)
+}
+
+
+def format_sse(event: str, data: Any) -> str:
+    if isinstance(data, BaseModel):
+        payload = data.model_dump_json()
+    else:
+        payload = json.dumps(data, ensure_ascii=False)
+    return f"event: {event}\ndata: {payload}\n\n"
+
+
+async def _encode(events: AsyncIterator[tuple[str, Any]]) -> AsyncIterator[str]:
+    try:
+        async for event, data in events:
+            yield format_sse(event, data)
+
+    # 스트림이 시작된 뒤에는 HTTP 상태 코드를 바꿀 수 없으므로 에러도 이벤트로 전달
+    except BaseCustomException as e:
+        yield format_sse("error", {"status_code": e.status_code, "code": e.code, "detail": e.detail})
+
+    except Exception as e:
+        print(f"SSE Stream Error: {e}")
+        yield format_sse("error", {"status_code": 500, "code": "SERVER_ERROR", "detail": "서버 내부 오류"})
+
+
+def sse_response(events: AsyncIterator[tuple[str, Any]]) -> StreamingResponse:
+    """(이벤트 이름, 데이터) 비동기 이터레이터를 text/event-stream 응답으로 변환"""
+    return StreamingResponse(_encode(events), media_type="text/event-stream", headers=SSE_HEADERS)
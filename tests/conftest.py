@@ -2,7 +2,7 @@ import pytest
 import pytest_asyncio
 import uuid
 from unittest.mock import AsyncMock
-from sqlalchemy.ext.asyncio import create_async_engine, AsyncSession
+from sqlalchemy.ext.asyncio import create_async_engine, AsyncSession, async_sessionmaker
 from sqlalchemy.pool import NullPool
 from sqlalchemy import text
 from testcontainers.postgres import PostgresContainer
@@ -11,6 +11,7 @@ from httpx import AsyncClient, ASGITransport
 from main import app
 from core.database import get_db, Base, get_redis  # [중요] get_redis 임포트
 from core.di import get_current_user
+from core.log_buffer import log_buffer
 from domains.user.models import User
 
 
@@ -78,6 +79,9 @@ def mock_redis():
     # 기본적으로는 "저장된 유저가 있다"고 가정
     mock.get.return_value = "user-uuid-123"
 
+    # 한도 검사 Lua 스크립트는 항상 통과
+    mock.evalsha.return_value = [1, 0, 0, 9]
+
     return mock
 
 
@@ -101,11 +105,17 @@ async def client(db_engine, mock_redis):  # 여기에 mock_redis 주입
     app.dependency_overrides[get_db] = override_get_db
     app.dependency_overrides[get_redis] = override_get_redis
 
+    # (3) 분석 로그 버퍼도 테스트 DB에 저장 (lifespan이 돌지 않으므로 테스트에서 직접 flush)
+    default_session_factory = log_buffer.session_factory
+    log_buffer.session_factory = async_sessionmaker(db_engine, expire_on_commit=False)
+
     async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as ac:
         yield ac
 
     # 테스트 끝나면 오버라이드 해제
     app.dependency_overrides.clear()
+    await log_buffer.close()
+    log_buffer.session_factory = default_session_factory
 
 
 @pytest_asyncio.fixture(scope="function")
@@ -0,0 +1,74 @@
+import pytest
+from types import SimpleNamespace
+from sqlalchemy import text
+from sqlalchemy.exc import TimeoutError as PoolTimeoutError
+
+from core.config import settings
+from core.database import MeteredQueuePool, PoolMetrics, create_engine_from_settings, pool_metrics
+
+
+def _config(db_engine, **overrides):
+    """테스트 DB를 가리키는 설정 (나머지 값은 기본 설정 그대로)"""
+    values = settings.model_dump()
+    values["POSTGRES_DATABASE_URL"] = db_engine.url.render_as_string(hide_password=False)
+    values.update(overrides)
+    return SimpleNamespace(**values)
+
+
+class TestPoolMetrics:
+    def test_record_and_stats(self):
+        metrics = PoolMetrics()
+        for wait in (0.0005, 0.005, 0.05, 0.5, 2.0):
+            metrics.record(wait)
+        metrics.timeouts += 1
+
+        stats = metrics.stats()
+
+        assert stats["checkouts"] == 5
+        assert stats["timeouts"] == 1
+        assert stats["max_wait_ms"] == 2000.0
+        assert stats["avg_wait_ms"] == round((0.0005 + 0.005 + 0.05 + 0.5 + 2.0) / 5 * 1000, 3)
+        assert stats["wait_histogram"] == {"lt_1ms": 1, "lt_10ms": 1, "lt_100ms": 1, "lt_1000ms": 1, "gte_1000ms": 1}
+
+    def test_empty_stats(self):
+        assert PoolMetrics().stats()["avg_wait_ms"] == 0.0
+
+
+@pytest.mark.asyncio
+class TestEngineSettings:
+    async def test_statement_timeout_applied(self, db_engine):
+        """[DB] 설정한 statement_timeout이 세션에 적용됨"""
+        engine = create_engine_from_settings(_config(db_engine, DB_STATEMENT_TIMEOUT_MS=1234))
+        try:
+            async with engine.connect() as conn:
+                assert await conn.scalar(text("SHOW statement_timeout")) == "1234ms"
+        finally:
+            await engine.dispose()
+
+    async def test_statement_timeout_disabled(self, db_engine):
+        engine = create_engine_from_settings(_config(db_engine, DB_STATEMENT_TIMEOUT_MS=0))
+        try:
+            async with engine.connect() as conn:
+                assert await conn.scalar(text("SHOW statement_timeout")) == "0"
+        finally:
+            await engine.dispose()
+
+    async def test_pool_metrics_accounting(self, db_engine):
+        """[DB] 체크아웃마다 대기 시간을 기록하고, 풀이 가득 차서 실패하면 timeout도 셈"""
+        engine = create_engine_from_settings(_config(db_engine, DB_POOL_SIZE=1, DB_MAX_OVERFLOW=0, DB_POOL_TIMEOUT=0.1))
+        assert isinstance(engine.pool, MeteredQueuePool)
+        checkouts, timeouts = pool_metrics.checkouts, pool_metrics.timeouts
+        try:
+            async with engine.connect() as conn:
+                await conn.execute(text("SELECT 1"))
+                assert engine.pool.checkedout() == 1
+
+                with pytest.raises(PoolTimeoutError):
+                    async with engine.connect():
+                        pass
+        finally:
+            await engine.dispose()
+
+        assert pool_metrics.checkouts == checkouts + 2
+        assert pool_metrics.timeouts == timeouts + 1
+        assert pool_metrics.max_wait >= 0.1
@@ -0,0 +1,65 @@
+import asyncio
+import threading
+
+import pytest
+
+from core.exception.exceptions import ServiceBusyException
+from core.hashing import PasswordHashPool
+
+
+@pytest.mark.asyncio
+class TestPasswordHashPool:
+    async def test_run_in_worker_thread(self):
+        """[Hashing] 작업이 이벤트 루프 스레드가 아닌 워커 스레드에서 실행됨"""
+        pool = PasswordHashPool(max_workers=1, max_queue=1)
+
+        thread_name = await pool.run(lambda: threading.current_thread().name)
+
+        assert thread_name.startswith("password-hash")
+        assert pool.stats()["completed"] == 1
+        pool.shutdown()
+
+    async def test_reject_when_queue_full(self):
+        """[Hashing] 대기열이 가득 차면 503 예외로 즉시 거절"""
+        pool = PasswordHashPool(max_workers=1, max_queue=1)
+        release = threading.Event()
+
+        running = asyncio.create_task(pool.run(release.wait))
+        await asyncio.sleep(0.05)
+        waiting = asyncio.create_task(pool.run(lambda: True))
+        await asyncio.sleep(0.05)
+
+        assert pool.stats()["queue_depth"] == 1
+
+        with pytest.raises(ServiceBusyException):
+            await pool.run(lambda: True)
+
+        release.set()
+        await asyncio.gather(running, waiting)
+        assert pool.stats()["rejected"] == 1
+        pool.shutdown()
+
+    async def test_cancelled_run_keeps_slot_until_done(self):
+        """[Hashing] 기다리던 쪽이 취소돼도 워커 작업이 끝날 때까지 슬롯을 잡고 있음 (대기열 한도 유지)"""
+        pool = PasswordHashPool(max_workers=1, max_queue=1)
+        release = threading.Event()
+
+        cancelled = asyncio.create_task(pool.run(release.wait))
+        await asyncio.sleep(0.05)
+        cancelled.cancel()
+        await asyncio.sleep(0.05)
+
+        assert pool.stats()["running"] == 1
+        assert not pool.has_capacity()
+
+        waiting = asyncio.create_task(pool.run(lambda: True))
+        await asyncio.sleep(0.05)
+        with pytest.raises(ServiceBusyException):
+            await pool.run(lambda: True)
+
+        release.set()
+        assert await waiting is True
+        assert cancelled.cancelled()
+        assert pool.stats()["running"] == 0
+        assert pool.stats()["completed"] == 2
+        pool.shutdown()
@@ -0,0 +1,36 @@
+import pytest
+
+from core.http import HttpClientRegistry, HTTP_CLIENT_CONFIGS
+
+
+@pytest.mark.asyncio
+class TestHttpClientRegistry:
+    async def test_get_reuses_client(self):
+        """[HTTP] 같은 이름으로 요청하면 같은 클라이언트(커넥션 풀)를 재사용"""
+        registry = HttpClientRegistry(HTTP_CLIENT_CONFIGS)
+
+        client = registry.get("openai")
+
+        assert registry.get("openai") is client
+        assert registry.get("kakao") is not client
+        await registry.close()
+
+    async def test_close_and_recreate(self):
+        """[HTTP] close 후에는 모든 클라이언트가 닫히고, 다시 get 하면 새로 생성"""
+        registry = HttpClientRegistry(HTTP_CLIENT_CONFIGS)
+        registry.start()
+        client = registry.get("unsplash")
+
+        await registry.close()
+
+        assert client.is_closed
+        assert registry.get("unsplash") is not client
+        await registry.close()
+
+    async def test_http2_enabled_per_config(self):
+        """[HTTP] http2=True인 클라이언트만 HTTP/2 협상 (httpx[http2] 의존성)"""
+        registry = HttpClientRegistry(HTTP_CLIENT_CONFIGS)
+
+        assert registry.get("openai")._transport._pool._http2
+        assert not registry.get("kakao")._transport._pool._http2
+        await registry.close()
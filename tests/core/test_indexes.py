@@ -0,0 +1,55 @@
+import pytest
+from sqlalchemy import inspect, text
+from sqlalchemy.ext.asyncio import create_async_engine
+from sqlalchemy.pool import NullPool
+
+from core.indexes import ensure_tables, load_models
+
+SCHEMA = "baseline_schema_test"
+
+# baseline 이후에 추가된 테이블 / 컬럼
+ADDED_TABLES = ["ingredient_aliases", "expiry_day_histograms", "expiry_day_proposals", "batch_job_watermarks"]
+ADDED_COLUMNS = {"expiry_deviation_logs": ["observed_day"]}
+
+
+@pytest.mark.asyncio
+async def test_ensure_tables_upgrades_baseline_schema(db_engine):
+    """[스키마] baseline 스키마의 DB에 새 테이블 / 컬럼을 추가하고, 다시 실행하면 아무것도 하지 않음"""
+    url = db_engine.url.render_as_string(hide_password=False)
+    engine = create_async_engine(url, poolclass=NullPool, connect_args={"server_settings": {"search_path": SCHEMA}})
+    tables = load_models()
+    try:
+        # 별도 스키마에 현재 모델로 만든 뒤 이후 변경분을 지워서 baseline 상태로 되돌림
+        async with engine.begin() as conn:
+            await conn.execute(text(f"DROP SCHEMA IF EXISTS {SCHEMA} CASCADE"))
+            await conn.execute(text(f"CREATE SCHEMA {SCHEMA}"))
+            await conn.run_sync(lambda sync_conn: [table.create(sync_conn) for table in tables])
+            for name in ADDED_TABLES:
+                await conn.execute(text(f"DROP TABLE {name}"))
+            for table, columns in ADDED_COLUMNS.items():
+                for column in columns:
+                    await conn.execute(text(f"ALTER TABLE {table} DROP COLUMN {column}"))
+            # 이전에 쌓인 로그 (유저 FK 검사는 생략)
+            await conn.execute(text("SET LOCAL session_replication_role = replica"))
+            await conn.execute(
+                text(
+                    "INSERT INTO expiry_deviation_logs (user_id, ingredient_name, deviation_day, storage_type)"
+                    " VALUES (gen_random_uuid(), '우유', 1, 'FRIDGE')"
+                )
+            )
+
+        changed = await ensure_tables(engine, tables)
+
+        assert sorted(changed) == sorted(ADDED_TABLES + ["expiry_deviation_logs.observed_day"])
+        async with engine.connect() as conn:
+            names = await conn.run_sync(lambda sync_conn: inspect(sync_conn).get_table_names())
+            assert set(ADDED_TABLES) <= set(names)
+            # 기존 행은 그대로 두고 새 컬럼은 NULL
+            assert (
+                await conn.execute(text("SELECT deviation_day, observed_day FROM expiry_deviation_logs"))
+            ).all() == [(1, None)]
+        assert await ensure_tables(engine, tables) == []
+    finally:
+        async with engine.begin() as conn:
+            await conn.execute(text(f"DROP SCHEMA IF EXISTS {SCHEMA} CASCADE"))
+        await engine.dispose()
@@ -0,0 +1,137 @@
+import asyncio
+import uuid
+
+import pytest
+from unittest.mock import AsyncMock, MagicMock
+from sqlalchemy import BigInteger, Column, String, select
+from sqlalchemy.ext.asyncio import async_sessionmaker
+from sqlalchemy.orm import DeclarativeBase
+
+from core.log_buffer import LogBuffer, LOG_FLUSH_MAX_RETRIES
+from domains.ingredient.models import MissingIngredientLog, ExpiryDeviationLog
+
+
+class _UncreatedBase(DeclarativeBase):
+    pass
+
+
+class UncreatedTableLog(_UncreatedBase):
+    """DB에 만들어지지 않은 테이블 (스키마 반영 전 배포 상황)"""
+
+    __tablename__ = "log_table_not_created"
+    id = Column(BigInteger, primary_key=True)
+    ingredient_name = Column(String(45), nullable=False)
+
+
+def _failing_session_factory():
+    session = AsyncMock()
+    session.execute.side_effect = OSError("connection refused")
+    factory = MagicMock()
+    factory.return_value.__aenter__.return_value = session
+    return factory
+
+
+@pytest.mark.asyncio
+class TestLogBuffer:
+    async def test_flush_multi_row_insert(self, db_engine, test_user):
+        """[로그 버퍼] 모델별로 묶어서 한 번에 저장"""
+        buffer = LogBuffer(session_factory=async_sessionmaker(db_engine))
+
+        for name in ["희귀템1", "희귀템2"]:
+            buffer.add(MissingIngredientLog, user_id=test_user.id, ingredient_name=name)
+        buffer.add(
+            ExpiryDeviationLog, user_id=test_user.id, ingredient_name="양파", deviation_day=3, storage_type="FRIDGE"
+        )
+
+        assert await buffer.flush() == 3
+        assert len(buffer) == 0
+
+        async with async_sessionmaker(db_engine)() as session:
+            missing = (await session.execute(select(MissingIngredientLog.ingredient_name))).scalars().all()
+            deviation = (await session.execute(select(ExpiryDeviationLog))).scalar_one()
+
+        assert sorted(missing) == ["희귀템1", "희귀템2"]
+        assert deviation.deviation_day == 3
+
+    async def test_flush_isolates_failing_model(self, db_engine, test_user):
+        """[로그 버퍼] 한 모델의 저장이 (테이블 / 컬럼이 없는 등) 실패해도 다른 모델의 로그는 저장하고, 실패한 로그만 다시 넣음"""
+        buffer = LogBuffer(session_factory=async_sessionmaker(db_engine))
+        buffer.add(UncreatedTableLog, ingredient_name="희귀템")
+        buffer.add(
+            ExpiryDeviationLog, user_id=test_user.id, ingredient_name="양파", deviation_day=3, storage_type="FRIDGE"
+        )
+
+        assert await buffer.flush() == 1
+        assert [(model, values["ingredient_name"]) for model, values, _ in buffer._records] == [
+            (UncreatedTableLog, "희귀템")
+        ]
+
+        async with async_sessionmaker(db_engine)() as session:
+            assert (await session.execute(select(ExpiryDeviationLog.ingredient_name))).scalars().all() == ["양파"]
+
+    async def test_flush_falls_back_to_rows_on_constraint_error(self, db_engine, test_user):
+        """[로그 버퍼] 제약 조건 위반이면 행 단위로 다시 저장 -> 잘못된 행만 재시도 후 폐기"""
+        buffer = LogBuffer(session_factory=async_sessionmaker(db_engine))
+        buffer.add(MissingIngredientLog, user_id=test_user.id, ingredient_name="a")
+        buffer.add(MissingIngredientLog, user_id=uuid.uuid4(), ingredient_name="fk 위반")
+        buffer.add(MissingIngredientLog, user_id=test_user.id, ingredient_name="b")
+
+        assert await buffer.flush() == 2
+        assert [values["ingredient_name"] for _, values, _ in buffer._records] == ["fk 위반"]
+
+        for _ in range(LOG_FLUSH_MAX_RETRIES):
+            assert await buffer.flush() == 0
+
+        assert len(buffer) == 0
+        assert buffer.stats()["written"] == 2
+        assert buffer.stats()["dropped"] == 1
+
+        async with async_sessionmaker(db_engine)() as session:
+            names = (await session.execute(select(MissingIngredientLog.ingredient_name))).scalars().all()
+        assert sorted(names) == ["a", "b"]
+
+    async def test_add_drops_when_full(self):
+        """[로그 버퍼] 가득 차면 기다리지 않고 버림"""
+        buffer = LogBuffer(session_factory=MagicMock(), max_size=2)
+
+        assert buffer.add(MissingIngredientLog, ingredient_name="a")
+        assert buffer.add(MissingIngredientLog, ingredient_name="b")
+        assert not buffer.add(MissingIngredientLog, ingredient_name="c")
+
+        assert buffer.stats()["pending"] == 2
+        assert buffer.stats()["dropped"] == 1
+
+    async def test_flush_failure_requeues_then_drops(self):
+        """[로그 버퍼] 저장 실패 시 순서대로 다시 넣고, 재시도 횟수를 넘기면 버림"""
+        buffer = LogBuffer(session_factory=_failing_session_factory())
+        buffer.add(MissingIngredientLog, ingredient_name="a")
+        buffer.add(MissingIngredientLog, ingredient_name="b")
+
+        assert await buffer.flush() == 0
+        assert [values["ingredient_name"] for _, values, _ in buffer._records] == ["a", "b"]
+
+        for _ in range(LOG_FLUSH_MAX_RETRIES):
+            await buffer.flush()
+
+        assert len(buffer) == 0
+        assert buffer.stats()["dropped"] == 2
+        assert buffer.stats()["flush_errors"] == LOG_FLUSH_MAX_RETRIES + 1
+
+    async def test_background_flush_on_batch_size(self, db_engine, test_user):
+        """[로그 버퍼] batch_size만큼 쌓이면 주기를 기다리지 않고 저장, close 때 남은 로그 저장"""
+        buffer = LogBuffer(session_factory=async_sessionmaker(db_engine), batch_size=2, flush_interval=60)
+        buffer.start()
+
+        buffer.add(MissingIngredientLog, user_id=test_user.id, ingredient_name="a")
+        buffer.add(MissingIngredientLog, user_id=test_user.id, ingredient_name="b")
+        for _ in range(50):
+            if buffer.written == 2:
+                break
+            await asyncio.sleep(0.01)
+        assert buffer.written == 2
+
+        buffer.add(MissingIngredientLog, user_id=test_user.id, ingredient_name="c")
+        await buffer.close()
+
+        assert buffer.written == 3
+        assert len(buffer) == 0
@@ -0,0 +1,25 @@
+import pytest
+from pydantic import SecretStr
+
+from core.config import settings
+
+
+@pytest.mark.asyncio
+class TestMetricsEndpoint:
+    async def test_disabled_without_token_setting(self, client, monkeypatch):
+        """[metrics] 토큰이 설정되지 않으면 헤더와 상관없이 404"""
+        monkeypatch.setattr(settings, "METRICS_TOKEN", None)
+
+        assert (await client.get("/metrics")).status_code == 404
+        assert (await client.get("/metrics", headers={"X-Metrics-Token": ""})).status_code == 404
+
+    async def test_requires_matching_token(self, client, monkeypatch):
+        """[metrics] 헤더의 토큰이 설정값과 같을 때만 응답"""
+        monkeypatch.setattr(settings, "METRICS_TOKEN", SecretStr("internal-token"))
+
+        assert (await client.get("/metrics")).status_code == 404
+        assert (await client.get("/metrics", headers={"X-Metrics-Token": "wrong"})).status_code == 404
+
+        response = await client.get("/metrics", headers={"X-Metrics-Token": "internal-token"})
+        assert response.status_code == 200
+        assert "db_pool" in response.json()
@@ -0,0 +1,71 @@
+import pytest
+from datetime import datetime
+from unittest.mock import AsyncMock
+
+from redis.exceptions import NoScriptError
+
+from core.exception.exceptions import RateLimitExceededException
+from core.rate_limit import RateLimit, RateLimiter, RATE_LIMIT_SCRIPT, RATE_LIMIT_SCRIPT_SHA
+
+
+class TestRateLimit:
+    def test_daily_key_and_ttl(self):
+        """[한도] 일일 한도는 날짜별 키, 자정까지 남은 ms를 만료 시간으로 전달"""
+        rule = RateLimit.daily("recipe", 10)
+        now = datetime(2026, 1, 1, 23, 59, 0)
+
+        assert rule.key("user-1", now) == "limit:recipe:user-1:2026-01-01"
+        assert rule.args(now) == ["daily", 10, 60_000, 1]
+
+    def test_window_and_bucket_args(self):
+        now = datetime(2026, 1, 1)
+
+        assert RateLimit.sliding_window("log_in", 10, 60).args(now) == ["window", 10, 60_000, 1]
+        assert RateLimit.token_bucket("assistant", 5, 0.1, cost=2).args(now) == ["bucket", 5, 0.1, 2]
+
+
+@pytest.mark.asyncio
+class TestRateLimiter:
+    async def test_batched_check_single_call(self):
+        """[한도] 여러 규칙을 evalsha 한 번으로 검사"""
+        redis = AsyncMock()
+        redis.evalsha.return_value = [1, 0, 0, 9, 4]
+        limiter = RateLimiter(redis)
+
+        result = await limiter.check("user-1", RateLimit.daily("recipe", 10), RateLimit.token_bucket("ai", 5, 0.1))
+
+        assert result.allowed
+        assert result.remaining == [9, 4]
+        redis.evalsha.assert_called_once()
+        args, _ = redis.evalsha.call_args
+        assert args[0] == RATE_LIMIT_SCRIPT_SHA
+        assert args[1] == 2
+
+    async def test_noscript_fallback(self):
+        """[한도] 스크립트 캐시가 비어있으면 eval로 다시 실행"""
+        redis = AsyncMock()
+        redis.evalsha.side_effect = NoScriptError("NOSCRIPT")
+        redis.eval.return_value = [1, 0, 0, 0]
+
+        result = await RateLimiter(redis).check("user-1", RateLimit.daily("ocr", 2))
+
+        assert result.allowed
+        args, _ = redis.eval.call_args
+        assert args[0] == RATE_LIMIT_SCRIPT
+
+    async def test_exceeded(self):
+        """[한도] 초과한 규칙과 재시도 시간 반환, hit은 429 예외"""
+        redis = AsyncMock()
+        redis.evalsha.return_value = [0, 2, 1500]
+        window = RateLimit.sliding_window("log_in", 10, 60)
+        limiter = RateLimiter(redis)
+
+        result = await limiter.check("1.2.3.4", RateLimit.daily("log_in", 100), window)
+
+        assert not result.allowed
+        assert result.exceeded is window
+        assert result.retry_after == 1.5
+
+        with pytest.raises(RateLimitExceededException) as exc:
+            await limiter.hit("1.2.3.4", RateLimit.daily("log_in", 100), window)
+        assert "2초" in exc.value.detail
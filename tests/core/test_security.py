@@ -0,0 +1,54 @@
+import time
+from unittest.mock import patch
+
+import pytest
+
+from core import security
+from core.security import VerifiedTokenCache
+from domains.user.exceptions import TokenExpiredException
+
+
+@pytest.fixture(autouse=True)
+def clear_cache():
+    security.verified_token_cache.clear()
+    yield
+    security.verified_token_cache.clear()
+
+
+def test_decode_jwt_caches_verified_token():
+    """[Security] 한 번 검증한 토큰은 다시 디코딩하지 않음"""
+    token = security.create_jwt(user_id="user-1")
+
+    assert security.decode_jwt(token) == "user-1"
+    with patch.object(security.jwt, "decode") as mock_decode:
+        assert security.decode_jwt(token) == "user-1"
+    mock_decode.assert_not_called()
+
+
+@pytest.mark.parametrize("token", ["not-a-jwt", security.create_jwt(user_id="user-1") + "x"])
+def test_decode_jwt_raises_on_invalid_token(token):
+    """[Security] 잘못된 토큰은 예외를 반환하지 않고 발생시킴"""
+    with pytest.raises(TokenExpiredException):
+        security.decode_jwt(token)
+    assert security.verified_token_cache.stats()["size"] == 0
+
+
+def test_cache_ignores_expired_entry():
+    """[Security] exp가 지난 캐시 항목은 사용하지 않고 제거"""
+    cache = VerifiedTokenCache()
+    cache.put("token", "user-1", exp=time.time() - 1)
+
+    assert cache.get("token") is None
+    assert cache.stats() == {"size": 0, "hits": 0, "misses": 1}
+
+
+def test_cache_evicts_least_recently_used():
+    cache = VerifiedTokenCache(max_size=2)
+    exp = time.time() + 60
+    cache.put("a", "user-a", exp)
+    cache.put("b", "user-b", exp)
+    cache.get("a")
+    cache.put("c", "user-c", exp)
+
+    assert cache.get("b") is None
+    assert (cache.get("a"), cache.get("c")) == ("user-a", "user-c")
@@ -1,3 +1,4 @@
+import asyncio
 import pytest
 from unittest.mock import AsyncMock, patch
 
@@ -10,6 +11,30 @@ from domains.assistant.exceptions import (
 )
 
 
+class FakeRedis:
+    """get/set만 흉내내는 메모리 Redis"""
+
+    def __init__(self):
+        self.store = {}
+
+    async def get(self, key):
+        return self.store.get(key)
+
+    async def set(self, key, value, ex=None):
+        self.store[key] = value
+
+
+SEARCH_RESPONSE = """
+{
+    "food": "김치찌개",
+    "food_en": "Kimchi Stew",
+    "use_ingredients": [{"name": "김치", "amount": "200g"}],
+    "steps": ["김치를 볶는다.", "물을 붓는다.", "끓인다."],
+    "tip": "묵은지가 좋다."
+}
+"""
+
+
 @pytest.mark.asyncio
 class TestLLMHandler:
     @pytest.fixture
@@ -127,6 +152,27 @@ class TestLLMHandler:
             with pytest.raises(AIJsonDecodeException):
                 await handler.recommend_menus(["양파"])
 
+    async def test_handler_json_decode_retry(self, handler):
+        """[재시도] 파싱 실패 시 한 번 더 요청"""
+        with patch.object(handler.client, "get_response", new_callable=AsyncMock) as mock_get:
+            mock_get.side_effect = ["미안해, 레시피를 못 찾겠어.", SEARCH_RESPONSE]
+            result = await handler.quick_recipe("김치")
+
+        assert mock_get.call_count == 2
+        assert result.food == "김치찌개"
+
+    async def test_truncated_response_not_cached(self):
+        """[복구] 잘린 응답은 복구해서 반환하지만 캐시에는 저장하지 않음"""
+        handler = LLMHandler(redis=FakeRedis())
+        truncated = SEARCH_RESPONSE[: SEARCH_RESPONSE.index('"tip"')]
+
+        with patch.object(handler.client, "get_response", new_callable=AsyncMock) as mock_get:
+            mock_get.return_value = truncated.replace('"steps"', '"tip": "", "steps"')
+            result = await handler.search_recipe("김치찌개")
+
+        assert result.steps == ["김치를 볶는다.", "물을 붓는다.", "끓인다."]
+        assert await handler.get_cached_search("김치찌개") is None
+
     async def test_handler_refusal_error(self, handler):
         fake_response = '{"error": "식재료가 아닙니다."}'
         with patch.object(handler.client, "get_response", new_callable=AsyncMock) as mock_get:
@@ -165,3 +211,117 @@ class TestLLMHandler:
             mock_get.return_value = fake_response
             with pytest.raises(AISchemaMismatchException):
                 await handler.parse_receipt_ingredients("사과")
+
+    # 7. 응답 캐시 테스트
+    async def test_search_recipe_cache_hit(self):
+        """[캐시] 같은 입력(공백 차이 포함)은 두 번째부터 OpenAI를 호출하지 않음"""
+        handler = LLMHandler(redis=FakeRedis())
+
+        with patch.object(handler.client, "get_response", new_callable=AsyncMock) as mock_get:
+            mock_get.return_value = SEARCH_RESPONSE
+
+            first = await handler.search_recipe("김치찌개")
+            second = await handler.search_recipe("  김치찌개 ")
+            cached = await handler.get_cached_search("김치찌개")
+
+        mock_get.assert_called_once()
+        assert first == second == cached
+
+    async def test_recommend_menus_cache_key_ignores_order(self):
+        """[캐시] 재료 순서가 달라도 같은 캐시 키 사용"""
+        handler = LLMHandler(redis=FakeRedis())
+        fake_response = '{"recipes": [{"food": "김치볶음밥", "food_en": "Kimchi Fried Rice", "use_ingredients": ["김치", "밥"], "difficulty": 2}]}'
+
+        with patch.object(handler.client, "get_response", new_callable=AsyncMock) as mock_get:
+            mock_get.return_value = fake_response
+            await handler.recommend_menus(["김치", "밥"])
+
+        assert await handler.get_cached_recommendation(["밥", "김치"]) is not None
+
+    async def test_concurrent_misses_call_once(self):
+        """[캐시] 동시에 들어온 같은 요청은 OpenAI를 한 번만 호출 (single-flight)"""
+        handler = LLMHandler(redis=FakeRedis())
+
+        async def slow_response(prompt):
+            await asyncio.sleep(0.05)
+            return SEARCH_RESPONSE
+
+        with patch.object(handler.client, "get_response", new_callable=AsyncMock) as mock_get:
+            mock_get.side_effect = slow_response
+            results = await asyncio.gather(*(handler.search_recipe("김치찌개") for _ in range(5)))
+
+        mock_get.assert_called_once()
+        assert all(r.food == "김치찌개" for r in results)
+
+    # 8. 스트리밍 테스트
+    async def test_stream_search_events(self):
+        """[스트리밍] 필드/배열 원소가 완성되는 순서대로 이벤트가 나오고 마지막에 검증된 결과 + 캐시 저장"""
+        handler = LLMHandler(redis=FakeRedis())
+
+        async def fake_stream(prompt):
+            text = "```json\n" + SEARCH_RESPONSE + "\n```"
+            for i in range(0, len(text), 7):
+                yield text[i : i + 7]
+
+        with patch.object(handler.client, "stream_response", side_effect=fake_stream):
+            events = [event async for event in handler.stream_search("김치찌개")]
+
+        names = [name for name, _ in events]
+        assert names[:3] == ["field", "field", "item"]
+        assert events[0][1] == {"key": "food", "value": "김치찌개"}
+        assert [data["value"] for name, data in events if name == "item" and data["key"] == "steps"] == [
+            "김치를 볶는다.",
+            "물을 붓는다.",
+            "끓인다.",
+        ]
+
+        name, result = events[-1]
+        assert name == "result"
+        assert isinstance(result, DetailRecipeResponse)
+        assert await handler.get_cached_search("김치찌개") == result
+
+    async def test_stream_truncated_response_repaired(self):
+        """[스트리밍] max_tokens에서 끊긴 응답은 완성된 값까지 복구하고 캐시하지 않음"""
+        handler = LLMHandler(redis=FakeRedis())
+
+        async def fake_stream(prompt):
+            yield '{"food": "김치찌개", "use_ingredients": [], "tip": "", "steps": ["김치를 볶는다.", "물을'
+
+        with patch.object(handler.client, "stream_response", side_effect=fake_stream):
+            events = [event async for event in handler.stream_search("김치찌개")]
+
+        name, result = events[-1]
+        assert name == "result"
+        assert result.steps == ["김치를 볶는다."]
+        assert await handler.get_cached_search("김치찌개") is None
+
+    async def test_stream_invalid_json_retries_early(self, handler):
+        """[스트리밍] 이벤트를 보내기 전에 문법 오류가 나면 연결을 끊고 한 번 재요청"""
+        closed = []
+
+        async def fake_stream(prompt):
+            try:
+                if not closed:
+                    yield '{"food" "김치찌개"'
+                    yield "이 조각은 읽히면 안 됨"
+                else:
+                    yield SEARCH_RESPONSE
+            finally:
+                closed.append(True)
+
+        with patch.object(handler.client, "stream_response", side_effect=fake_stream):
+            events = [event async for event in handler.stream_quick("김치")]
+
+        assert len(closed) == 2
+        assert events[-1][1].food == "김치찌개"
+
+    async def test_stream_refusal(self, handler):
+        """[스트리밍] error 필드가 오면 즉시 거절 예외"""
+
+        async def fake_stream(prompt):
+            yield '{"error": "요리가 아닙니다."}'
+
+        with patch.object(handler.client, "stream_response", side_effect=fake_stream):
+            with pytest.raises(AIRefusalException):
+                async for _ in handler.stream_search("벽돌"):
+                    pass
@@ -0,0 +1,51 @@
+import pytest
+from unittest.mock import AsyncMock, patch
+from fakeredis import FakeAsyncRedis
+from sqlalchemy.ext.asyncio import async_sessionmaker
+
+from domains.assistant.cache import IMAGE_NEGATIVE, IMAGE_NEGATIVE_CACHE_TTL, ImageUrlCache
+from domains.assistant.jobs import prewarm_image_cache
+from domains.assistant.service import DEFAULT_FOOD_IMAGE_URL
+from domains.recipe.repository import RecipeRepository
+
+
+@pytest.mark.asyncio
+async def test_prewarm_image_cache(db_engine, db_session, test_user):
+    """
+    [이미지 캐시 프리웜]
+    - 레시피에 저장된 이미지는 API 호출 없이 캐시에 넣음 (기본 이미지는 제외)
+    - 나머지만 검색하고, 실패는 negative cache로 저장
+    - 이미 캐시된 검색어(negative 포함)는 다시 검색하지 않음
+    """
+    repo = RecipeRepository(db_session)
+    await repo.save_recipe(test_user.id, "김치찌개", {"food_en": "Kimchi Stew", "image_url": "https://img/kimchi.jpg"})
+    await repo.save_recipe(test_user.id, "라면", {"food_en": "Ramen", "image_url": DEFAULT_FOOD_IMAGE_URL})
+    await repo.save_recipe(test_user.id, "간장계란밥", {"food": "간장계란밥"})
+    await repo.save_recipe(test_user.id, "비빔밥", {"food_en": "Bibimbap"})
+
+    redis = FakeAsyncRedis(decode_responses=True)
+    await redis.set("IMG:bibimbap", "https://img/bibimbap.jpg")
+    cache = ImageUrlCache()
+    search = AsyncMock(side_effect=lambda query: "https://img/ramen.jpg" if query == "ramen" else None)
+
+    with (
+        patch("domains.assistant.jobs.async_session_factory", async_sessionmaker(db_engine)),
+        patch("domains.assistant.jobs.image_url_cache", cache),
+        patch("domains.assistant.jobs.unsplash_client.search_image", search),
+    ):
+        result = await prewarm_image_cache(redis)
+
+        assert result == {"total": 4, "already_cached": 1, "seeded_from_recipes": 1, "fetched": 1, "failed": 1}
+        assert sorted(call.args[0] for call in search.call_args_list) == ["ramen", "간장계란밥 food"]
+        assert await redis.get("IMG:kimchi stew") == "https://img/kimchi.jpg"
+        assert await redis.get("IMG:ramen") == "https://img/ramen.jpg"
+        assert await redis.get("IMG:간장계란밥 food") == IMAGE_NEGATIVE
+        assert 0 < await redis.ttl("IMG:간장계란밥 food") <= IMAGE_NEGATIVE_CACHE_TTL
+        assert await cache.get(redis, "간장계란밥 food") == IMAGE_NEGATIVE
+
+        search.reset_mock()
+        again = await prewarm_image_cache(redis)
+
+    assert again["already_cached"] == 4
+    search.assert_not_called()
+    await redis.aclose()
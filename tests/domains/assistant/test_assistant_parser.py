@@ -0,0 +1,115 @@
+import pytest
+
+from domains.assistant.parser import LLMParser, IncrementalJSONParser
+from domains.assistant.exceptions import (
+    AIJsonDecodeException,
+    AINullResponseException,
+    AIRefusalException,
+)
+
+RESPONSE = """```json
+{
+    "food": "라면",
+    "food_en": "Ramen",
+    "use_ingredients": [{"name": "면", "amount": "1개"}, {"name": "물", "amount": "550ml"}],
+    "steps": ["물을 끓인다.", "면과 스프를 넣는다."],
+    "tip": "계란을 넣어도 좋다."
+}
+```"""
+
+
+class TestIncrementalJSONParser:
+    def test_chunked_events(self):
+        """조각 크기와 상관없이 필드/배열 원소가 완성되는 순서대로 이벤트 발생"""
+        parser = IncrementalJSONParser()
+        events = []
+        for i in range(0, len(RESPONSE), 5):
+            events.extend(parser.feed(RESPONSE[i : i + 5]))
+
+        assert [(e.kind, e.key, e.index) for e in events] == [
+            ("field", "food", None),
+            ("field", "food_en", None),
+            ("item", "use_ingredients", 0),
+            ("item", "use_ingredients", 1),
+            ("item", "steps", 0),
+            ("item", "steps", 1),
+            ("field", "tip", None),
+        ]
+        assert parser.finish()["use_ingredients"][1] == {"name": "물", "amount": "550ml"}
+
+    def test_partial(self):
+        """작성 중인 최상위 배열은 완성된 원소까지 partial에 포함"""
+        parser = IncrementalJSONParser()
+        parser.feed('{"food": "라면", "steps": ["물을 끓인다.", "면을')
+
+        assert parser.partial == {"food": "라면", "steps": ["물을 끓인다."]}
+
+    def test_repair_truncated(self):
+        """잘린 응답은 마지막으로 완성된 원소까지 남기고 괄호를 닫음 (작성 중인 원소는 버림)"""
+        parser = IncrementalJSONParser()
+        parser.feed('{"food": "라면", "use_ingredients": [{"name": "면", "amount": "1개"}, {"name": "물", "amo')
+
+        with pytest.raises(AIJsonDecodeException):
+            parser.finish()
+
+        assert parser.finish(repair=True) == {"food": "라면", "use_ingredients": [{"name": "면", "amount": "1개"}]}
+        assert parser.repaired
+
+    def test_repair_drops_truncated_object_field(self):
+        """객체 값인 최상위 필드가 잘리면 빈 객체나 반쯤 채운 객체로 만들지 않고 필드째 버림"""
+        for text in ('{"food": "라면", "nutrition": {', '{"food": "라면", "nutrition": {"kcal": 500, "protein": 1'):
+            assert IncrementalJSONParser.parse_text(text) == {"food": "라면"}
+
+        completed = IncrementalJSONParser.parse_text('{"food": "라면", "nutrition": {"kcal": 500}, "tip": "맛')
+        assert completed == {"food": "라면", "nutrition": {"kcal": 500}}
+
+    def test_syntax_error_position(self):
+        """문법 오류는 도착 즉시 위치와 함께 예외"""
+        parser = IncrementalJSONParser()
+
+        with pytest.raises(AIJsonDecodeException) as exc:
+            parser.feed('{\n  "food": "라면",\n  "tip" "맛있다"')
+
+        assert "line 3" in exc.value.detail
+
+    def test_prose_without_json(self):
+        """JSON이 시작되지 않는 긴 문장은 끝까지 기다리지 않고 실패"""
+        parser = IncrementalJSONParser()
+
+        with pytest.raises(AIJsonDecodeException):
+            parser.feed("죄송하지만 요청하신 내용은 " * 30)
+
+    def test_refusal(self):
+        with pytest.raises(AIRefusalException):
+            IncrementalJSONParser().feed('{"error": "요리가 아닙니다.", "food": "')
+
+
+class TestLLMParser:
+    def test_parse_code_block(self):
+        assert LLMParser.parse(RESPONSE)["food"] == "라면"
+
+    def test_parse_empty(self):
+        with pytest.raises(AINullResponseException):
+            LLMParser.parse("  ")
+
+    def test_parse_with_repair(self):
+        data, repaired = LLMParser.parse_with_repair('{"food": "라면", "steps": ["물을 끓인다.", "면')
+
+        assert repaired
+        assert data == {"food": "라면", "steps": ["물을 끓인다."]}
+
+    def test_parse_trailing_text(self):
+        """완성된 JSON 뒤에 붙은 문장은 무시하고 최상위 타입 그대로 반환 (복구로 보지 않음)"""
+        assert LLMParser.parse_with_repair('[{"a":1},{"b":2}] trailing') == ([{"a": 1}, {"b": 2}], False)
+        assert LLMParser.parse_with_repair('결과입니다: {"food": "라면"}\n맛있게 드세요!') == ({"food": "라면"}, False)
+
+    def test_truncated_array_not_repaired_as_object(self):
+        """최상위 배열이 잘리면 첫 원소 객체로 바꾸지 않고 실패"""
+        with pytest.raises(AIJsonDecodeException):
+            LLMParser.parse_with_repair('[{"a": 1}, {"b": 2')
+
+    def test_parse_error_position(self):
+        with pytest.raises(AIJsonDecodeException) as exc:
+            LLMParser.parse('{"food": "라면",, "tip": ""}')
+
+        assert "column 15" in exc.value.detail
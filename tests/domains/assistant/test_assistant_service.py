@@ -5,7 +5,7 @@ from datetime import datetime
 from fastapi import UploadFile
 
 # 실제 프로젝트 경로에 맞게 import 경로를 확인해주세요.
-from domains.assistant.service import AssistantService, LIMIT_RECIPE_DAILY
+from domains.assistant.service import AssistantService, LIMIT_RECIPE_DAILY, DEFAULT_FOOD_IMAGE_URL
 from domains.assistant.exceptions import InvalidAIRequestException
 from domains.assistant.schemas import (
     RecommendationResponse,
@@ -27,8 +27,13 @@ class TestAssistantService:
         handler = AsyncMock()
         redis = AsyncMock()
 
-        # Redis incr 기본값 (한도 통과: 1번째 요청)
-        redis.incr.return_value = 1
+        # 한도 검사 Lua 스크립트 기본값 (통과: [허용, 초과 규칙, 재시도 ms, 일일 남은 횟수])
+        redis.evalsha.return_value = [1, 0, 0, LIMIT_RECIPE_DAILY - 1]
+
+        # LLM 응답 캐시 기본값 (캐시 없음)
+        handler.get_cached_recommendation.return_value = None
+        handler.get_cached_detail.return_value = None
+        handler.get_cached_search.return_value = None
 
         return user, repo, handler, redis
 
@@ -64,7 +69,8 @@ class TestAssistantService:
             # Redis 한도 체크 확인
             today_str = datetime.now().strftime("%Y-%m-%d")
             expected_key = f"limit:recipe:{user.id}:{today_str}"
-            redis.incr.assert_called_with(expected_key)
+            args, _ = redis.evalsha.call_args
+            assert expected_key in args
 
             # LLM 호출 확인
             handler.recommend_menus.assert_called_once_with(["양파", "계란"])
@@ -83,15 +89,15 @@ class TestAssistantService:
         user, repo, handler, redis = mock_deps
         service = AssistantService(user, handler, repo, redis)
 
-        # Given: 한도 초과 설정
-        redis.incr.return_value = LIMIT_RECIPE_DAILY + 1
+        # Given: 한도 초과 설정 (1번 규칙 = 일일 한도 초과)
+        redis.evalsha.return_value = [0, 1, 3600000]
 
         # When & Then
         with pytest.raises(InvalidAIRequestException) as exc:
             await service.recommend_menus()
 
         assert "한도" in str(exc.value.detail)
-        redis.decr.assert_called_once()
+        redis.evalsha.assert_called_once()  # 검사 + 차감을 한 번의 호출로 처리
         handler.recommend_menus.assert_not_called()
 
     async def test_recommend_menus_no_ingredients(self, mock_deps):
@@ -108,6 +114,23 @@ class TestAssistantService:
 
         assert "재료가 하나도 없어요" in str(exc.value.detail)
 
+    async def test_recommend_menus_cache_hit_skips_limit(self, mock_deps):
+        """[성공] 캐시된 추천 결과는 일일 한도를 차감하지 않고 LLM도 호출하지 않음"""
+        user, repo, handler, redis = mock_deps
+        service = AssistantService(user, handler, repo, redis)
+
+        repo.get_ingredients.return_value = [MagicMock(ingredient_name="계란")]
+        handler.get_cached_recommendation.return_value = RecommendationResponse(
+            recipes=[RecommendationItem(food="계란찜", food_en="Steamed Egg", use_ingredients=["계란"], difficulty=1)]
+        )
+
+        with patch.object(service, "_fetch_unsplash_image", return_value="https://fake.com/egg.jpg"):
+            result = await service.recommend_menus()
+
+        redis.evalsha.assert_not_called()
+        handler.recommend_menus.assert_not_called()
+        assert result.recipes[0].image_url == "https://fake.com/egg.jpg"
+
     # ----------------------------------------------------------------
     # 2. 상세 레시피 생성 (Detail Recipe) 테스트
     # ----------------------------------------------------------------
@@ -141,7 +164,7 @@ class TestAssistantService:
 
             handler.generate_detail.assert_called_once()
             mock_fetch.assert_called_once_with("Ramen")
-            redis.incr.assert_called()
+            redis.evalsha.assert_called()
 
     # ----------------------------------------------------------------
     # 3. 레시피 검색 (Search Recipe) 테스트
@@ -167,7 +190,7 @@ class TestAssistantService:
             assert result.image_url == "https://fake.com/kimchi.jpg"
             handler.search_recipe.assert_called_once_with(food_name)
             mock_fetch.assert_called_once_with("Kimchi Stew")
-            redis.incr.assert_called()
+            redis.evalsha.assert_called()
 
     # ----------------------------------------------------------------
     # 4. 퀵 레시피 (Quick Recipe) 테스트
@@ -195,7 +218,61 @@ class TestAssistantService:
 
             # food_en이 없으므로 "한글명 + food" 조합으로 검색했는지 확인
             mock_fetch.assert_called_once_with("간장계란밥 food")
-            redis.incr.assert_called()
+            redis.evalsha.assert_called()
+
+    # ----------------------------------------------------------------
+    # 4-1. SSE 스트리밍 테스트
+    # ----------------------------------------------------------------
+    async def test_stream_search_recipe_attaches_image(self, mock_deps):
+        """[성공] 스트림 이벤트는 그대로 전달되고 최종 결과에 이미지 URL 첨부"""
+        user, repo, handler, redis = mock_deps
+        service = AssistantService(user, handler, repo, redis)
+
+        final = DetailRecipeResponse(food="김치찌개", food_en="Kimchi Stew", use_ingredients=[], steps=[], tip="")
+
+        async def fake_events():
+            yield "field", {"key": "food", "value": "김치찌개"}
+            yield "field", {"key": "food_en", "value": "Kimchi Stew"}
+            yield "result", final
+
+        handler.stream_search = MagicMock(return_value=fake_events())
+
+        with patch.object(service, "_fetch_unsplash_image", return_value="https://fake.com/kimchi.jpg") as mock_fetch:
+            events = [event async for event in await service.stream_search_recipe("김치찌개")]
+
+        assert [name for name, _ in events] == ["field", "field", "result"]
+        assert events[-1][1].image_url == "https://fake.com/kimchi.jpg"
+        mock_fetch.assert_called_once_with("Kimchi Stew")
+        redis.evalsha.assert_called()
+
+    async def test_stream_recipe_detail_cache_hit_skips_limit(self, mock_deps):
+        """[캐시] 캐시된 레시피는 한도 차감 없이 result 이벤트 하나로 전달"""
+        user, repo, handler, redis = mock_deps
+        service = AssistantService(user, handler, repo, redis)
+
+        request = DetailRecipeRequest(food="라면", use_ingredients=["계란"], difficulty=1)
+        handler.get_cached_detail.return_value = DetailRecipeResponse(
+            food="라면", food_en="Ramen", use_ingredients=[], steps=["끓인다"], tip=""
+        )
+        handler.stream_detail = MagicMock()
+
+        with patch.object(service, "_fetch_unsplash_image", return_value="https://fake.com/ramen.jpg"):
+            events = [event async for event in await service.stream_recipe_detail(request)]
+
+        assert len(events) == 1
+        assert events[0][0] == "result"
+        assert events[0][1].image_url == "https://fake.com/ramen.jpg"
+        handler.stream_detail.assert_not_called()
+        redis.evalsha.assert_not_called()
+
+    async def test_stream_quick_recipe_empty_chat(self, mock_deps):
+        """[실패] 빈 입력은 스트림 시작 전에 예외"""
+        user, repo, handler, redis = mock_deps
+        service = AssistantService(user, handler, repo, redis)
+
+        with pytest.raises(InvalidAIRequestException):
+            await service.stream_quick_recipe("  ")
+        redis.evalsha.assert_not_called()
 
     # ----------------------------------------------------------------
     # 5. 영수증 OCR 처리 (Receipt Image) 테스트
@@ -223,8 +300,8 @@ class TestAssistantService:
             mock_file.read.assert_called_once()
 
             # OCR 한도 키 확인
-            args, _ = redis.incr.call_args
-            assert "limit:ocr" in args[0]
+            args, _ = redis.evalsha.call_args
+            assert any(str(arg).startswith("limit:ocr") for arg in args)
 
             mock_ocr.get_ocr_text.assert_called_once_with(b"valid_image_bytes", "jpg")
             handler.parse_receipt_ingredients.assert_called_once_with("콩나물 500원")
@@ -243,7 +320,7 @@ class TestAssistantService:
             await service.process_receipt_image(mock_file)
 
         assert "이미지 파일만" in str(exc.value.detail)
-        redis.incr.assert_not_called()
+        redis.evalsha.assert_not_called()
 
     async def test_process_receipt_image_empty_content(self, mock_deps):
         """[실패] 파일 내용이 비어있을 때 에러"""
@@ -259,7 +336,7 @@ class TestAssistantService:
             await service.process_receipt_image(mock_file)
 
         assert "파일 내용이 비어있습니다" in str(exc.value.detail)
-        redis.incr.assert_called_once()
+        redis.evalsha.assert_called_once()
 
     # ----------------------------------------------------------------
     # 6. Unsplash API 연동 (Private Method) 테스트
@@ -269,9 +346,12 @@ class TestAssistantService:
         user, repo, handler, redis = mock_deps
         service = AssistantService(user, handler, repo, redis)
 
-        # httpx.AsyncClient Mocking
-        with patch("httpx.AsyncClient") as mock_client_cls:
-            mock_client = mock_client_cls.return_value.__aenter__.return_value
+        redis.get.return_value = None  # 이미지 캐시 없음
+
+        # 공용 HTTP 클라이언트 Mocking
+        with patch("domains.assistant.clients.http_clients") as mock_registry:
+            mock_client = mock_registry.get.return_value
+            mock_client.get = AsyncMock()
 
             # Mock Response 설정
             mock_response = MagicMock()
@@ -284,6 +364,35 @@ class TestAssistantService:
 
             # Then
             assert url == "https://api-result.com/img.jpg"
+            mock_registry.get.assert_called_once_with("unsplash")
             mock_client.get.assert_called_once()
             call_kwargs = mock_client.get.call_args.kwargs
             assert call_kwargs["params"]["query"] == "Kimchi"
+
+            # 결과가 이미지 캐시에 저장됨
+            redis.set.assert_called_once()
+            assert redis.set.call_args[0][:2] == ("IMG:kimchi", "https://api-result.com/img.jpg")
+
+    async def test_fetch_unsplash_image_cache_hit(self, mock_deps):
+        """[단위] 캐시된 이미지 URL이 있으면 Unsplash를 호출하지 않음"""
+        user, repo, handler, redis = mock_deps
+        service = AssistantService(user, handler, repo, redis)
+        redis.get.return_value = "https://cached.com/bibimbap.jpg"
+
+        with patch("domains.assistant.service.unsplash_client") as mock_unsplash:
+            url = await service._fetch_unsplash_image("Bibimbap")
+
+        assert url == "https://cached.com/bibimbap.jpg"
+        mock_unsplash.search_image.assert_not_called()
+
+    async def test_fetch_unsplash_image_negative_cache(self, mock_deps):
+        """[단위] 실패가 캐시되어 있으면 API 호출 없이 기본 이미지 반환"""
+        user, repo, handler, redis = mock_deps
+        service = AssistantService(user, handler, repo, redis)
+        redis.get.return_value = ""
+
+        with patch("domains.assistant.service.unsplash_client") as mock_unsplash:
+            url = await service._fetch_unsplash_image("Unknown Dish")
+
+        assert url == DEFAULT_FOOD_IMAGE_URL
+        mock_unsplash.search_image.assert_not_called()
@@ -9,6 +9,7 @@ from domains.ingredient.models import (
     MissingIngredientLog,
 )
 from domains.refrigerator.models import Refrigerator, Compartment
+from core.log_buffer import log_buffer
 
 TODAY = date.today()
 NEXT_WEEK = TODAY + timedelta(days=7)
@@ -38,7 +39,8 @@ async def test_add_ingredient_check_auto_flag(authorized_client, db_session):
     assert potato["is_auto_fillable"] is True
     assert sweet_potato["is_auto_fillable"] is False
 
-    # 4. MissingLog 검증 (고구마)
+    # 4. MissingLog 검증 (고구마) - 분석 로그는 버퍼에서 비동기로 저장됨
+    await log_buffer.flush()
     stmt = select(MissingIngredientLog).where(MissingIngredientLog.ingredient_name == "고구마")
     log = (await db_session.execute(stmt)).scalar_one_or_none()
     assert log is not None
@@ -71,6 +73,57 @@ async def test_set_auto_ingredient_details(authorized_client, db_session, test_u
     assert data["is_auto_fillable"] is True
 
 
+@pytest.mark.asyncio
+async def test_bulk_auto_fill_api(authorized_client, db_session, test_user):
+    """
+    [API] 유통기한 일괄 자동 채우기 (PATCH /auto)
+    """
+    db_session.add(IngredientExpiry(ingredient_name="두부", expiry_day=5, storage_type="FRIDGE"))
+    tofu = Ingredient(user_id=test_user.id, ingredient_name="두부", purchase_date=TODAY)
+    unknown = Ingredient(user_id=test_user.id, ingredient_name="희귀템", purchase_date=TODAY)
+    db_session.add_all([tofu, unknown])
+    await db_session.commit()
+
+    response = await authorized_client.patch("/api/v1/ingredients/auto", json={"ingredient_ids": [tofu.id, unknown.id]})
+
+    assert response.status_code == 200
+    data = response.json()
+    assert data["updated_count"] == 1
+    assert data["ingredients"][0]["expiration_date"] == (TODAY + timedelta(days=5)).isoformat()
+    assert data["skipped_ids"] == [unknown.id]
+
+    # ids와 all_unclassified는 둘 중 하나만
+    response = await authorized_client.patch(
+        "/api/v1/ingredients/auto", json={"ingredient_ids": [tofu.id], "all_unclassified": True}
+    )
+    assert response.status_code == 422
+
+
+@pytest.mark.asyncio
+async def test_get_expiring_ingredients_api(authorized_client, db_session, test_user):
+    """
+    [API] 유통기한 임박 식재료 조회 (GET /expiring)
+    """
+    db_session.add_all(
+        [
+            Ingredient(
+                user_id=test_user.id,
+                ingredient_name="두부",
+                purchase_date=TODAY,
+                expiration_date=TODAY + timedelta(days=1),
+            ),
+            Ingredient(user_id=test_user.id, ingredient_name="쌀", purchase_date=TODAY, expiration_date=NEXT_WEEK),
+            Ingredient(user_id=test_user.id, ingredient_name="미입력", purchase_date=TODAY),
+        ]
+    )
+    await db_session.commit()
+
+    response = await authorized_client.get("/api/v1/ingredients/expiring", params={"days": 3})
+
+    assert response.status_code == 200
+    assert [i["ingredient_name"] for i in response.json()] == ["두부"]
+
+
 @pytest.mark.asyncio
 async def test_set_details_with_deviation_log(authorized_client, db_session, test_user):
     """
@@ -94,7 +147,8 @@ async def test_set_details_with_deviation_log(authorized_client, db_session, tes
 
     assert response.status_code == 200  # 성공해야 함
 
-    # 4. DB 로그 확인
+    # 4. DB 로그 확인 (버퍼에 쌓인 로그 저장)
+    await log_buffer.flush()
     stmt = select(ExpiryDeviationLog).where(
         ExpiryDeviationLog.ingredient_name == "양파",
         ExpiryDeviationLog.user_id == test_user.id,
@@ -0,0 +1,98 @@
+import pytest
+import pytest_asyncio
+from datetime import date, timedelta
+from fakeredis import FakeAsyncRedis
+
+from domains.ingredient.cache import (
+    EXPIRY_VERSION_KEY,
+    NON_INGREDIENT_VERSION_KEY,
+    ExpiringItem,
+    ExpiringSoonIndex,
+    ExpiryCache,
+    NonIngredientIndex,
+)
+
+TODAY = date(2026, 1, 10)
+
+
+def _item(item_id: int, days: int | None) -> ExpiringItem:
+    return ExpiringItem(
+        id=item_id,
+        ingredient_name=f"재료{item_id}",
+        purchase_date=TODAY,
+        expiration_date=TODAY + timedelta(days=days) if days is not None else None,
+        storage_type="냉장",
+    )
+
+
+@pytest_asyncio.fixture
+async def index():
+    # Lua 스크립트까지 실제로 실행 (fakeredis[lua])
+    redis = FakeAsyncRedis(decode_responses=True)
+    yield ExpiringSoonIndex(redis)
+    await redis.flushall()
+    await redis.aclose()
+
+
+@pytest.mark.asyncio
+class TestExpiringSoonIndex:
+    async def test_query_without_index_returns_none(self, index):
+        assert await index.query("user-1", until=TODAY) is None
+
+    async def test_build_then_query(self, index):
+        """[인덱스] build 결과를 유통기한 순으로 조회 (식재료가 없어도 인덱스는 준비된 상태)"""
+        generation = await index.generation("user-1")
+        assert await index.build("user-1", [_item(2, 5), _item(1, 1), _item(3, 30)], generation)
+
+        items = await index.query("user-1", until=TODAY + timedelta(days=7), since=TODAY)
+        assert [i.id for i in items] == [1, 2]
+
+        assert await index.build("user-2", [], await index.generation("user-2"))
+        assert await index.query("user-2", until=TODAY) == []
+
+    async def test_update_and_remove(self, index):
+        await index.build("user-1", [_item(1, 1), _item(2, 2)], await index.generation("user-1"))
+
+        await index.update("user-1", [_item(1, None), _item(3, 0)])
+        await index.remove("user-1", [2])
+
+        assert [i.id for i in await index.query("user-1", until=TODAY + timedelta(days=7))] == [3]
+
+    async def test_build_skipped_after_concurrent_update(self, index):
+        """[인덱스] DB를 읽는 사이에 수정이 반영되면 오래된 결과로 인덱스를 만들지 않음"""
+        generation = await index.generation("user-1")
+        stale = [_item(1, 1)]  # 이 시점에 DB에서 읽은 결과
+
+        await index.update("user-1", [_item(1, None)])  # 읽은 뒤에 유통기한이 지워짐 (인덱스 없음)
+
+        assert not await index.build("user-1", stale, generation)
+        assert await index.query("user-1", until=TODAY + timedelta(days=7)) is None
+
+        # 다음 조회는 새 세대 값으로 다시 만듦
+        assert await index.build("user-1", [], await index.generation("user-1"))
+        assert await index.query("user-1", until=TODAY + timedelta(days=7)) == []
+
+    async def test_build_skipped_after_drop(self, index):
+        generation = await index.generation("user-1")
+
+        await index.drop("user-1")
+
+        assert not await index.build("user-1", [_item(1, 1)], generation)
+        assert await index.query("user-1", until=TODAY + timedelta(days=7)) is None
+
+
+@pytest.mark.asyncio
+async def test_invalidate_bumps_shared_version():
+    """[참조 캐시] invalidate는 Redis 버전을 올림 -> 다른 프로세스는 watch 확인 때 버전이 달라 다시 로드"""
+    redis = FakeAsyncRedis(decode_responses=True)
+    expiry, non_ingredient = ExpiryCache(), NonIngredientIndex()
+    non_ingredient.build(["봉투"])
+
+    await expiry.invalidate(redis)
+    await non_ingredient.invalidate(redis)
+    await non_ingredient.invalidate(redis)
+
+    assert await redis.get(EXPIRY_VERSION_KEY) == "1"
+    assert await redis.get(NON_INGREDIENT_VERSION_KEY) == "2"
+    assert not expiry.is_loaded and not non_ingredient.is_loaded
+    await redis.aclose()
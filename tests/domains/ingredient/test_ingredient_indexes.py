@@ -0,0 +1,151 @@
+"""
+IngredientRepository 쿼리가 인덱스를 타는지 EXPLAIN으로 확인하는 회귀 테스트
+- 실제 리포지토리 메서드를 실행하면서 나가는 SQL을 그대로 캡처해서 EXPLAIN
+- 데이터가 적으면 플래너가 항상 Seq Scan을 고르므로 enable_seqscan=off로 "쓸 수 있는 인덱스가 있는지"를 검사
+"""
+
+import uuid
+
+import pytest
+from datetime import date, timedelta
+from sqlalchemy import event
+
+from domains.ingredient.models import Ingredient
+from domains.ingredient.repository import IngredientRepository
+from domains.ingredient.schemas import IngredientOrder
+from domains.refrigerator.models import Refrigerator, Compartment
+from domains.user.models import User
+
+TODAY = date.today()
+
+USER_INDEXES = ("ix_ingredients_user_",)
+ID_INDEXES = ("ingredients_pkey", "ix_ingredients_id", "ix_ingredients_user_")
+
+
+@pytest.fixture
+def captured_sql(db_engine):
+    """리포지토리가 실행한 ingredients 대상 SELECT/UPDATE 문과 파라미터 캡처"""
+    statements = []
+
+    def before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        head = statement.lstrip().upper()
+        if "INGREDIENTS" in head and head.startswith(("SELECT", "UPDATE")):
+            statements.append((statement, parameters))
+
+    event.listen(db_engine.sync_engine, "before_cursor_execute", before_cursor_execute)
+    yield statements
+    event.remove(db_engine.sync_engine, "before_cursor_execute", before_cursor_execute)
+
+
+@pytest.fixture
+async def seeded(db_session, test_user):
+    fridge = Refrigerator(user_id=test_user.id, name="메인", pos_x=0, pos_y=0)
+    db_session.add(fridge)
+    await db_session.commit()
+
+    comp = Compartment(refrigerator_id=fridge.id, name="야채칸", order_index=0)
+    db_session.add(comp)
+    await db_session.commit()
+
+    # 다른 유저의 데이터도 있어야 user_id 조건의 선택도가 실제와 비슷해짐
+    other_user = User(id=uuid.uuid4(), email="other@example.com", nickname="다른유저", password="hashed_password")
+    db_session.add(other_user)
+    await db_session.commit()
+
+    storages = [None, "FRIDGE", "FREEZER", "ROOM"]
+    db_session.add_all(
+        [
+            Ingredient(
+                user_id=test_user.id if i % 10 == 0 else other_user.id,
+                ingredient_name=f"재료{i}",
+                purchase_date=TODAY - timedelta(days=i % 30),
+                expiration_date=None if i % 40 < 10 else TODAY + timedelta(days=i % 9),
+                storage_type=storages[(i // 10) % 4],
+                compartment_id=comp.id if i % 30 == 0 else None,
+            )
+            for i in range(3000)
+        ]
+    )
+    await db_session.commit()
+
+    return test_user, comp
+
+
+async def explain(db_engine, statement: str, parameters) -> str:
+    async with db_engine.connect() as conn:
+        await conn.exec_driver_sql("SET enable_seqscan = off")
+        rows = (await conn.exec_driver_sql(f"EXPLAIN {statement}", parameters)).scalars().all()
+        await conn.rollback()
+    return "\n".join(rows)
+
+
+CASES = [
+    ("get_ingredients", lambda repo, user, comp: repo.get_ingredients(user.id), USER_INDEXES),
+    ("get_ingredients_storage", lambda repo, user, comp: repo.get_ingredients(user.id, storage="FRIDGE"), USER_INDEXES),
+    (
+        "get_ingredients_unclassified",
+        lambda repo, user, comp: repo.get_ingredients(user.id, is_unclassified=True),
+        USER_INDEXES,
+    ),
+    (
+        "page_expiration",
+        lambda repo, user, comp: repo.get_ingredients_page(
+            user.id, IngredientOrder.EXPIRATION_DATE, limit=20, after=(TODAY, 10)
+        ),
+        ("ix_ingredients_user_expiration_active",),
+    ),
+    (
+        "page_purchase",
+        lambda repo, user, comp: repo.get_ingredients_page(
+            user.id, IngredientOrder.PURCHASE_DATE, limit=20, after=(TODAY - timedelta(days=5), 10)
+        ),
+        ("ix_ingredients_user_purchase_active",),
+    ),
+    (
+        "page_id",
+        lambda repo, user, comp: repo.get_ingredients_page(user.id, IngredientOrder.ID, limit=20, after=(None, 10)),
+        ("ix_ingredients_user_id_active",),
+    ),
+    ("count_ingredients", lambda repo, user, comp: repo.count_ingredients(user.id), USER_INDEXES),
+    ("get_ingredient", lambda repo, user, comp: repo.get_ingredient(1, user.id), ID_INDEXES),
+    (
+        "get_ingredients_by_compartment",
+        lambda repo, user, comp: repo.get_ingredients_by_compartment(comp.id, user.id),
+        ("ix_ingredients_user_compartment_active",),
+    ),
+    (
+        "get_unassigned_ingredients",
+        lambda repo, user, comp: repo.get_unassigned_ingredients(user.id),
+        USER_INDEXES,
+    ),
+    ("delete_ingredient", lambda repo, user, comp: repo.delete_ingredient(1, user.id), ID_INDEXES),
+    (
+        "bulk_update_compartment",
+        lambda repo, user, comp: repo.bulk_update_compartment([1, 2], comp.id, user.id),
+        ID_INDEXES,
+    ),
+    (
+        "get_expiring_ingredients",
+        lambda repo, user, comp: repo.get_expiring_ingredients(user.id, until=TODAY + timedelta(days=3), since=TODAY),
+        ("ix_ingredients_user_expiration_date_active",),
+    ),
+]
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("name, call, allowed_indexes", CASES, ids=[case[0] for case in CASES])
+async def test_repository_query_uses_index(db_engine, db_session, seeded, captured_sql, name, call, allowed_indexes):
+    user, comp = seeded
+    async with db_engine.connect() as conn:
+        await conn.exec_driver_sql("ANALYZE ingredients")
+        await conn.commit()
+
+    captured_sql.clear()
+    await call(IngredientRepository(db_session), user, comp)
+
+    assert captured_sql, f"{name}: 실행된 쿼리가 없습니다."
+    for statement, parameters in captured_sql:
+        plan = await explain(db_engine, statement, parameters)
+
+        assert "Seq Scan on ingredients" not in plan, f"{name}\n{plan}"
+        assert any(index in plan for index in allowed_indexes), f"{name}\n{plan}"
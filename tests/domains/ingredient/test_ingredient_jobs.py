@@ -0,0 +1,107 @@
+import pytest
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import async_sessionmaker
+
+from domains.ingredient.jobs import robust_stats, learn_expiry_days, EXPIRY_LEARNING_JOB
+from domains.ingredient.models import (
+    ExpiryDeviationLog,
+    ExpiryDayHistogram,
+    ExpiryDayProposal,
+    IngredientExpiry,
+)
+from domains.ingredient.repository import IngredientRepository
+
+
+def test_robust_stats():
+    """[유통기한 학습] 히스토그램으로 중앙값 / 절사 평균 계산"""
+    # 값: 5 x3, 7 x6, 30 x1 -> 정렬 시 [5,5,5,7,7,7,7,7,7,30]
+    count, median, trimmed = robust_stats([(5, 3), (7, 6), (30, 1)], trim_ratio=0.1)
+
+    assert count == 10
+    assert median == 7
+    assert trimmed == pytest.approx((5 * 2 + 7 * 6) / 8)  # 양쪽 1개씩(5, 30) 제외
+
+
+def test_robust_stats_even_median():
+    assert robust_stats([(3, 1), (4, 1)], trim_ratio=0)[1] == 3.5
+
+
+def _logs(user_id, name, storage, observed_days):
+    return [
+        ExpiryDeviationLog(
+            user_id=user_id,
+            ingredient_name=name,
+            deviation_day=0,
+            storage_type=storage,
+            observed_day=day,
+        )
+        for day in observed_days
+    ]
+
+
+@pytest.mark.asyncio
+async def test_learn_expiry_days_incremental(db_engine, db_session, test_user):
+    """
+    [유통기한 학습] 워터마크 이후 로그만 구간별로 집계해서 제안 값 저장
+    - observed_day가 없는 이전 로그는 무시
+    - 두 번째 실행은 새로 쌓인 로그만 더함
+    """
+    session_factory = async_sessionmaker(db_engine, expire_on_commit=False)
+    db_session.add(IngredientExpiry(ingredient_name="우유", expiry_day=10, storage_type="FRIDGE"))
+    db_session.add_all(_logs(test_user.id, "우유", "FRIDGE", [7] * 15 + [8] * 10 + [30]))
+    db_session.add_all(_logs(test_user.id, "우유", "FREEZER", [60] * 5))  # 표본 부족 -> 제안 없음
+    db_session.add(
+        ExpiryDeviationLog(user_id=test_user.id, ingredient_name="우유", deviation_day=3, storage_type="FRIDGE")
+    )
+    await db_session.commit()
+
+    result = await learn_expiry_days(session_factory, chunk_size=7, settle_seconds=-60)
+
+    assert result["from_id"] == 0
+    assert result["until_id"] == 32
+    assert result["chunks"] == 5
+    assert result["proposals"] == 1
+
+    proposal = (await db_session.execute(select(ExpiryDayProposal))).scalar_one()
+    assert (proposal.ingredient_name, proposal.storage_type) == ("우유", "FRIDGE")
+    assert proposal.sample_count == 26
+    assert proposal.median_day == 7
+    assert proposal.current_expiry_day == 10
+    assert proposal.proposed_expiry_day == 7
+
+    # 새 로그만 읽어서 누적
+    db_session.add_all(_logs(test_user.id, "우유", "FRIDGE", [8] * 10))
+    await db_session.commit()
+
+    result = await learn_expiry_days(session_factory, chunk_size=7, settle_seconds=-60)
+    assert result["from_id"] == 32
+    assert result["chunks"] == 2
+
+    db_session.expire_all()
+    histogram = (
+        await db_session.execute(
+            select(ExpiryDayHistogram.observed_day, ExpiryDayHistogram.sample_count)
+            .where(ExpiryDayHistogram.storage_type == "FRIDGE")
+            .order_by(ExpiryDayHistogram.observed_day)
+        )
+    ).all()
+    assert [tuple(row) for row in histogram] == [(7, 15), (8, 20), (30, 1)]
+
+    proposal = (await db_session.execute(select(ExpiryDayProposal))).scalar_one()
+    assert proposal.sample_count == 36
+    assert proposal.proposed_expiry_day == 8
+
+
+@pytest.mark.asyncio
+async def test_accumulate_skips_stale_watermark(db_session, test_user):
+    """[유통기한 학습] 다른 실행이 워터마크를 이미 옮겼으면 같은 구간을 다시 더하지 않음"""
+    repo = IngredientRepository(db_session)
+    db_session.add_all(_logs(test_user.id, "양파", "ROOM", [5, 5]))
+    await db_session.commit()
+
+    assert await repo.get_job_watermark(EXPIRY_LEARNING_JOB) == 0
+    assert await repo.accumulate_expiry_histogram(EXPIRY_LEARNING_JOB, 0, 2) == {("양파", "ROOM")}
+    assert await repo.accumulate_expiry_histogram(EXPIRY_LEARNING_JOB, 0, 2) is None
+
+    count = (await db_session.execute(select(ExpiryDayHistogram.sample_count))).scalar_one()
+    assert count == 2
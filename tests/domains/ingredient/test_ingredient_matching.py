@@ -0,0 +1,65 @@
+import pytest
+
+from domains.ingredient.matching import IngredientNameMatcher, decompose_hangul, normalize_ingredient_name
+
+CANONICAL = ["우유", "양파", "대파", "파", "무", "달걀", "콩나물", "두부", "삼겹살", "딸기"]
+
+
+@pytest.fixture
+def matcher():
+    return IngredientNameMatcher(
+        CANONICAL, aliases={"계란": "달걀", "쪽파": "대파", "서울우유": "우유", "없는별칭": "없는재료"}
+    )
+
+
+def test_normalize_ingredient_name():
+    assert normalize_ingredient_name("서울우유 1L") == "서울우유"
+    assert normalize_ingredient_name("유기농 콩나물(국산) 300g x2") == "유기농콩나물"
+    assert normalize_ingredient_name("계란 30구") == "계란"
+
+
+def test_decompose_hangul():
+    assert decompose_hangul("양파") == "ㅇㅑㅇㅍㅏ"
+    assert decompose_hangul("닭a") == "ㄷㅏㄺa"
+
+
+@pytest.mark.parametrize(
+    "name, expected",
+    [
+        ("우유", "우유"),  # canonical 그대로
+        ("두부 2입", "두부"),  # 수량 제거 후 일치
+        ("계란 30구", "달걀"),  # 별칭
+        ("서울우유 1L", "우유"),  # 상품명 별칭
+        ("매일우유 1L", None),  # 별칭이 없는 상품명은 부분 문자열로 매칭하지 않음
+        ("딸기 우유", "우유"),  # 단어 단위 일치
+        ("국산 쪽파", "대파"),  # 단어 단위 별칭
+        ("햇무", None),
+        ("무지개", None),
+        ("삼겹쌀", "삼겹살"),  # 자모 유사도 (오타)
+        ("국산 양퍄(특)", "양파"),  # 앞 단어 때문에 유사도가 낮으면 단어별로 비교
+        ("고등어", None),
+        ("500g", None),
+    ],
+)
+def test_resolve(matcher, name, expected):
+    assert matcher.resolve(name) == expected
+
+
+def test_canonicalize_keeps_order_and_unmatched(matcher):
+    assert matcher.canonicalize(["서울우유 1L", "고등어", "서울우유 1L"]) == ["우유", "고등어", "우유"]
+
+
+def test_alias_without_canonical_is_ignored(matcher):
+    assert matcher.resolve("없는별칭") is None
+
+
+def test_products_containing_canonical_names_are_not_matched():
+    """canonical 이름을 포함하는 다른 상품 / 글자 수가 다른 이름은 매칭하지 않음"""
+    matcher = IngredientNameMatcher(["우유", "감자", "두부", "고추", "식빵"])
+
+    assert matcher.canonicalize(["우유식빵", "감자칩", "두부과자", "고추장"]) == [
+        "우유식빵",
+        "감자칩",
+        "두부과자",
+        "고추장",
+    ]
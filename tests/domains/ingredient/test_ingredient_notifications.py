@@ -0,0 +1,143 @@
+import uuid
+from datetime import date, datetime, timedelta
+from unittest.mock import AsyncMock
+
+import pytest
+from sqlalchemy.ext.asyncio import async_sessionmaker
+
+from domains.ingredient.models import Ingredient
+from domains.ingredient.notifications import (
+    ExpiryNotificationEngine,
+    ExpiryNotificationScheduler,
+    LocalNotificationSink,
+    next_run_at,
+)
+from domains.user.models import User
+
+TODAY = date(2026, 3, 2)
+
+
+class DedupeRedis:
+    """중복 제거 Lua 스크립트(SET NX)와 delete만 흉내 내는 Redis"""
+
+    def __init__(self):
+        self.keys = set()
+
+    async def evalsha(self, sha, numkeys, *args):
+        fresh = []
+        for i, key in enumerate(args[:numkeys], start=1):
+            if key not in self.keys:
+                self.keys.add(key)
+                fresh.append(i)
+        return fresh
+
+    async def delete(self, *keys):
+        self.keys.difference_update(keys)
+
+
+class FailingOnceSink(LocalNotificationSink):
+    def __init__(self, fail_user_id):
+        super().__init__()
+        self.fail_user_id = fail_user_id
+
+    async def send(self, notification):
+        if notification.user_id == self.fail_user_id:
+            self.fail_user_id = None
+            raise ConnectionError("push server down")
+        await super().send(notification)
+
+
+@pytest.fixture
+async def users(db_session):
+    users = [
+        User(id=uuid.uuid4(), email=f"noti{i}@example.com", nickname=f"알림유저{i}", password="pw") for i in range(3)
+    ]
+    db_session.add_all(users)
+    await db_session.commit()
+
+    def ing(user, name, days, deleted=False):
+        return Ingredient(
+            user_id=user.id,
+            ingredient_name=name,
+            purchase_date=TODAY,
+            expiration_date=TODAY + timedelta(days=days),
+            deleted_at=datetime.now() if deleted else None,
+        )
+
+    a, b, c = users
+    db_session.add_all(
+        [
+            ing(a, "우유", 1),
+            ing(a, "두부", 0),
+            ing(a, "계란", 1),
+            ing(a, "삭제됨", 0, deleted=True),
+            ing(b, "양파", 0),
+            ing(b, "쌀", 30),
+            ing(c, "지난것", -1),
+        ]
+    )
+    await db_session.commit()
+    return users
+
+
+@pytest.mark.asyncio
+async def test_engine_groups_by_user_across_batches(db_engine, users):
+    """
+    [알림] 배치 경계에 걸친 유저도 알림 하나로 묶고, 이미 보낸 알림은 다시 보내지 않음
+    """
+    redis = DedupeRedis()
+    sink = LocalNotificationSink()
+    engine = ExpiryNotificationEngine(
+        redis, sink, session_factory=async_sessionmaker(db_engine), batch_size=2, days_ahead=1
+    )
+
+    metrics = await engine.run(TODAY)
+
+    a, b, _ = users
+    sent = {n.user_id: sorted(alert.ingredient_name for alert in n.alerts) for n in sink.sent}
+    assert sent == {a.id: ["계란", "두부", "우유"], b.id: ["양파"]}
+    assert metrics.scanned_rows == 4
+    assert metrics.batches == 3
+    assert (metrics.users_notified, metrics.alerts_sent) == (2, 4)
+    assert metrics.stats()["finished"] is True
+
+    b_notification = next(n for n in sink.sent if n.user_id == b.id)
+    assert b_notification.message == "양파의 유통기한이 오늘 끝나요."
+
+    # 같은 날 다시 실행해도 새로 보내지 않음
+    metrics = await engine.run(TODAY)
+    assert len(sink.sent) == 2
+    assert metrics.alerts_deduplicated == 4
+
+
+@pytest.mark.asyncio
+async def test_engine_retries_failed_user_next_run(db_engine, users):
+    """[알림] sink 전송에 실패한 유저는 중복 제거 키를 지워서 다음 실행에서 다시 보냄"""
+    a, b, _ = users
+    redis = DedupeRedis()
+    sink = FailingOnceSink(fail_user_id=b.id)
+    engine = ExpiryNotificationEngine(redis, sink, session_factory=async_sessionmaker(db_engine), days_ahead=1)
+
+    metrics = await engine.run(TODAY)
+    assert metrics.sink_errors == 1
+    assert [n.user_id for n in sink.sent] == [a.id]
+
+    await engine.run(TODAY)
+    assert [n.user_id for n in sink.sent] == [a.id, b.id]
+
+
+@pytest.mark.asyncio
+async def test_scheduler_runs_once_per_day():
+    """[알림] 다른 인스턴스가 이미 잠금을 잡았으면 실행하지 않음"""
+    redis = AsyncMock()
+    redis.set.return_value = None
+    scheduler = ExpiryNotificationScheduler(LocalNotificationSink())
+
+    assert await scheduler.run_once(redis, datetime(2026, 3, 2, 20)) is None
+    redis.set.assert_called_once_with("LOCK:expiry_notifications:2026-03-02", "1", nx=True, ex=43200)
+    assert scheduler.stats() is None
+
+
+def test_next_run_at():
+    assert next_run_at(datetime(2026, 3, 2, 19, 30), hour=20) == datetime(2026, 3, 2, 20)
+    assert next_run_at(datetime(2026, 3, 2, 20, 0), hour=20) == datetime(2026, 3, 3, 20)
@@ -5,10 +5,10 @@ from sqlalchemy import select
 from domains.ingredient.models import (
     Ingredient,
     IngredientExpiry,
-    MissingIngredientLog,
-    ExpiryDeviationLog,
+    NonIngredient,
 )
 from domains.ingredient.repository import IngredientRepository
+from domains.ingredient.schemas import IngredientOrder
 from domains.refrigerator.models import Refrigerator, Compartment
 
 TODAY = date.today()
@@ -43,72 +43,139 @@ async def test_get_expiry_infos(db_session):
 
 
 @pytest.mark.asyncio
-async def test_add_missing_logs(db_session, test_user):
+async def test_add_and_get_ingredient(db_session, test_user):
+    """[Basic] 식재료 저장 및 단일 조회"""
+    repo = IngredientRepository(db_session)
+
+    ingredients = [Ingredient(user_id=test_user.id, ingredient_name="기본재료", purchase_date=TODAY)]
+
+    # 저장
+    saved_list = await repo.add_ingredients(ingredients)
+    saved_id = saved_list[0].id
+
+    # 조회
+    found = await repo.get_ingredient(saved_id, test_user.id)
+    assert found is not None
+    assert found.ingredient_name == "기본재료"
+
+
+@pytest.mark.asyncio
+async def test_bulk_add_ingredients(db_session, test_user):
     """
-    [New] 누락 식재료 로그 일괄 저장 테스트
+    [Bulk] INSERT ... RETURNING 한 문장으로 일괄 추가
+    - 제외 식재료는 저장하지 않음, 입력 순서대로 반환
+    - 유통기한 정보 존재 여부로 is_auto_fillable 계산
     """
     repo = IngredientRepository(db_session)
+    db_session.add_all(
+        [
+            IngredientExpiry(ingredient_name="양파", expiry_day=7, storage_type="ROOM"),
+            NonIngredient(ingredient_name="비닐봉투"),
+        ]
+    )
+    await db_session.commit()
+
+    rows = await repo.bulk_add_ingredients(test_user.id, ["양파", "비닐봉투", "희귀템", "양파"], TODAY)
 
-    # 1. 로그 객체 생성
-    logs = [
-        MissingIngredientLog(user_id=test_user.id, ingredient_name="희귀템1"),
-        MissingIngredientLog(user_id=test_user.id, ingredient_name="희귀템2"),
+    assert [(r.ingredient_name, r.is_auto_fillable) for r in rows] == [
+        ("양파", True),
+        ("희귀템", False),
+        ("양파", True),
     ]
+    assert all(r.purchase_date == TODAY and r.expiration_date is None for r in rows)
 
-    # 2. 저장 실행
-    await repo.add_missing_logs(logs)
+    saved = (await db_session.execute(select(Ingredient).where(Ingredient.user_id == test_user.id))).scalars().all()
+    assert sorted(i.id for i in saved) == [r.id for r in rows]
 
-    # 3. DB 조회하여 검증
-    stmt = select(MissingIngredientLog).where(MissingIngredientLog.user_id == test_user.id)
-    saved_logs = (await db_session.execute(stmt)).scalars().all()
 
-    assert len(saved_logs) == 2
-    names = [log.ingredient_name for log in saved_logs]
-    assert "희귀템1" in names
-    assert "희귀템2" in names
+@pytest.mark.asyncio
+async def test_bulk_add_ingredients_with_expiry_names(db_session, test_user):
+    """[Bulk] 입력한 이름 그대로 저장하고, 자동 입력 여부는 expiry_names로 확인"""
+    repo = IngredientRepository(db_session)
+    db_session.add(IngredientExpiry(ingredient_name="두부", expiry_day=5, storage_type="FRIDGE"))
+    await db_session.commit()
+
+    rows = await repo.bulk_add_ingredients(
+        test_user.id, ["두부 2입", "두부과자"], TODAY, expiry_names=["두부", "두부과자"]
+    )
+
+    assert [(r.ingredient_name, r.is_auto_fillable) for r in rows] == [("두부 2입", True), ("두부과자", False)]
 
 
 @pytest.mark.asyncio
-async def test_add_deviation_log(db_session, test_user):
+async def test_bulk_add_ingredients_all_banned(db_session, test_user):
+    """[Bulk] 전부 제외 식재료면 아무것도 저장하지 않음"""
+    repo = IngredientRepository(db_session)
+    db_session.add(NonIngredient(ingredient_name="영수증"))
+    await db_session.commit()
+
+    assert await repo.bulk_add_ingredients(test_user.id, ["영수증"], TODAY) == []
+
+    assert (await db_session.execute(select(Ingredient))).first() is None
+
+
+@pytest.mark.asyncio
+async def test_bulk_auto_fill(db_session, test_user):
     """
-    [New] 유통기한 편차 로그 저장 테스트 (storage_type 포함)
+    [Bulk] UPDATE ... FROM ingredients_expiry 한 문장으로 자동 채우기
+    - 자동 입력 데이터가 없는 식재료 / 삭제된 식재료는 건드리지 않음
+    - 같은 이름의 참조 데이터가 여러 개여도 한 번만 적용
     """
     repo = IngredientRepository(db_session)
-
-    log = ExpiryDeviationLog(
+    db_session.add_all(
+        [
+            IngredientExpiry(ingredient_name="우유", expiry_day=7, storage_type="FRIDGE"),
+            IngredientExpiry(ingredient_name="우유", expiry_day=3, storage_type="ROOM"),
+            IngredientExpiry(ingredient_name="양파", expiry_day=14, storage_type="ROOM"),
+        ]
+    )
+    milk = Ingredient(user_id=test_user.id, ingredient_name="우유", purchase_date=TODAY)
+    onion = Ingredient(user_id=test_user.id, ingredient_name="양파", purchase_date=TODAY)
+    unknown = Ingredient(user_id=test_user.id, ingredient_name="희귀템", purchase_date=TODAY)
+    classified = Ingredient(
         user_id=test_user.id,
-        ingredient_name="감자",
-        deviation_day=5,
-        storage_type="FROZEN",  # 유저가 선택한 보관타입
+        ingredient_name="양파",
+        purchase_date=TODAY,
+        expiration_date=TODAY + timedelta(days=1),
+        storage_type="FRIDGE",
     )
+    await repo.add_ingredients([milk, onion, unknown, classified])
 
-    # 1. 저장 실행
-    await repo.add_deviation_log(log)
+    rows = await repo.bulk_auto_fill(test_user.id, ingredient_ids=[milk.id, unknown.id])
+    assert [(r.id, r.expiration_date, r.storage_type) for r in rows] == [(milk.id, TODAY + timedelta(days=7), "FRIDGE")]
 
-    # 2. DB 조회하여 검증
-    stmt = select(ExpiryDeviationLog).where(ExpiryDeviationLog.user_id == test_user.id)
-    saved_log = (await db_session.execute(stmt)).scalar_one()
+    # 미분류 전체: 이미 분류된 식재료는 제외
+    rows = await repo.bulk_auto_fill(test_user.id, only_unclassified=True)
+    assert [r.id for r in rows] == [onion.id]
+    assert rows[0].expiration_date == TODAY + timedelta(days=14)
 
-    assert saved_log.ingredient_name == "감자"
-    assert saved_log.deviation_day == 5
-    assert saved_log.storage_type == "FROZEN"
+    stored = dict((await db_session.execute(select(Ingredient.id, Ingredient.storage_type))).all())
+    assert stored[unknown.id] is None
+    assert stored[classified.id] == "FRIDGE"
 
 
 @pytest.mark.asyncio
-async def test_add_and_get_ingredient(db_session, test_user):
-    """[Basic] 식재료 저장 및 단일 조회"""
+async def test_get_expiring_ingredients(db_session, test_user):
+    """[Expiring] 유통기한 범위 조회 (단일 유저 / 여러 유저 배치)"""
     repo = IngredientRepository(db_session)
 
-    ingredients = [Ingredient(user_id=test_user.id, ingredient_name="기본재료", purchase_date=TODAY)]
+    def ing(name, days):
+        return Ingredient(
+            user_id=test_user.id,
+            ingredient_name=name,
+            purchase_date=TODAY,
+            expiration_date=TODAY + timedelta(days=days) if days is not None else None,
+        )
 
-    # 저장
-    saved_list = await repo.add_ingredients(ingredients)
-    saved_id = saved_list[0].id
+    await repo.add_ingredients(
+        [ing("지남", -1), ing("오늘", 0), ing("모레", 2), ing("다음달", 30), ing("미입력", None)]
+    )
 
-    # 조회
-    found = await repo.get_ingredient(saved_id, test_user.id)
-    assert found is not None
-    assert found.ingredient_name == "기본재료"
+    soon = await repo.get_expiring_ingredients(test_user.id, until=TODAY + timedelta(days=2), since=TODAY)
+    assert [i.ingredient_name for i in soon] == ["오늘", "모레"]
+
+    with_expired = await repo.get_expiring_ingredients(test_user.id, until=TODAY + timedelta(days=2), limit=2)
+    assert [i.ingredient_name for i in with_expired] == ["지남", "오늘"]
 
 
 @pytest.mark.asyncio
@@ -175,6 +242,44 @@ async def test_get_ingredients_filtering(db_session, test_user):
     assert fridge_items[0].ingredient_name == "냉장"
 
 
+@pytest.mark.asyncio
+async def test_get_ingredients_page_keyset(db_session, test_user):
+    """[Page] 유통기한순 keyset 페이지네이션: 같은 날짜는 id순, 유통기한 없는 재료는 맨 뒤"""
+    repo = IngredientRepository(db_session)
+
+    ingredients = [
+        Ingredient(user_id=test_user.id, ingredient_name="미분류1", purchase_date=TODAY),
+        Ingredient(
+            user_id=test_user.id,
+            ingredient_name="내일1",
+            purchase_date=TODAY,
+            expiration_date=TODAY + timedelta(days=1),
+        ),
+        Ingredient(user_id=test_user.id, ingredient_name="오늘", purchase_date=TODAY, expiration_date=TODAY),
+        Ingredient(
+            user_id=test_user.id,
+            ingredient_name="내일2",
+            purchase_date=TODAY,
+            expiration_date=TODAY + timedelta(days=1),
+        ),
+        Ingredient(user_id=test_user.id, ingredient_name="미분류2", purchase_date=TODAY),
+    ]
+    await repo.add_ingredients(ingredients)
+
+    names = []
+    after = None
+    while True:
+        page = await repo.get_ingredients_page(test_user.id, IngredientOrder.EXPIRATION_DATE, limit=2, after=after)
+        if not page:
+            break
+        names.extend(i.ingredient_name for i in page)
+        after = (page[-1].expiration_date, page[-1].id)
+
+    assert names == ["오늘", "내일1", "내일2", "미분류1", "미분류2"]
+    assert await repo.count_ingredients(test_user.id) == 5
+    assert await repo.count_ingredients(test_user.id, is_unclassified=True) == 2
+
+
 @pytest.mark.asyncio
 async def test_get_unassigned_ingredients_logic(db_session, test_user):
     """
@@ -268,3 +373,25 @@ async def test_delete_ingredient(db_session, test_user):
     stmt = select(Ingredient).where(Ingredient.id == ing.id)
     real_row = (await db_session.execute(stmt)).scalar_one()
     assert real_row.deleted_at is not None
+
+
+@pytest.mark.asyncio
+async def test_bulk_auto_fill_with_expiry_names(db_session, test_user):
+    """[Bulk] expiry_names로 매칭한 이름의 참조 데이터로 채우고, 저장된 이름은 그대로"""
+    repo = IngredientRepository(db_session)
+    db_session.add(IngredientExpiry(ingredient_name="두부", expiry_day=5, storage_type="FRIDGE"))
+    tofu = Ingredient(user_id=test_user.id, ingredient_name="두부 2입", purchase_date=TODAY)
+    snack = Ingredient(user_id=test_user.id, ingredient_name="두부과자", purchase_date=TODAY)
+    db_session.add_all([tofu, snack])
+    await db_session.commit()
+
+    assert sorted(await repo.get_auto_fill_target_names(test_user.id, only_unclassified=True)) == [
+        "두부 2입",
+        "두부과자",
+    ]
+
+    rows = await repo.bulk_auto_fill(test_user.id, only_unclassified=True, expiry_names={"두부 2입": "두부"})
+
+    assert [(r.id, r.ingredient_name, r.expiration_date, r.storage_type) for r in rows] == [
+        (tofu.id, "두부 2입", TODAY + timedelta(days=5), "FRIDGE")
+    ]
@@ -1,14 +1,24 @@
 import pytest
-from unittest.mock import AsyncMock, MagicMock
+from unittest.mock import AsyncMock, MagicMock, patch
 from datetime import date, timedelta
+from domains.ingredient.cache import ExpiryCache, ExpiryInfo, NonIngredientIndex
+from domains.ingredient.matching import IngredientNameMatcher
+from domains.ingredient.models import MissingIngredientLog, ExpiryDeviationLog
 from domains.ingredient.service import IngredientService
 from domains.ingredient.schemas import (
     AddIngredientRequest,
     SetIngredientRequest,
     StorageType,
     UpdateIngredientRequest,
+    IngredientOrder,
+    BulkAutoFillRequest,
+)
+from domains.ingredient.exceptions import (
+    ValueNotFoundException,
+    NotFoundException,
+    InvalidCursorException,
+    InvalidIngredientException,
 )
-from domains.ingredient.exceptions import ValueNotFoundException, NotFoundException
 from core.exception.exceptions import HaveNotPermissionException
 from domains.user.models import User
 
@@ -23,6 +33,13 @@ class TestIngredientService:
         repo = AsyncMock()
         return user, repo
 
+    @pytest.fixture(autouse=True)
+    def log_buffer(self, monkeypatch):
+        # 분석 로그는 실제 버퍼 대신 Mock에 쌓이도록 교체
+        buffer = MagicMock()
+        monkeypatch.setattr("domains.ingredient.service.default_log_buffer", buffer)
+        return buffer
+
     # Helper function to create a proper mock ingredient
     def _create_mock_ingredient(self, id, name, p_date=TODAY, e_date=None, storage=None):
         m = MagicMock()
@@ -33,40 +50,201 @@ class TestIngredientService:
         m.storage_type = storage
         return m
 
-    async def test_add_ingredient_with_missing_log(self, mocks):
-        """[Service] 식재료 추가: DB에 정보가 없으면 MissingLog 저장"""
+    async def test_add_ingredient_single_bulk_call(self, mocks, log_buffer):
+        """[Service] 식재료 추가: 저장/자동 입력 여부는 repository 한 번 호출, 누락 로그는 버퍼로"""
         user, repo = mocks
         service = IngredientService(user, repo)
 
-        req = AddIngredientRequest(ingredients=["희귀템"], purchase_date=TODAY)
+        req = AddIngredientRequest(ingredients=["희귀템", "양파"], purchase_date=TODAY)
 
-        # [Fix] Mock 속성 설정
-        mock_saved = self._create_mock_ingredient(1, "희귀템")
-        repo.add_ingredients.return_value = [mock_saved]
-        repo.get_expiry_infos.return_value = {}
+        repo.bulk_add_ingredients.return_value = [
+            self._create_mock_ingredient(1, "희귀템"),
+            self._create_mock_ingredient(2, "양파"),
+        ]
+        repo.bulk_add_ingredients.return_value[0].is_auto_fillable = False
+        repo.bulk_add_ingredients.return_value[1].is_auto_fillable = True
+
+        result = await service.add_ingredient(req)
+
+        repo.bulk_add_ingredients.assert_called_once_with(
+            user_id=user.id,
+            ingredient_names=["희귀템", "양파"],
+            purchase_date=TODAY,
+            exclude_non_ingredients=True,
+            expiry_names=None,
+        )
+        repo.get_existing_non_ingredients.assert_not_called()
+        assert [(r.id, r.is_auto_fillable) for r in result] == [(1, False), (2, True)]
+
+        log_buffer.add.assert_called_once_with(MissingIngredientLog, user_id=user.id, ingredient_name="희귀템")
+
+    async def test_add_ingredient_all_banned(self, mocks):
+        """[Service] 식재료 추가: 전부 제외 식재료면 InvalidIngredientException"""
+        user, repo = mocks
+        service = IngredientService(user, repo)
+
+        repo.bulk_add_ingredients.return_value = []
+
+        with pytest.raises(InvalidIngredientException):
+            await service.add_ingredient(AddIngredientRequest(ingredients=["봉투"], purchase_date=TODAY))
+
+    async def test_add_ingredient_filters_with_non_ingredient_index(self, mocks):
+        """[Service] 제외 식재료 인덱스가 로드되어 있으면 메모리에서 거르고 저장 문장의 확인은 생략"""
+        user, repo = mocks
+        service = IngredientService(user, repo)
+
+        index = NonIngredientIndex()
+        index.build(["봉투", "영수증"])
+        repo.bulk_add_ingredients.return_value = [self._create_mock_ingredient(1, "양파")]
+        repo.bulk_add_ingredients.return_value[0].is_auto_fillable = True
+
+        with patch("domains.ingredient.service.non_ingredient_index", index):
+            await service.add_ingredient(AddIngredientRequest(ingredients=["봉투", "양파"], purchase_date=TODAY))
+
+            with pytest.raises(InvalidIngredientException):
+                await service.add_ingredient(AddIngredientRequest(ingredients=["영수증"], purchase_date=TODAY))
+
+        repo.bulk_add_ingredients.assert_called_once_with(
+            user_id=user.id,
+            ingredient_names=["양파"],
+            purchase_date=TODAY,
+            exclude_non_ingredients=False,
+            expiry_names=None,
+        )
+        repo.get_existing_non_ingredients.assert_not_called()
+
+    async def test_add_ingredient_keeps_names_and_resolves_expiry_names(self, mocks):
+        """[Service] 이름은 입력한 그대로 저장하고, 자동 입력 여부는 매칭한 이름으로 확인"""
+        user, repo = mocks
+        service = IngredientService(user, repo)
+
+        cache = ExpiryCache()
+        cache._infos = {"두부": ExpiryInfo(ingredient_name="두부", expiry_day=5, storage_type="FRIDGE")}
+        cache.matcher = IngredientNameMatcher(["두부"])
+        cache._loaded = True
+        repo.bulk_add_ingredients.return_value = [self._create_mock_ingredient(1, "두부 2입")]
 
-        await service.add_ingredient(req)
+        with patch("domains.ingredient.service.expiry_cache", cache):
+            await service.add_ingredient(
+                AddIngredientRequest(ingredients=["두부 2입", "두부과자"], purchase_date=TODAY)
+            )
 
-        repo.add_ingredients.assert_called_once()
-        repo.add_missing_logs.assert_called_once()
+        kwargs = repo.bulk_add_ingredients.call_args.kwargs
+        assert kwargs["ingredient_names"] == ["두부 2입", "두부과자"]
+        assert kwargs["expiry_names"] == ["두부", "두부과자"]
 
-    async def test_add_ingredient_no_missing_log(self, mocks):
-        """[Service] 식재료 추가: DB에 정보가 있으면 MissingLog 저장 안 함"""
+    async def test_bulk_auto_fill_resolves_expiry_names(self, mocks):
+        """[Service] 일괄 자동 채우기: 캐시가 로드되어 있으면 대상 이름을 매칭해서 함께 넘김"""
         user, repo = mocks
         service = IngredientService(user, repo)
 
-        req = AddIngredientRequest(ingredients=["양파"], purchase_date=TODAY)
+        cache = ExpiryCache()
+        cache._infos = {"두부": ExpiryInfo(ingredient_name="두부", expiry_day=5, storage_type="FRIDGE")}
+        cache.matcher = IngredientNameMatcher(["두부"])
+        cache._loaded = True
+        repo.get_auto_fill_target_names.return_value = ["두부 2입", "두부", "희귀템"]
+        repo.bulk_auto_fill.return_value = []
 
-        mock_saved = self._create_mock_ingredient(1, "양파")
-        repo.add_ingredients.return_value = [mock_saved]
-        repo.get_expiry_infos.return_value = {"양파": MagicMock()}
+        with patch("domains.ingredient.service.expiry_cache", cache):
+            await service.bulk_auto_fill(BulkAutoFillRequest(all_unclassified=True))
+
+        assert repo.bulk_auto_fill.call_args.kwargs["expiry_names"] == {"두부 2입": "두부"}
+
+    async def test_non_ingredient_index_bloom_confirms_positives(self, mocks):
+        """[Service] Bloom filter 모드에서는 양성 판정된 이름만 DB로 확인"""
+        _, repo = mocks
+        index = NonIngredientIndex(bloom_threshold=1)
+        index.build(["봉투", "영수증"])
+        assert not index.is_exact
+
+        repo.get_existing_non_ingredients.return_value = ["봉투"]
+
+        assert await index.filter(["양파", "봉투", "양파"], repo) == ["양파", "양파"]
+        repo.get_existing_non_ingredients.assert_called_once_with(["봉투"])
+
+    async def test_bulk_auto_fill_skipped_ids(self, mocks):
+        """[Service] 일괄 자동 채우기: 수정되지 않은 요청 id는 skipped_ids로 반환"""
+        user, repo = mocks
+        service = IngredientService(user, repo)
+
+        repo.bulk_auto_fill.return_value = [self._create_mock_ingredient(1, "우유", TODAY, TODAY, "FRIDGE")]
+
+        res = await service.bulk_auto_fill(BulkAutoFillRequest(ingredient_ids=[1, 2, 2]))
+
+        repo.bulk_auto_fill.assert_called_once_with(
+            user_id=user.id, ingredient_ids=[1, 2, 2], only_unclassified=False, expiry_names=None
+        )
+        assert res.updated_count == 1
+        assert res.ingredients[0].is_auto_fillable is True
+        assert res.skipped_ids == [2]
+
+    async def test_get_expiring_soon_from_index(self, mocks):
+        """[Service] 유통기한 임박 조회: Redis 인덱스가 있으면 DB를 조회하지 않음"""
+        user, repo = mocks
+        service = IngredientService(user, repo, redis=AsyncMock())
+        service.expiring_index = AsyncMock()
+        service.expiring_index.query.return_value = [self._create_mock_ingredient(1, "우유", TODAY, TODAY, "FRIDGE")]
+        repo.get_expiry_infos.return_value = {}
+
+        res = await service.get_expiring_soon(days=3)
+
+        service.expiring_index.query.assert_called_once_with(user.id, TODAY + timedelta(days=3), TODAY, 100)
+        repo.get_expiring_ingredients.assert_not_called()
+        assert [r.id for r in res] == [1]
+
+    async def test_get_expiring_soon_builds_cold_index(self, mocks):
+        """[Service] 유통기한 임박 조회: 인덱스가 없으면 DB 결과로 만들고 그 결과에서 응답"""
+        user, repo = mocks
+        service = IngredientService(user, repo, redis=AsyncMock())
+        service.expiring_index = AsyncMock()
+        service.expiring_index.query.return_value = None
+        dated = [
+            self._create_mock_ingredient(1, "우유", TODAY, TODAY - timedelta(days=1)),
+            self._create_mock_ingredient(2, "양파", TODAY, TODAY + timedelta(days=2)),
+            self._create_mock_ingredient(3, "쌀", TODAY, TODAY + timedelta(days=30)),
+        ]
+        repo.get_expiring_ingredients.return_value = dated
+        repo.get_expiry_infos.return_value = {}
+
+        res = await service.get_expiring_soon(days=3)
+
+        repo.get_expiring_ingredients.assert_called_once_with(user.id, until=date.max)
+        service.expiring_index.build.assert_called_once_with(
+            user.id, dated, service.expiring_index.generation.return_value
+        )
+        assert [r.id for r in res] == [2]
+
+    async def test_get_expiring_soon_redis_error_falls_back(self, mocks):
+        """[Service] 유통기한 임박 조회: Redis 오류 시 DB 인덱스 조회로 대체"""
+        user, repo = mocks
+        service = IngredientService(user, repo, redis=AsyncMock())
+        service.expiring_index = AsyncMock()
+        service.expiring_index.query.side_effect = ConnectionError("redis down")
+        repo.get_expiring_ingredients.return_value = []
+
+        assert await service.get_expiring_soon(days=7, include_expired=True) == []
+        repo.get_expiring_ingredients.assert_called_once_with(
+            user.id, until=TODAY + timedelta(days=7), since=None, limit=100
+        )
+
+    async def test_mutations_sync_expiring_index(self, mocks):
+        """[Service] 수정/삭제 시 유통기한 인덱스에 반영"""
+        user, repo = mocks
+        service = IngredientService(user, repo, redis=AsyncMock())
+        service.expiring_index = AsyncMock()
 
-        await service.add_ingredient(req)
+        updated = self._create_mock_ingredient(1, "우유", TODAY, TODAY, "FRIDGE")
+        repo.update_ingredient.return_value = updated
+        repo.get_expiry_infos.return_value = {}
+        await service.update_ingredient(1, UpdateIngredientRequest(expiration_date=TODAY))
+        service.expiring_index.update.assert_called_once_with(user.id, [updated])
 
-        repo.add_missing_logs.assert_not_called()
+        repo.delete_ingredient.return_value = True
+        await service.delete_ingredient(1)
+        service.expiring_index.remove.assert_called_once_with(user.id, [1])
 
-    async def test_set_detail_deviation_log(self, mocks):
-        """[Service] 상세 설정: 날짜 편차가 2일 이상이거나 보관타입이 다르면 로그 저장"""
+    async def test_set_detail_deviation_log(self, mocks, log_buffer):
+        """[Service] 상세 설정: 자동 입력 가능한 식재료면 입력한 유통기한을 로그로 저장 (편차 포함)"""
         user, repo = mocks
         service = IngredientService(user, repo)
 
@@ -77,7 +255,7 @@ class TestIngredientService:
         mock_ing = self._create_mock_ingredient(ing_id, "양파", TODAY)
         repo.get_ingredient.return_value = mock_ing
 
-        mock_info = MagicMock(expiry_day=7, storage_type="ROOM")
+        mock_info = MagicMock(ingredient_name="양파", expiry_day=7, storage_type="ROOM")
         repo.get_expiry_infos.return_value = {"양파": mock_info}
 
         mock_updated = self._create_mock_ingredient(ing_id, "양파", TODAY, req.expiration_date, "FREEZER")
@@ -85,9 +263,39 @@ class TestIngredientService:
 
         res = await service.set_expiration_and_storage(ing_id, req)
 
-        repo.add_deviation_log.assert_called_once()
+        log_buffer.add.assert_called_once_with(
+            ExpiryDeviationLog,
+            user_id=user.id,
+            ingredient_name="양파",
+            deviation_day=3,
+            storage_type="FREEZER",
+            observed_day=10,
+        )
         assert res.is_auto_fillable is True
 
+    async def test_set_detail_logs_default_agreement(self, mocks, log_buffer):
+        """[Service] 상세 설정: 기본값과 같게 입력해도 로그 저장 (학습이 편차 쪽으로 치우치지 않도록)"""
+        user, repo = mocks
+        service = IngredientService(user, repo)
+
+        req = SetIngredientRequest(expiration_date=TODAY + timedelta(days=7), storage_type=StorageType.ROOM)
+        repo.get_ingredient.return_value = self._create_mock_ingredient(1, "양파", TODAY)
+        repo.get_expiry_infos.return_value = {
+            "양파": MagicMock(ingredient_name="양파", expiry_day=7, storage_type="ROOM")
+        }
+        repo.set_ingredient.return_value = self._create_mock_ingredient(1, "양파", TODAY, req.expiration_date, "ROOM")
+
+        await service.set_expiration_and_storage(1, req)
+
+        log_buffer.add.assert_called_once_with(
+            ExpiryDeviationLog,
+            user_id=user.id,
+            ingredient_name="양파",
+            deviation_day=0,
+            storage_type="ROOM",
+            observed_day=7,
+        )
+
     async def test_get_ingredients_flag_check(self, mocks):
         """[Service] 목록 조회: is_auto_fillable 플래그가 올바르게 매핑되는지"""
         user, repo = mocks
@@ -108,6 +316,52 @@ class TestIngredientService:
         assert res[1].ingredient_name == "고구마"
         assert res[1].is_auto_fillable is False
 
+    async def test_get_ingredients_page_next_cursor(self, mocks):
+        """[Service] 페이지 조회: limit+1개를 조회해서 다음 페이지가 있으면 커서 반환"""
+        user, repo = mocks
+        service = IngredientService(user, repo)
+
+        rows = [
+            self._create_mock_ingredient(1, "감자", e_date=TODAY),
+            self._create_mock_ingredient(2, "고구마", e_date=TODAY + timedelta(days=1)),
+            self._create_mock_ingredient(3, "양파"),
+        ]
+        repo.get_ingredients_page.return_value = rows
+        repo.get_expiry_infos.return_value = {}
+
+        page = await service.get_ingredients_page(limit=2)
+
+        assert [item.id for item in page.items] == [1, 2]
+        assert page.total is None
+        assert repo.get_ingredients_page.call_args.kwargs["limit"] == 3
+
+        # 다음 페이지 요청 시 커서가 (마지막 행의 유통기한, id)로 풀리는지 확인
+        repo.get_ingredients_page.return_value = rows[2:]
+        repo.count_ingredients.return_value = 3
+
+        next_page = await service.get_ingredients_page(limit=2, cursor=page.next_cursor, include_total=True)
+
+        assert repo.get_ingredients_page.call_args.kwargs["after"] == (TODAY + timedelta(days=1), 2)
+        assert next_page.next_cursor is None
+        assert next_page.total == 3
+
+    async def test_get_ingredients_page_invalid_cursor(self, mocks):
+        """[Service] 페이지 조회: 잘못된 커서나 정렬 기준이 바뀐 커서는 400"""
+        user, repo = mocks
+        service = IngredientService(user, repo)
+
+        repo.get_ingredients_page.return_value = [
+            self._create_mock_ingredient(i, f"재료{i}", e_date=TODAY) for i in range(1, 3)
+        ]
+        repo.get_expiry_infos.return_value = {}
+        page = await service.get_ingredients_page(limit=1)
+
+        with pytest.raises(InvalidCursorException):
+            await service.get_ingredients_page(limit=1, cursor="not-a-cursor")
+
+        with pytest.raises(InvalidCursorException):
+            await service.get_ingredients_page(limit=1, cursor=page.next_cursor, order_by=IngredientOrder.PURCHASE_DATE)
+
     async def test_get_ingredient_single_flag_check(self, mocks):
         """[Service] 단일 조회: is_auto_fillable 플래그 확인"""
         user, repo = mocks
@@ -201,3 +455,44 @@ class TestIngredientService:
         repo.is_my_compartment.return_value = False
         with pytest.raises(HaveNotPermissionException):
             await service.move_ingredients(999, MagicMock())
+
+    async def test_get_ingredients_uses_expiry_cache(self, mocks):
+        """[Service] 유통기한 캐시가 로드되어 있으면 DB 조회 없이 캐시 사용"""
+        user, repo = mocks
+        service = IngredientService(user, repo)
+
+        repo.get_ingredients.return_value = [self._create_mock_ingredient(1, "감자")]
+
+        cache = ExpiryCache()
+        cache._infos = {"감자": ExpiryInfo(ingredient_name="감자", expiry_day=14, storage_type="ROOM")}
+        cache._loaded = True
+
+        with patch("domains.ingredient.service.expiry_cache", cache):
+            res = await service.get_ingredients()
+
+        repo.get_expiry_infos.assert_not_called()
+        assert res[0].is_auto_fillable is True
+
+    async def test_get_ingredients_cold_cache_matches_exact_names_only(self, mocks):
+        """[Service] 캐시가 로드되기 전에는 입력한 이름 그대로 DB 조회 (별칭 / 유사 매칭 없음), 로드 후에는 매칭"""
+        user, repo = mocks
+        service = IngredientService(user, repo)
+
+        repo.get_ingredients.return_value = [self._create_mock_ingredient(1, "두부 2입")]
+        repo.get_expiry_infos.return_value = {}
+
+        with patch("domains.ingredient.service.expiry_cache", ExpiryCache()):
+            res = await service.get_ingredients()
+
+        repo.get_expiry_infos.assert_called_once_with(["두부 2입"])
+        assert res[0].is_auto_fillable is False
+
+        cache = ExpiryCache()
+        cache._infos = {"두부": ExpiryInfo(ingredient_name="두부", expiry_day=5, storage_type="FRIDGE")}
+        cache.matcher = IngredientNameMatcher(["두부"])
+        cache._loaded = True
+
+        with patch("domains.ingredient.service.expiry_cache", cache):
+            res = await service.get_ingredients()
+
+        assert res[0].is_auto_fillable is True
@@ -41,3 +41,32 @@ async def test_get_recipes_ordering(db_session, test_user):
     assert len(results) == 2
     assert results[0].food_name == "볶음밥"  # 나중에 만든 게 먼저 나와야 함 (DESC)
     assert results[1].food_name == "라면"
+
+
+@pytest.mark.asyncio
+async def test_get_image_queries(db_session, test_user):
+    """[Repository] 이미지 검색어 목록: food_en 우선 (없으면 '요리명 food'), 검색어별 한 줄"""
+    repo = RecipeRepository(db_session)
+    await repo.save_recipe(test_user.id, "김치찌개", {"food_en": "Kimchi Stew", "image_url": "https://img/kimchi.jpg"})
+    await repo.save_recipe(test_user.id, "김치찌개", {"food_en": "Kimchi Stew"})
+    await repo.save_recipe(test_user.id, "간장계란밥", {"food": "간장계란밥"})
+
+    rows = await repo.get_image_queries()
+
+    assert sorted(rows) == [("Kimchi Stew", "https://img/kimchi.jpg"), ("간장계란밥 food", None)]
+
+
+@pytest.mark.asyncio
+async def test_get_image_queries_prefers_latest_usable_url(db_session, test_user):
+    """[Repository] 이미지 검색어 목록: 검색어별로 가장 최근 URL, 제외할 기본/대체 이미지는 건너뜀"""
+    repo = RecipeRepository(db_session)
+    await repo.save_recipe(test_user.id, "김치찌개", {"food_en": "Kimchi Stew", "image_url": "https://img/old.jpg"})
+    await repo.save_recipe(test_user.id, "김치찌개", {"food_en": "Kimchi Stew", "image_url": "https://img/new.jpg"})
+    await repo.save_recipe(
+        test_user.id, "김치찌개", {"food_en": "Kimchi Stew", "image_url": "https://default/food.jpg"}
+    )
+    await repo.save_recipe(test_user.id, "라면", {"food_en": "Ramen", "image_url": "https://placeholder/600x400"})
+
+    rows = await repo.get_image_queries(exclude_url_prefixes=("https://default/food.jpg", "https://placeholder"))
+
+    assert sorted(rows) == [("Kimchi Stew", "https://img/new.jpg"), ("Ramen", None)]
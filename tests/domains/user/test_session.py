@@ -0,0 +1,75 @@
+import pytest
+import pytest_asyncio
+from fakeredis import FakeAsyncRedis
+
+from domains.user.session import SessionStore
+
+
+@pytest_asyncio.fixture
+async def redis():
+    # Lua 스크립트까지 실제로 실행 (fakeredis[lua])
+    client = FakeAsyncRedis(decode_responses=True)
+    yield client
+    await client.flushall()
+    await client.aclose()
+
+
+@pytest.mark.asyncio
+class TestSessionStore:
+    async def test_issue_and_get_user_id(self, redis):
+        store = SessionStore(redis)
+
+        token = await store.issue("user-1")
+
+        assert await store.get_user_id(token) == "user-1"
+        assert await redis.zrange("SESSIONS:user-1", 0, -1) == [token]
+        assert 0 < await redis.ttl(f"RT:{token}") <= store.ttl
+
+    async def test_issue_evicts_oldest_over_cap(self, redis):
+        """[세션] 최대 세션 수를 넘으면 가장 오래된 세션부터 폐기"""
+        store = SessionStore(redis, max_sessions=2)
+
+        first = await store.issue("user-1")
+        second = await store.issue("user-1")
+        third = await store.issue("user-1")
+
+        assert await store.get_user_id(first) is None
+        assert await store.get_user_id(second) == "user-1"
+        assert await store.get_user_id(third) == "user-1"
+        assert await redis.zrange("SESSIONS:user-1", 0, -1) == [second, third]
+
+    async def test_revoke(self, redis):
+        store = SessionStore(redis)
+        kept = await store.issue("user-1")
+        revoked = await store.issue("user-1")
+
+        await store.revoke("user-1", revoked)
+
+        assert await store.get_user_id(revoked) is None
+        assert await redis.zrange("SESSIONS:user-1", 0, -1) == [kept]
+
+    async def test_revoke_all(self, redis):
+        """[세션] 유저의 모든 세션만 폐기하고 다른 유저 세션은 유지"""
+        store = SessionStore(redis)
+        tokens = [await store.issue("user-1") for _ in range(3)]
+        other = await store.issue("user-2")
+
+        assert await store.revoke_all("user-1") == 3
+
+        for token in tokens:
+            assert await store.get_user_id(token) is None
+        assert not await redis.exists("SESSIONS:user-1")
+        assert await store.get_user_id(other) == "user-2"
+        assert await store.revoke_all("user-1") == 0
+
+    async def test_cleanup_removes_expired_entries(self, redis):
+        """[세션] 만료 시각이 지난 목록 항목만 제거"""
+        store = SessionStore(redis, ttl=60)
+        live = await store.issue("user-1")
+        await redis.zadd("SESSIONS:user-1", {"expired-1": 1})
+        await redis.zadd("SESSIONS:user-2", {"expired-2": 1, "expired-3": 2})
+
+        assert await store.cleanup(batch_size=1) == 3
+
+        assert await redis.zrange("SESSIONS:user-1", 0, -1) == [live]
+        assert not await redis.exists("SESSIONS:user-2")
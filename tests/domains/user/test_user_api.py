@@ -363,3 +363,42 @@ async def test_change_nickname_flow(client):
     # 3. 변경 확인 (내 정보 조회)
     info_res = await client.get("/api/v1/users/info", headers={"Authorization": f"Bearer {access_token}"})
     assert info_res.json()["nickname"] == new_nick
+
+
+@pytest.mark.asyncio
+async def test_check_availability(client):
+    """[API] 닉네임/이메일 사용 가능 여부 확인 (Bloom filter가 없으면 DB로 확인)"""
+    await client.post(
+        "/api/v1/users/sign-up",
+        json={
+            "email": "taken@test.com",
+            "password": PASSWORD,
+            "checked_password": PASSWORD,
+            "nickname": "taken_nick",
+        },
+    )
+
+    res = await client.get("/api/v1/users/availability/nickname", params={"nickname": "taken_nick"})
+    assert res.status_code == 200
+    assert res.json() == {"value": "taken_nick", "available": False}
+
+    res = await client.get("/api/v1/users/availability/nickname", params={"nickname": "free_nick"})
+    assert res.json()["available"] is True
+
+    res = await client.get("/api/v1/users/availability/email", params={"email": "taken@test.com"})
+    assert res.json()["available"] is False
+
+    res = await client.get("/api/v1/users/availability/nickname", params={"nickname": "x"})
+    assert res.status_code == 422
+
+
+@pytest.mark.asyncio
+async def test_check_email_availability_rate_limited(client, mock_redis):
+    """[API] 이메일 확인은 IP 기준 한도를 넘으면 429 (계정 수집 방지)"""
+    # [허용 여부, 초과한 규칙 번호, 재시도 ms]
+    mock_redis.evalsha.return_value = [0, 1, 30000]
+
+    res = await client.get("/api/v1/users/availability/email", params={"email": "a@test.com"})
+
+    assert res.status_code == 429
+    assert mock_redis.evalsha.call_args.args[2].startswith("limit:availability_email:")
@@ -2,6 +2,7 @@ import pytest
 from datetime import date
 
 from core.exception.exceptions import DatabaseException
+from domains.user.exceptions import DuplicateEmailException, DuplicateNicknameException, InvalidCredentialsException
 from domains.user.models import User
 from domains.user.repository import UserRepository
 
@@ -147,3 +148,78 @@ async def test_update_user_fail_integrity_error(db_session):
     # Then: DatabaseException 발생 확인
     with pytest.raises(DatabaseException):
         await repo.update_user(user_b_saved)
+
+
+@pytest.mark.asyncio
+async def test_find_duplicate_fields(db_session):
+    """[Repository] 이메일/닉네임/전화번호 중복을 조회 한 번으로 확인"""
+    repo = UserRepository(db_session)
+    await repo.save_user(User(email="dup_a@test.com", nickname="dup_a", phone_hash="dup_phone"))
+    await repo.save_user(User(email="dup_b@test.com", nickname="dup_b"))
+
+    assert await repo.find_duplicate_fields("new@test.com", "new_nick", "new_phone") == set()
+    assert await repo.find_duplicate_fields("dup_a@test.com", "dup_b", None) == {"email", "nickname"}
+    assert await repo.find_duplicate_fields("new@test.com", "new_nick", "dup_phone") == {"phone_hash"}
+
+
+@pytest.mark.asyncio
+async def test_save_user_maps_unique_violation(db_session):
+    """[Repository] 중복 확인 이후 동시에 저장된 값과 겹치면 중복 예외로 변환"""
+    repo = UserRepository(db_session)
+    await repo.save_user(User(email="race@test.com", nickname="race_nick"))
+
+    with pytest.raises(DuplicateNicknameException):
+        await repo.save_user(User(email="race2@test.com", nickname="race_nick"))
+
+    with pytest.raises(DuplicateEmailException):
+        await repo.save_user(User(email="race@test.com", nickname="race_nick2"))
+
+
+@pytest.mark.asyncio
+async def test_scan_user_identities(db_session):
+    """[Repository] id 순 keyset 스캔 (Bloom filter 재생성용)"""
+    repo = UserRepository(db_session)
+    for i in range(3):
+        await repo.save_user(User(email=f"scan{i}@test.com", nickname=f"scan{i}"))
+
+    first = await repo.scan_user_identities(None, limit=2)
+    rest = await repo.scan_user_identities(first[-1].id, limit=2)
+
+    assert sorted(row.nickname for row in first + rest) == ["scan0", "scan1", "scan2"]
+    assert await repo.is_nickname_taken("scan1") is True
+    assert await repo.is_email_taken("nobody@test.com") is False
+
+
+@pytest.mark.asyncio
+async def test_upsert_social_user(db_session):
+    """[Repository] (provider, social_id) upsert - 처음엔 가입, 다시 로그인하면 기존 유저 그대로 반환"""
+    repo = UserRepository(db_session)
+
+    user, created = await repo.upsert_social_user("kakao", "1234", nickname="k_1234", email="k@test.com", name="카카오")
+    again, created_again = await repo.upsert_social_user("kakao", "1234", nickname="k_1234", name="바뀐이름")
+
+    assert created is True
+    assert created_again is False
+    assert again.id == user.id
+    assert again.email == "k@test.com"
+    assert again.name == "카카오"
+
+
+@pytest.mark.asyncio
+async def test_upsert_social_user_duplicate_email(db_session):
+    """[Repository] 다른 계정과 이메일이 겹치면 중복 예외"""
+    repo = UserRepository(db_session)
+    await repo.save_user(User(email="dup@test.com", nickname="local_user"))
+
+    with pytest.raises(DuplicateEmailException):
+        await repo.upsert_social_user("kakao", "5678", nickname="k_5678", email="dup@test.com")
+
+
+@pytest.mark.asyncio
+async def test_upsert_social_user_other_provider(db_session):
+    """[Repository] 같은 social_id를 다른 제공자가 쓰고 있으면 그 유저를 반환하지 않음"""
+    repo = UserRepository(db_session)
+    await repo.upsert_social_user("naver", "1234", nickname="n_1234")
+
+    with pytest.raises(InvalidCredentialsException):
+        await repo.upsert_social_user("kakao", "1234", nickname="k_1234")
@@ -1,7 +1,11 @@
 import pytest
 from datetime import date
+import json
 from unittest.mock import AsyncMock, patch
-from domains.user.service import UserService
+from domains.user.cache import UserSnapshotCache
+from domains.user.oauth import OAUTH_PROVIDERS, KakaoOAuthProvider
+from domains.user.service import UserService, AvailabilityService, SocialAuthService
+from domains.user.session import ISSUE_SCRIPT_SHA, REVOKE_SCRIPT_SHA, REVOKE_ALL_SCRIPT_SHA
 from domains.user.schemas import (
     SignUpRequest,
     LogInRequest,
@@ -19,6 +23,7 @@ from domains.user.exceptions import (
     TokenExpiredException,
     TokenForbiddenException,
     DuplicateNicknameException,
+    DuplicatePhoneNumException,
     UserNotFoundException,
     PasswordUnchangedException,
     IncorrectPasswordException,
@@ -44,9 +49,7 @@ class TestUserService:
         return UserService(mock_repo, mock_redis)
 
     async def test_sign_up_success(self, service, mock_repo):
-        mock_repo.get_user_by_email.return_value = None
-        mock_repo.get_user_by_nickname.return_value = None
-        mock_repo.get_user_by_phone_num.return_value = None
+        mock_repo.find_duplicate_fields.return_value = set()
 
         request = SignUpRequest(
             email="new@test.com",
@@ -59,14 +62,21 @@ class TestUserService:
 
         mock_repo.save_user.side_effect = lambda u: u
 
-        with patch("core.security.hash_password", return_value="hashed_pw"):
+        with (
+            patch("core.security.hash_password", return_value="hashed_pw"),
+            patch("core.security.make_phone_hash", return_value="phone_hash"),
+        ):
             result = await service.sign_up(request)
 
         assert result.email == "new@test.com"
+        assert result.password == "hashed_pw"
+        # 세 가지 중복 확인은 조회 한 번으로
+        mock_repo.find_duplicate_fields.assert_called_once_with("new@test.com", "newuser", "phone_hash")
+        mock_repo.get_user_by_email.assert_not_called()
         mock_repo.save_user.assert_called_once()
 
     async def test_sign_up_duplicate_email(self, service, mock_repo):
-        mock_repo.get_user_by_email.return_value = User(email="exist@test.com")
+        mock_repo.find_duplicate_fields.return_value = {"email", "nickname"}
         request = SignUpRequest(
             email="exist@test.com",
             password="password123",
@@ -75,10 +85,38 @@ class TestUserService:
         )
         with pytest.raises(DuplicateEmailException):
             await service.sign_up(request)
+        mock_repo.save_user.assert_not_called()
+
+    async def test_sign_up_duplicate_skips_hash_when_pool_busy(self, service, mock_repo):
+        """[가입] 해싱 워커가 바쁘면 중복 확인을 통과한 뒤에만 해싱"""
+        mock_repo.find_duplicate_fields.return_value = {"email"}
+        request = SignUpRequest(
+            email="exist@test.com",
+            password="password123",
+            checked_password="password123",
+            nickname="nick",
+        )
+        with (
+            patch("domains.user.service.password_hash_pool.has_capacity", return_value=False),
+            patch("core.security.hash_password_async", new_callable=AsyncMock) as hash_async,
+        ):
+            with pytest.raises(DuplicateEmailException):
+                await service.sign_up(request)
+        hash_async.assert_not_called()
+
+    async def test_sign_up_duplicate_phone(self, service, mock_repo):
+        mock_repo.find_duplicate_fields.return_value = {"phone_hash"}
+        request = SignUpRequest(
+            email="new@test.com",
+            password="password123",
+            checked_password="password123",
+            nickname="nick",
+            phone_num="01012345678",
+        )
+        with pytest.raises(DuplicatePhoneNumException):
+            await service.sign_up(request)
 
     async def test_sign_up_password_mismatch(self, service, mock_repo):
-        mock_repo.get_user_by_email.return_value = None
-        mock_repo.get_user_by_nickname.return_value = None
         request = SignUpRequest(
             email="test@test.com",
             password="password123",
@@ -87,6 +125,7 @@ class TestUserService:
         )
         with pytest.raises(InvalidCheckedPasswordException):
             await service.sign_up(request)
+        mock_repo.find_duplicate_fields.assert_not_called()
 
     async def test_log_in_success(self, service, mock_repo, mock_redis):
         user_id = "user-uuid-123"
@@ -103,10 +142,11 @@ class TestUserService:
 
         assert response.access_token == "fake_access_token"
         assert response.refresh_token == "fake_refresh_token"
-        mock_redis.set.assert_called_once()
-        call_args = mock_redis.set.call_args[1]
-        assert call_args["name"] == "RT:fake_refresh_token"
-        assert call_args["value"] == user_id
+        # 토큰 저장 + 유저별 세션 목록 갱신을 Lua 한 번으로 처리
+        mock_redis.evalsha.assert_called_once()
+        args = mock_redis.evalsha.call_args[0]
+        assert args[0] == ISSUE_SCRIPT_SHA
+        assert args[2:5] == ("RT:fake_refresh_token", f"SESSIONS:{user_id}", user_id)
 
     async def test_log_in_fail_wrong_password(self, service, mock_repo):
         mock_user = User(email="login@test.com", password="hashed_pw")
@@ -144,7 +184,9 @@ class TestUserService:
         await service.log_out(request, user_id)
 
         mock_redis.get.assert_called_once_with("RT:valid_token")
-        mock_redis.delete.assert_called_once_with("RT:valid_token")
+        mock_redis.evalsha.assert_called_once_with(
+            REVOKE_SCRIPT_SHA, 2, "RT:valid_token", f"SESSIONS:{user_id}", "valid_token"
+        )
 
     async def test_log_out_fail_invalid_token(self, service, mock_redis):
         mock_redis.get.return_value = None
@@ -182,7 +224,7 @@ class TestUserService:
 
     # --- [비밀번호 변경 테스트 (수정됨: 8자 이상)] ---
 
-    async def test_change_password_success(self, service, mock_repo):
+    async def test_change_password_success(self, service, mock_repo, mock_redis):
         """[Service] 비밀번호 변경 성공"""
         user_id = "uid"
         mock_user = User(id=user_id, password="hashed_old_pw")
@@ -203,6 +245,9 @@ class TestUserService:
             mock_repo.update_user.assert_called_once()
             assert mock_user.password == "hashed_new_pw"
 
+        # 모든 세션 폐기 (Redis 왕복 1회)
+        mock_redis.evalsha.assert_called_once_with(REVOKE_ALL_SCRIPT_SHA, 1, "SESSIONS:uid", "RT:")
+
     async def test_change_password_fail_wrong_current(self, service, mock_repo):
         """[Service] 현재 비밀번호 틀림 -> 예외"""
         mock_user = User(password="hashed_old")
@@ -235,7 +280,7 @@ class TestUserService:
 
     # --- [비밀번호 재설정 테스트 (수정됨: 8자 이상)] ---
 
-    async def test_reset_password_success(self, service, mock_repo):
+    async def test_reset_password_success(self, service, mock_repo, mock_redis):
         """[Service] 비밀번호 재설정 성공"""
         mock_user = User(
             email="reset@test.com",
@@ -264,6 +309,8 @@ class TestUserService:
             mock_repo.update_user.assert_called_once()
             assert mock_user.password == "new_hashed_pw"
 
+        assert mock_redis.evalsha.call_args[0][:3] == (REVOKE_ALL_SCRIPT_SHA, 1, f"SESSIONS:{mock_user.id}")
+
     async def test_reset_password_fail_info_mismatch(self, service, mock_repo):
         """[Service] 입력 정보 불일치 -> 예외"""
         mock_user = User(email="test@test.com", name="김철수", phone_hash="hash")
@@ -315,3 +362,170 @@ class TestUserService:
         with pytest.raises(DuplicateNicknameException) as exc:
             await service.change_nickname(request, "uid")
         assert exc.value.detail == "이미 사용 중인 닉네임입니다."
+
+    # --- [인증 유저 스냅샷 캐시] ---
+
+    async def test_get_user_by_token_cache_hit(self, service, mock_repo, mock_redis):
+        """[Service] Redis 스냅샷이 있으면 DB를 조회하지 않음"""
+        user_id = "0192f0c2-0000-7000-8000-000000000001"
+        mock_redis.get.return_value = json.dumps(
+            {"id": user_id, "email": "a@test.com", "nickname": "nick", "name": None, "provider": "local"}
+        )
+
+        with (
+            patch("domains.user.service.user_snapshot_cache", UserSnapshotCache()),
+            patch("core.security.decode_jwt", return_value=user_id),
+        ):
+            user = await service.get_user_by_token("token", req=None)
+
+        mock_repo.get_user_by_id.assert_not_called()
+        assert str(user.id) == user_id
+        assert user.nickname == "nick"
+
+    async def test_get_user_by_token_cache_miss(self, service, mock_repo, mock_redis):
+        """[Service] 스냅샷이 없으면 DB 조회 후 Redis에 저장"""
+        user_id = "0192f0c2-0000-7000-8000-000000000001"
+        mock_redis.get.return_value = None
+        mock_repo.get_user_by_id.return_value = User(id=user_id, email="a@test.com", nickname="nick")
+
+        with (
+            patch("domains.user.service.user_snapshot_cache", UserSnapshotCache()),
+            patch("core.security.decode_jwt", return_value=user_id),
+        ):
+            user = await service.get_user_by_token("token", req=None)
+
+        mock_repo.get_user_by_id.assert_called_once_with(user_id)
+        assert user.email == "a@test.com"
+        assert mock_redis.set.call_args[0][0] == f"USER:{user_id}"
+
+    async def test_change_nickname_invalidates_snapshot(self, service, mock_repo, mock_redis):
+        """[Service] 닉네임 변경 시 스냅샷 무효화"""
+        mock_repo.get_user_by_id.return_value = User(id="uid", nickname="old_nick")
+        mock_repo.get_user_by_nickname.return_value = None
+
+        await service.change_nickname(ChangeNicknameRequest(nickname="new_nick"), "uid")
+
+        mock_redis.delete.assert_called_once_with("USER:uid")
+
+
+@pytest.mark.asyncio
+class TestAvailabilityService:
+    @pytest.fixture
+    def mock_repo(self):
+        return AsyncMock()
+
+    @pytest.fixture
+    def service(self, mock_repo):
+        service = AvailabilityService(mock_repo, AsyncMock())
+        service.index = AsyncMock()
+        return service
+
+    async def test_definitely_free_skips_db(self, service, mock_repo):
+        """[Availability] Bloom filter에서 확실히 없으면 DB 조회 없이 사용 가능"""
+        service.index.might_exist.return_value = False
+
+        res = await service.check_nickname("새닉네임")
+
+        assert res.available is True
+        service.index.might_exist.assert_called_once_with("nickname", "새닉네임")
+        mock_repo.is_nickname_taken.assert_not_called()
+
+    async def test_maybe_taken_confirmed_by_db(self, service, mock_repo):
+        """[Availability] 있을 수도 있으면 DB로 확인 (false positive면 사용 가능)"""
+        service.index.might_exist.return_value = True
+        mock_repo.is_email_taken.return_value = False
+
+        res = await service.check_email("a@test.com")
+
+        assert res.available is True
+        mock_repo.is_email_taken.assert_called_once_with("a@test.com")
+
+    @pytest.mark.parametrize("index_result", [None, ConnectionError("redis down")])
+    async def test_falls_back_to_db(self, service, mock_repo, index_result):
+        """[Availability] filter가 없거나 Redis 오류면 DB로 확인"""
+        if isinstance(index_result, Exception):
+            service.index.might_exist.side_effect = index_result
+        else:
+            service.index.might_exist.return_value = index_result
+        mock_repo.is_nickname_taken.return_value = True
+
+        res = await service.check_nickname("도먹")
+
+        assert res.available is False
+
+
+@pytest.mark.asyncio
+class TestSocialAuthService:
+    @pytest.fixture
+    def mock_repo(self):
+        return AsyncMock()
+
+    @pytest.fixture
+    def mock_redis(self):
+        redis = AsyncMock()
+        redis.getdel.return_value = "kakao"
+        return redis
+
+    @pytest.fixture
+    def provider(self):
+        provider = KakaoOAuthProvider()
+        provider.exchange_code = AsyncMock(return_value="kakao-access-token")
+        provider.fetch_user_info = AsyncMock(
+            return_value={"id": 1234, "kakao_account": {"email": "k@test.com", "profile": {"nickname": "카카오"}}}
+        )
+        return provider
+
+    @pytest.fixture
+    def service(self, mock_repo, mock_redis, provider):
+        service = SocialAuthService(mock_repo, mock_redis)
+        service.availability = AsyncMock()
+        with patch.dict(OAUTH_PROVIDERS, {"kakao": provider}):
+            yield service
+
+    async def test_get_auth_url_saves_state(self, service, mock_redis):
+        """[Social] 로그인 URL 발급 시 state에 제공자 이름 저장"""
+        url = await service.get_kakao_auth_url()
+
+        key, value = mock_redis.set.call_args.args
+        assert key.startswith("OAUTH_STATE:")
+        assert value == "kakao"
+        assert f"state={key.removeprefix('OAUTH_STATE:')}" in url
+
+    async def test_login_new_user(self, service, mock_repo, mock_redis, provider):
+        """[Social] 처음 로그인하면 upsert로 가입 + 닉네임/이메일 사용 중 반영"""
+        user = User(id="user-uuid", nickname="k_1234", email="k@test.com")
+        mock_repo.upsert_social_user.return_value = (user, True)
+
+        res = await service.kakao_login("code", "state")
+
+        mock_redis.getdel.assert_called_once_with("OAUTH_STATE:state")
+        mock_repo.upsert_social_user.assert_called_once_with(
+            provider="kakao", social_id="1234", nickname="k_1234", email="k@test.com", name="카카오"
+        )
+        service.availability.mark_taken.assert_called_once_with(nickname="k_1234", email="k@test.com")
+        mock_redis.evalsha.assert_called_once()
+        assert mock_redis.evalsha.call_args.args[0] == ISSUE_SCRIPT_SHA
+        assert res.refresh_token
+
+    async def test_login_existing_user(self, service, mock_repo):
+        """[Social] 기존 유저는 사용 중 반영 없이 토큰만 발급"""
+        mock_repo.upsert_social_user.return_value = (User(id="user-uuid", nickname="k_1234"), False)
+
+        await service.kakao_login("code", "state")
+
+        service.availability.mark_taken.assert_not_called()
+
+    @pytest.mark.parametrize("saved_state", [None, "naver"])
+    async def test_login_invalid_state(self, service, mock_redis, provider, saved_state):
+        """[Social] state가 없거나 다른 제공자의 state면 실패 (카카오 API 호출 없음)"""
+        mock_redis.getdel.return_value = saved_state
+
+        with pytest.raises(InvalidCredentialsException):
+            await service.kakao_login("code", "state")
+
+        provider.exchange_code.assert_not_called()
+
+    async def test_unknown_provider(self, service):
+        """[Social] 등록되지 않은 제공자"""
+        with pytest.raises(InvalidCredentialsException):
+            await service.get_auth_url("unknown")